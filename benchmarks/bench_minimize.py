@@ -0,0 +1,130 @@
+"""
+Benchmarks DFA.minimize against the previous implementation of
+Hopcroft's algorithm, which copied the partition for every
+splitter and symbol and looked up the block of every target
+state with a linear scan, on random DFAs.
+
+Usage:
+    python benchmarks/bench_minimize.py [--sizes 100 1000 ...] [--alphabet 2]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from collections import deque
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from inferrer import automaton
+
+
+def random_dfa(n: int, alphabet_size: int, seed: int) -> automaton.DFA:
+    """
+    Builds a random complete dfa with n states, where each
+    state accepts with probability 1/2.
+    """
+    rng = random.Random(seed)
+    alphabet = {chr(ord('a') + i) for i in range(alphabet_size)}
+    states = [automaton.State(str(i)) for i in range(n)]
+
+    dfa = automaton.DFA(alphabet, states[0])
+    for q in states:
+        for a in sorted(alphabet):
+            dfa.add_transition(q, rng.choice(states), a)
+        if rng.random() < 0.5:
+            dfa.accept_states.add(q)
+
+    return dfa
+
+
+def legacy_minimize(dfa: automaton.DFA) -> automaton.DFA:
+    """
+    The implementation of DFA.minimize before the partition
+    refinement rewrite, kept here as the baseline.
+    """
+    def split(b_prime, b, a):
+        ba = set()
+        for state in b:
+            ba.update(dfa.find_transitions_to_q_with_letter(state, a))
+
+        ba_comp = ba.symmetric_difference(dfa.states)
+        return b_prime.intersection(ba), b_prime.intersection(ba_comp)
+
+    qf = dfa.states - dfa.accept_states
+    if len(dfa.accept_states) < len(dfa.states - dfa.accept_states):
+        p = [qf, dfa.accept_states]
+        l = deque([dfa.accept_states])
+    else:
+        p = [dfa.accept_states, qf]
+        l = deque([qf])
+
+    while len(l) > 0:
+        s = l.popleft()
+        for a in dfa.alphabet:
+            for b in p.copy():
+                b1, b2 = split(b, s, a)
+                p.remove(b)
+                if len(b1) > 0:
+                    p.append(b1)
+                if len(b2) > 0:
+                    p.append(b2)
+
+                if len(b1) < len(b2):
+                    if len(b1) > 0:
+                        l.append(b1)
+                else:
+                    if len(b2) > 0:
+                        l.append(b2)
+
+    start = [state_set for state_set in p if dfa._start_state in state_set]
+    minimized_dfa = automaton.DFA(dfa.alphabet, automaton.State(''.join(map(str, start[0]))))
+    for state_set in p:
+        for a in dfa.alphabet:
+            for state in state_set:
+                if dfa.transition_exists(state, a):
+                    to_state = dfa.transition(state, a)
+                    to = [s for s in p if to_state in s]
+                    minimized_dfa.add_transition(automaton.State(''.join(map(str, state_set))),
+                                                 automaton.State(''.join(map(str, to[0]))),
+                                                 a)
+                    break
+
+        if any(s in dfa.accept_states for s in state_set):
+            minimized_dfa.accept_states.add(automaton.State(''.join(map(str, state_set))))
+
+    return minimized_dfa.rename_states()
+
+
+def timed(f, *args):
+    start = time.perf_counter()
+    result = f(*args)
+    return result, time.perf_counter() - start
+
+
+def main(args):
+    print('{:>10} {:>10} {:>14} {:>14}'.format('states', 'minimal', 'legacy (s)', 'hopcroft (s)'))
+    for n in args.sizes:
+        dfa = random_dfa(n, args.alphabet, seed=n)
+
+        minimized, elapsed = timed(dfa.minimize)
+
+        if n <= args.legacy_limit:
+            legacy, legacy_elapsed = timed(legacy_minimize, dfa)
+            assert len(legacy.states) == len(minimized.states)
+            legacy_time = '{:.3f}'.format(legacy_elapsed)
+        else:
+            legacy_time = 'skipped'
+
+        print('{:>10} {:>10} {:>14} {:>14.3f}'.format(n, len(minimized.states), legacy_time, elapsed))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmarks DFA.minimize on random DFAs.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 300, 1000, 3000, 10000, 100000])
+    parser.add_argument('--alphabet', type=int, default=2)
+    parser.add_argument('--legacy-limit', type=int, default=1000,
+                        help='Largest dfa that is also minimized with the legacy implementation.')
+
+    sys.exit(main(parser.parse_args()))
@@ -1,32 +1,33 @@
+import os
 import sys
 import argparse
 import inferrer
-from typing import Set
+from typing import Iterable
 
 
-def read_examples(file: str) -> Set[str]:
-    try:
-        with open(file, 'r') as f:
-            return set(line.strip() for line in f)
-    except IOError:
+def read_examples(file: str) -> Iterable[str]:
+    if file != '-' and not os.path.isfile(file):
         raise Exception('\'{}\' does not exist'.format(file))
 
+    return inferrer.utils.read_examples(file)
+
 
 def main(args):
+    if args.positive_examples == '-' and args.negative_examples == '-':
+        raise Exception('Only one of the example files can be read from stdin')
+
     pos_examples = read_examples(args.positive_examples)
     neg_examples = read_examples(args.negative_examples)
-    alphabet = inferrer.utils.determine_alphabet(pos_examples.union(neg_examples))
     algorithm = args.algorithm
 
-    if algorithm in ['rpni', 'gold']:
-        learner = inferrer.Learner(alphabet=alphabet,
-                                   pos_examples=pos_examples,
+    if algorithm in ['rpni', 'edsm', 'gold']:
+        learner = inferrer.Learner(pos_examples=pos_examples,
                                    neg_examples=neg_examples,
                                    algorithm=algorithm)
-    elif algorithm in ['lstar', 'nlstar']:
-        learner = inferrer.Learner(alphabet=alphabet,
-                                   oracle=inferrer.oracle.PassiveOracle(pos_examples,
-                                                                        neg_examples),
+    elif algorithm in ['lstar', 'nlstar', 'kv']:
+        oracle = inferrer.oracle.PassiveOracle(pos_examples, neg_examples)
+        learner = inferrer.Learner(alphabet=oracle.alphabet,
+                                   oracle=oracle,
                                    algorithm=algorithm)
 
     dfa = learner.learn_grammar()
@@ -46,17 +47,19 @@ if __name__ == '__main__':
     parser.add_argument('positive_examples', type=str, metavar='positive-examples',
                         help='Path to the file containing positive example strings, '
                              'i.e. strings that belong in the target language separated '
-                             'by newlines.')
+                             'by newlines. The file can be gzip compressed, and - reads '
+                             'the strings from stdin.')
 
     parser.add_argument('negative_examples', type=str, metavar='negative-examples',
                         help='Path to the file containing negative example strings, '
                              'i.e. strings that do not belong in the target language'
-                             ' separated by newlines.')
+                             ' separated by newlines. The file can be gzip compressed, '
+                             'and - reads the strings from stdin.')
 
     parser.add_argument('algorithm', type=str,
-                        choices=['gold', 'rpni', 'lstar', 'nlstar'],
+                        choices=['gold', 'rpni', 'edsm', 'lstar', 'nlstar', 'kv'],
                         help='The algorithm that should be used to learn the grammar.'
-                             ' The options are: gold, rpni, lstar, and nlstar')
+                             ' The options are: gold, rpni, edsm, lstar, nlstar, and kv')
 
     parser.add_argument('--show-dfa', action='store_true',
                         help='If this argument is given, the DFA learned by the '
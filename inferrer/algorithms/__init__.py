@@ -1,4 +1,6 @@
 from inferrer.algorithms.passive.gold.gold import Gold
 from inferrer.algorithms.passive.rpni.rpni import RPNI
+from inferrer.algorithms.passive.edsm.edsm import EDSM
 from inferrer.algorithms.active.lstar.lstar import LSTAR
 from inferrer.algorithms.active.nlstar.nlstar import NLSTAR
+from inferrer.algorithms.active.kv.kv import KV
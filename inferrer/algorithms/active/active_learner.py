@@ -1,6 +1,9 @@
+import asyncio
+from inferrer import automaton
 from inferrer.algorithms.algorithm import Algorithm
-from typing import Set
+from typing import Set, Union
 from inferrer.oracle.oracle import Oracle
+from inferrer.oracle.async_oracle import AsyncOracle, BlockingOracle
 
 
 class ActiveLearner(Algorithm):
@@ -18,17 +21,58 @@ class ActiveLearner(Algorithm):
     automaton that correctly describes the target regular language.
     """
 
-    def __init__(self, alphabet: Set[str], oracle: Oracle):
+    def __init__(self, alphabet: Set[str], oracle: Union[Oracle, AsyncOracle]):
         """
         :param alphabet: The alphabet (Sigma) of the target
                          regular language.
         :type alphabet: Set[str]
-        :param oracle: Minimally adequate teacher (MAT)
-        :type oracle: Oracle
+        :param oracle: Minimally adequate teacher (MAT), which
+                       has to be an AsyncOracle to learn with
+                       learn_async.
+        :type oracle: Oracle or AsyncOracle
         """
         super().__init__(alphabet)
         self._oracle = oracle
 
+    async def learn_async(self, max_concurrency: int=10) -> automaton.FSA:
+        """
+        Learns the target language from an asynchronous oracle.
+        The learner runs in a separate thread, so that the event
+        loop stays responsive, and every batch of membership
+        queries it makes runs concurrently on the event loop,
+        with at most max_concurrency queries at the same time.
+        Since the answers of a batch are gathered in order, the
+        learned automaton is the same as with learn.
+
+        :param max_concurrency: The maximum number of membership
+                                queries that run at the same time.
+        :type max_concurrency: int
+        :return: The automaton accepting the target language.
+        :rtype: FSA
+        """
+        if not isinstance(self._oracle, AsyncOracle):
+            raise TypeError('learn_async requires an AsyncOracle')
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency has to be at least 1')
+
+        loop = asyncio.get_running_loop()
+        oracle = self._oracle
+
+        self._use_oracle(BlockingOracle(oracle, loop, max_concurrency))
+        try:
+            return await loop.run_in_executor(None, self.learn)
+        finally:
+            self._use_oracle(oracle)
+
+    def _use_oracle(self, oracle: Union[Oracle, AsyncOracle]):
+        """
+        Replaces the oracle that the learner queries.
+
+        :param oracle: Minimally adequate teacher (MAT)
+        :type oracle: Oracle or AsyncOracle
+        """
+        self._oracle = oracle
+
     def __new__(cls, *args, **kwargs):
         if cls is ActiveLearner:
             raise TypeError('Can\'t instantiate abstract class ActiveLearner')
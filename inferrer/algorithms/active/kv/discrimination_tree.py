@@ -0,0 +1,127 @@
+from inferrer.oracle.oracle import Oracle
+from typing import List
+
+
+class DiscriminationTree:
+    """
+    Represents the discrimination tree used by the
+    Kearns-Vazirani algorithm. Every inner node holds a
+    suffix (discriminator) and has a child for the strings
+    u for which u.suffix is in the target language and a
+    child for the strings for which it is not. Every leaf
+    holds a state of the hypothesis. Two access strings end
+    up in different leaves exactly when one of the suffixes
+    on their path distinguishes them, so the tree only keeps
+    the suffixes that are needed to tell the states apart.
+
+    The nodes are integer ids, and a leaf keeps its id when
+    it is split into an inner node, so that strings that were
+    sifted into the leaf can continue sifting from there.
+    """
+
+    ROOT = 0
+
+    def __init__(self, state: int):
+        """
+        :param state: The state in the only leaf of the tree
+        :type state: int
+        """
+        self._suffixes = [None]
+        self._children = [None]
+        self._states = [state]
+        self._leaves = {state: self.ROOT}
+
+    def __len__(self) -> int:
+        return len(self._suffixes)
+
+    def is_leaf(self, node: int) -> bool:
+        return self._suffixes[node] is None
+
+    def state(self, node: int) -> int:
+        """
+        :param node: A leaf of the tree
+        :type node: int
+        :return: The state in the leaf
+        :rtype: int
+        """
+        return self._states[node]
+
+    def leaf(self, state: int) -> int:
+        """
+        :param state: A state of the hypothesis
+        :type state: int
+        :return: The leaf that holds the state
+        :rtype: int
+        """
+        return self._leaves[state]
+
+    def sift(self, oracle: Oracle, strings: List[str], nodes: List[int]=None) -> List[int]:
+        """
+        Sifts the given strings down the tree, starting at the
+        given nodes, until every string reaches a leaf. The
+        strings are sifted one level at a time, and the
+        membership queries of every level are submitted to
+        the oracle as a single batch.
+
+        :param oracle: Minimally adequate teacher (MAT)
+        :type oracle: Oracle
+        :param strings: The strings to sift
+        :type strings: List[str]
+        :param nodes: The node to start at for every string,
+                      by default the root.
+        :type nodes: List[int]
+        :return: The leaf that every string reaches
+        :rtype: List[int]
+        """
+        if nodes is None:
+            nodes = [self.ROOT] * len(strings)
+        else:
+            nodes = list(nodes)
+
+        pending = [i for i, node in enumerate(nodes) if not self.is_leaf(node)]
+        while len(pending) > 0:
+            queries = [strings[i] + self._suffixes[nodes[i]] for i in pending]
+            answers = oracle.membership_queries(queries)
+
+            for i, answer in zip(pending, answers):
+                nodes[i] = self._children[nodes[i]][answer]
+
+            pending = [i for i in pending if not self.is_leaf(nodes[i])]
+
+        return nodes
+
+    def split(self, state: int, suffix: str, answer: bool, new_state: int):
+        """
+        Splits the leaf of a state into an inner node with the
+        given suffix as discriminator, whose children are the
+        leaves of the old state and of a new state.
+
+        :param state: The state whose leaf is split
+        :type state: int
+        :param suffix: The suffix that distinguishes the two states
+        :type suffix: str
+        :param answer: Whether the access string of the old state
+                       followed by the suffix is in the target
+                       language. The opposite holds for the new state.
+        :type answer: bool
+        :param new_state: The new state
+        :type new_state: int
+        """
+        node = self._leaves[state]
+
+        old_leaf = self._add_leaf(state)
+        new_leaf = self._add_leaf(new_state)
+
+        self._suffixes[node] = suffix
+        self._children[node] = {answer: old_leaf, not answer: new_leaf}
+        self._states[node] = None
+
+    def _add_leaf(self, state: int) -> int:
+        node = len(self._suffixes)
+
+        self._suffixes.append(None)
+        self._children.append(None)
+        self._states.append(state)
+        self._leaves[state] = node
+
+        return node
@@ -0,0 +1,226 @@
+from inferrer import automaton
+from inferrer.oracle.oracle import Oracle
+from inferrer.oracle.active_oracle import ActiveOracle
+from inferrer.algorithms.active.active_learner import ActiveLearner
+from inferrer.algorithms.active.kv.discrimination_tree import DiscriminationTree
+from inferrer.logger.logger import Logger
+from typing import Set
+
+
+class KV(ActiveLearner):
+    """
+    An implementation of the Kearns-Vazirani algorithm, which
+    learns regular languages from queries and counterexamples
+    by storing the states of the hypothesis in the leaves of a
+    discrimination tree instead of in an observation table.
+
+    The general idea of KV is to:
+    Sift the successors of every state through the tree to
+    find the transitions of the hypothesis.
+    Submit the hypothesis as an equivalence query.
+    Use a binary search over the counterexample to find a
+    single suffix that distinguishes a new state from an
+    existing one, and split the leaf of the existing state.
+    Iterate until the Oracle tells us the correct language has
+    been reached.
+
+    Only one suffix is added per new state, so the number of
+    membership queries and the memory used grow with the number
+    of states rather than with the length of the counterexamples.
+    """
+
+    def __init__(self, alphabet: Set[str], oracle: Oracle):
+        """
+        :param alphabet: The alphabet (Sigma) of the target
+                         regular language.
+        :type alphabet: Set[str]
+        :param oracle: Minimally adequate teacher (MAT)
+        :type oracle: Oracle
+        """
+        super().__init__(alphabet, oracle)
+
+        self._logger = Logger().get_logger()
+        self._symbols = sorted(alphabet)
+
+        self._access = []
+        self._accepting = []
+        self._targets = []
+        self._tree = None
+
+        self._logger.info('Created Active Learner [KV] instance with {} oracle'
+                          .format('Active' if type(oracle) is ActiveOracle else 'Passive'))
+
+    def learn(self) -> automaton.DFA:
+        """
+        Efficiently learns an initially unknown regular language
+        from a minimally adequate Teacher (Oracle).
+
+        :return: The dfa accepting the target language.
+        :rtype: DFA
+        """
+        self._logger.info('Start learning.')
+        self._initialise()
+        counterexample, expected = None, None
+
+        while True:
+            # Splitting one state does not guarantee that the new
+            # hypothesis classifies the counterexample correctly, so
+            # the counterexample is processed until it does.
+            if counterexample is not None and \
+                    self._accepting[self._run(counterexample)] != expected:
+                self._logger.info('Counterexample {} is still misclassified.'
+                                  .format(counterexample))
+                self._process_counterexample(counterexample, expected)
+                continue
+
+            dfa = self._build_hypothesis()
+            self._logger.info('Submitting equivalence query.')
+            answer, satisfied = self._oracle.equivalence_query(dfa)
+
+            if satisfied:
+                self._logger.info('Oracle happy with our hypothesis.')
+                break
+
+            self._logger.info('Oracle return {} as counterexample.'.format(answer))
+            counterexample, expected = answer, not dfa.parse_string(answer)[1]
+            self._process_counterexample(counterexample, expected)
+
+        return dfa
+
+    def _initialise(self):
+        """
+        Initialises the hypothesis with a single state,
+        whose access string is the empty string, in the
+        only leaf of the discrimination tree.
+        """
+        self._logger.info('Initialising the discrimination tree.')
+        self._access = ['']
+        self._accepting = [self._oracle.membership_query('')]
+        self._targets = [{}]
+        self._tree = DiscriminationTree(0)
+
+        self._update_transitions()
+
+    def _add_state(self, u: str) -> int:
+        """
+        Adds a state with the access string u to
+        the hypothesis.
+
+        :param u: The access string of the state
+        :type u: str
+        :return: The new state
+        :rtype: int
+        """
+        self._logger.info('Adding state with access string {}'.format(u))
+        self._access.append(u)
+        self._accepting.append(self._oracle.membership_query(u))
+        self._targets.append({})
+
+        return len(self._access) - 1
+
+    def _update_transitions(self):
+        """
+        Sifts the successors of the states whose transitions
+        are not known, or lead to a leaf that has since been
+        split. These successors continue sifting from where
+        they stopped before, so no membership query is repeated
+        for the part of the tree that they already passed.
+        """
+        transitions = []
+        for q, targets in enumerate(self._targets):
+            for a in self._symbols:
+                node = targets.get(a, DiscriminationTree.ROOT)
+                if a not in targets or not self._tree.is_leaf(node):
+                    transitions.append((q, a, node))
+
+        if len(transitions) == 0:
+            return
+
+        leaves = self._tree.sift(self._oracle,
+                                 [self._access[q] + a for q, a, _ in transitions],
+                                 [node for _, _, node in transitions])
+
+        for (q, a, _), leaf in zip(transitions, leaves):
+            self._targets[q][a] = leaf
+
+    def _transition(self, q: int, a: str) -> int:
+        return self._tree.state(self._targets[q][a])
+
+    def _run(self, s: str) -> int:
+        """
+        Gets the state that the hypothesis reaches on s.
+
+        :param s: The string to parse
+        :type s: str
+        :return: The state reached
+        :rtype: int
+        """
+        q = 0
+        for a in s:
+            q = self._transition(q, a)
+
+        return q
+
+    def _process_counterexample(self, w: str, expected: bool):
+        """
+        Processes a counterexample as proposed by Rivest and
+        Schapire. Let q_i be the state that the hypothesis reaches
+        on the first i symbols of the counterexample w, u_i its
+        access string and alpha(i) the answer to the membership
+        query u_i.w[i:]. Since alpha(0) is the answer for w and
+        alpha(len(w)) is the answer of the hypothesis for w, there
+        is an index i where alpha(i) differs from alpha(i + 1),
+        which is found with a binary search. The suffix w[i + 1:]
+        then distinguishes u_i.w[i] from u_(i + 1), so the leaf
+        of q_(i + 1) is split to add the new state u_i.w[i].
+
+        :param w: The counter-example given by the oracle
+        :type w: str
+        :param expected: Whether w is in the target language
+        :type expected: bool
+        """
+        states = [0]
+        for a in w:
+            states.append(self._transition(states[-1], a))
+
+        low, high = 0, len(w)
+        answer = self._accepting[states[high]]
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self._oracle.membership_query(self._access[states[middle]] + w[middle:]) == expected:
+                low = middle
+            else:
+                high = middle
+                answer = not expected
+
+        suffix = w[high:]
+        self._logger.info('Splitting state {} with the distinguishing suffix {}'
+                          .format(self._access[states[high]], suffix))
+
+        q = self._add_state(self._access[states[low]] + w[low])
+        self._tree.split(states[high], suffix, answer, q)
+        self._update_transitions()
+
+    def _build_hypothesis(self) -> automaton.DFA:
+        """
+        Builds the hypothesis from the states and the
+        transitions that were found by sifting.
+
+        :return: The hypothesis
+        :rtype: DFA
+        """
+        self._logger.info('Building DFA from the discrimination tree.')
+        states = [automaton.State(u) for u in self._access]
+        dfa = automaton.DFA(self._alphabet, states[0])
+
+        for q, state in enumerate(states):
+            dfa.states.add(state)
+            if self._accepting[q]:
+                dfa.accept_states.add(state)
+            else:
+                dfa.reject_states.add(state)
+
+            for a in self._symbols:
+                dfa.add_transition(state, states[self._transition(q, a)], a)
+
+        return dfa.rename_states()
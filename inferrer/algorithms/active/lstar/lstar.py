@@ -21,20 +21,38 @@ class LSTAR(ActiveLearner):
     reached.
     """
 
-    def __init__(self, alphabet: Set[str], oracle: Oracle):
+    def __init__(self, alphabet: Set[str], oracle: Oracle,
+                 counterexample_processing: str='angluin'):
         """
         :param alphabet: The alphabet (Sigma) of the target
                          regular language.
         :type alphabet: Set[str]
         :param oracle: Minimally adequate teacher (MAT)
         :type oracle: Oracle
+        :param counterexample_processing: How a counterexample
+                                          is added to the table,
+                                          one of 'angluin',
+                                          'maler-pnueli' and
+                                          'rivest-schapire'.
+        :type counterexample_processing: str
         """
         super().__init__(alphabet, oracle)
 
+        handlers = {
+            'angluin': self._useq,
+            'maler-pnueli': self._add_suffixes,
+            'rivest-schapire': self._add_distinguishing_suffix
+        }
+        if counterexample_processing not in handlers:
+            raise ValueError('counterexample_processing has to be one of {}'
+                             .format(', '.join(sorted(handlers))))
+
         self._logger = Logger().get_logger()
         self._oracle = oracle
+        self._process_counterexample = handlers[counterexample_processing]
         self._red = set()
         self._blue = set()
+        self._representatives = {}
 
         self._logger.info('Created Active Learner [LSTAR] instance with {} oracle'
                           .format('Active' if type(oracle) is ActiveOracle else 'Passive'))
@@ -49,6 +67,7 @@ class LSTAR(ActiveLearner):
         """
         self._logger.info('Start learning.')
         ot = self._initialise()
+        counterexample, expected = None, None
 
         while True:
             is_closed, is_consistent = ot.is_closed_and_consistent()
@@ -62,6 +81,16 @@ class LSTAR(ActiveLearner):
                 is_closed, is_consistent = ot.is_closed_and_consistent()
 
             dfa = self._build_automaton(ot)
+
+            # Only the 'angluin' processing guarantees that the new
+            # hypothesis classifies the counterexample correctly, so
+            # the counterexample is processed until it does.
+            if counterexample is not None and dfa.parse_string(counterexample)[1] != expected:
+                self._logger.info('Counterexample {} is still misclassified.'
+                                  .format(counterexample))
+                ot = self._process_counterexample(ot, counterexample)
+                continue
+
             self._logger.info('Submitting equivalence query.')
             answer, satisfied = self._oracle.equivalence_query(dfa)
 
@@ -70,7 +99,8 @@ class LSTAR(ActiveLearner):
                 break
 
             self._logger.info('Oracle return {} as counterexample.'.format(answer))
-            ot = self._useq(ot, answer)
+            counterexample, expected = answer, not dfa.parse_string(answer)[1]
+            ot = self._process_counterexample(ot, answer)
 
         return dfa
 
@@ -92,12 +122,31 @@ class LSTAR(ActiveLearner):
         ot.sta = self._red.union(self._blue)
         ot.exp = {''}
 
-        ot.put('', '', self._oracle.membership_query(''))
-        for a in self._alphabet:
-            ot.put(a, '', self._oracle.membership_query(a))
+        for u in ot.sta:
+            ot.put(u, '', None)
+        self._fill_holes(ot)
 
         return ot
 
+    def _fill_holes(self, ot: utils.ObservationTable):
+        """
+        Fills in all of the holes in the observation table
+        by collecting the membership queries of all of the
+        holes first and submitting them as a single batch.
+
+        :param ot: The observation table to fill in.
+        :type ot: ObservationTable
+        """
+        holes = list(ot.find_holes())
+        if len(holes) == 0:
+            return
+
+        queries = list(dict.fromkeys(u + e for u, e in holes))
+        answers = dict(zip(queries, self._oracle.membership_queries(queries)))
+
+        for u, e in holes:
+            ot.put(u, e, answers[u + e])
+
     def _close(self, ot: utils.ObservationTable) -> utils.ObservationTable:
         """
         Closes the observation table by adding an extra row.
@@ -108,11 +157,13 @@ class LSTAR(ActiveLearner):
         :rtype: ObservationTable
         """
         self._logger.info('Closing the table by adding a row.')
+        red = {ot.row_signature(u) for u in self._red}
         for s in self._blue.copy():
-            if not all([ot.get_row(s) != ot.get_row(u) for u in self._red]):
+            if ot.row_signature(s) in red:
                 continue
 
             self._red.add(s)
+            red.add(ot.row_signature(s))
             self._blue.remove(s)
 
             for a in self._alphabet:
@@ -121,8 +172,7 @@ class LSTAR(ActiveLearner):
                     self._blue.add(sa)
                     ot.add_row(sa)
 
-            for u, e in ot.find_holes():
-                ot.put(u, e, self._oracle.membership_query(u + e))
+            self._fill_holes(ot)
 
         return ot
 
@@ -143,8 +193,7 @@ class LSTAR(ActiveLearner):
         ot.exp.add(ae)
         ot.add_column_to_table(ae)
 
-        for u, e in ot.find_holes():
-            ot.put(u, e, self._oracle.membership_query(u + e))
+        self._fill_holes(ot)
 
         return ot
 
@@ -163,21 +212,15 @@ class LSTAR(ActiveLearner):
         :rtype: Tuple[str, str, str, str]
         """
         self._logger.info('Trying to find two inconsistent rows in the table.')
-        for s1 in self._red:
-            for s2 in self._red:
-                if s1 == s2:
-                    continue
-                for a in self._alphabet:
-                    for e in ot.exp:
-                        if ot.get_row(s1) == ot.get_row(s2) and \
-                            ot.entry_exists(s1 + a, e) and ot.entry_exists(s2 + a, e) \
-                                and ot.get(s1 + a, e) != ot.get(s2 + a, e):
-                            self._logger.info('Found two inconsistent rows {} and {}'
-                                              .format(s1, s2))
-                            return s1, s2, a, e
-
-        self._logger.info('Did not find a inconsistency in the table.')
-        return '', '', '', ''
+        inconsistency = ot.find_inconsistency()
+
+        if inconsistency is None:
+            self._logger.info('Did not find a inconsistency in the table.')
+            return '', '', '', ''
+
+        self._logger.info('Found two inconsistent rows {} and {}'
+                          .format(inconsistency[0], inconsistency[1]))
+        return inconsistency
 
     def _useq(self, ot: utils.ObservationTable, answer: str) -> utils.ObservationTable:
         """
@@ -216,8 +259,92 @@ class LSTAR(ActiveLearner):
                         self._blue.add(pa)
                         self._red.discard(pa)
 
-        for u, e in ot.find_holes():
-            ot.put(u, e, self._oracle.membership_query(u + e))
+        self._fill_holes(ot)
+
+        return ot
+
+    def _add_suffixes(self, ot: utils.ObservationTable, answer: str) -> utils.ObservationTable:
+        """
+        Processes a counterexample as proposed by Maler and Pnueli,
+        by adding all of the suffixes of the counterexample as
+        columns to the observation table instead of adding all
+        of its prefixes as rows. Since the rows of the table are
+        then never inconsistent, the table only grows as far as
+        it needs to in order to become closed.
+
+        :param ot: The observation table to update
+        :type ot: ObservationTable
+        :param answer: The counter-example given by the oracle
+        :type answer: str
+        :return: Updated ObservationTable
+        :rtype: ObservationTable
+        """
+        suffixes = [answer[i:] for i in range(len(answer))
+                    if answer[i:] not in ot.exp]
+        self._logger.info('Updating table by adding the following suffixes: {}'
+                          .format(', '.join(suffixes)))
+
+        for e in suffixes:
+            ot.exp.add(e)
+            ot.add_column_to_table(e)
+
+        self._fill_holes(ot)
+
+        return ot
+
+    def _add_distinguishing_suffix(self, ot: utils.ObservationTable,
+                                   answer: str) -> utils.ObservationTable:
+        """
+        Processes a counterexample as proposed by Rivest and Schapire.
+        Let u_i be the access string of the state that the hypothesis
+        reaches on the first i symbols of the counterexample w, and
+        alpha(i) the answer to the membership query u_i.w[i:]. Since
+        alpha(0) is the answer for w and alpha(len(w)) is the answer
+        of the hypothesis for w, there is an index i where alpha(i)
+        differs from alpha(i + 1), which is found with a binary
+        search that makes a logarithmic number of membership queries.
+        The single suffix w[i + 1:] then distinguishes u_i.w[i] from
+        every red row, and is added as a column to the table.
+
+        :param ot: The observation table to update
+        :type ot: ObservationTable
+        :param answer: The counter-example given by the oracle
+        :type answer: str
+        :return: Updated ObservationTable
+        :rtype: ObservationTable
+        """
+        access = ['']
+        for a in answer:
+            u = self._representatives.get(ot.row_signature(access[-1] + a))
+            if u is None:
+                return self._useq(ot, answer)
+            access.append(u)
+
+        def alpha(i: int) -> bool:
+            return self._oracle.membership_query(access[i] + answer[i:])
+
+        low, high = 0, len(answer)
+        low_answer = alpha(low)
+        if low_answer == alpha(high):
+            return self._useq(ot, answer)
+
+        while high - low > 1:
+            middle = (low + high) // 2
+            if alpha(middle) == low_answer:
+                low = middle
+            else:
+                high = middle
+
+        e = answer[high:]
+        if e in ot.exp:
+            return self._useq(ot, answer)
+
+        self._logger.info('Updating table by adding the distinguishing suffix {}'
+                          .format(e))
+        ot.exp.add(e)
+        ot.add_column_to_table(e)
+
+        self._fill_holes(ot)
 
         return ot
 
@@ -233,13 +360,21 @@ class LSTAR(ActiveLearner):
         self._logger.info('Building DFA from the table.')
         dfa = automaton.DFA(self._alphabet)
 
-        for u in self._red:
-            for v in ot.ot.keys():
-                if u == v:
-                    continue
+        shorter = set()
+        rows = sorted(ot.ot.keys(), key=len)
+        i = 0
+        for u in sorted(self._red, key=len):
+            while i < len(rows) and len(rows[i]) < len(u):
+                shorter.add(ot.row_signature(rows[i]))
+                i += 1
+
+            if len(shorter - {ot.row_signature(u)}) > 0:
+                dfa.states.add(automaton.State(u))
 
-                if len(v) < len(u) and ot.get_row(v) != ot.get_row(u):
-                    dfa.states.add(automaton.State(u))
+        states = {}
+        for w in dfa.states:
+            states[ot.row_signature(w.name)] = w
+        self._representatives = {signature: w.name for signature, w in states.items()}
 
         for u in dfa.states:
             if ot.entry_exists(u.name, ''):
@@ -249,8 +384,8 @@ class LSTAR(ActiveLearner):
                     dfa.reject_states.add(u)
 
             for a in self._alphabet:
-                for w in dfa.states:
-                    if ot.get_row(u.name + a) == ot.get_row(w.name):
-                        dfa.add_transition(u, w, a)
+                w = states.get(ot.row_signature(u.name + a))
+                if w is not None:
+                    dfa.add_transition(u, w, a)
 
         return dfa.rename_states()
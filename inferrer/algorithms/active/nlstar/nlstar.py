@@ -43,6 +43,17 @@ class NLSTAR(ActiveLearner):
         self._ot = ObservationTable(self._alphabet, oracle)
         self._hypothesis = None
 
+    def _use_oracle(self, oracle: Oracle):
+        """
+        Replaces the oracle that the learner and its
+        observation table query.
+
+        :param oracle: Minimally adequate teacher (MAT)
+        :type oracle: Oracle
+        """
+        super()._use_oracle(oracle)
+        self._ot._oracle = oracle
+
     def learn(self) -> NFA:
         """
         Infers an initially unknown regular language
@@ -116,6 +127,7 @@ class NLSTAR(ActiveLearner):
         self._ot.lower_rows.remove(unclosed_row)
         self._ot.upper_primes.add(unclosed_row)
 
+        new_rows = []
         for symbol in self._alphabet:
             new_row = Row(unclosed_row.prefix + symbol)
 
@@ -123,8 +135,9 @@ class NLSTAR(ActiveLearner):
             self._ot.lower_rows.add(new_row)
             self._ot.prefix_to_row[new_row.prefix] = new_row
 
-            self._ot.add_columns_to_row(new_row)
+            new_rows.append(new_row)
 
+        self._ot.add_columns_to_rows(new_rows)
         self._ot.update_meta_data()
 
     def _make_table_consistent(self, sym, suffix):
@@ -145,37 +158,76 @@ class NLSTAR(ActiveLearner):
         which we will use when making an
         equivalence query to the Oracle.
 
+        Every upper prime row is a state, and the row u has a
+        transition on a to every state whose row is covered by
+        the row of ua. The upper primes are numbered, so the
+        states that a row covers are found as a bitmask of
+        state numbers, which is computed once for every distinct
+        row bitset. The states are then numbered in breadth-first
+        order from the initial states, and only the states that
+        can be reached are added to the NFA.
+
         :return: The "hypothesis" NFA.
         :rtype: NFA
         """
         self._logger.info('Building NFA from the table.')
+        symbols = sorted(self._alphabet)
+
+        primes = sorted(self._ot.upper_primes)
+        values = [row.bits for row in primes]
+
+        covered = {}
+
+        def covered_primes(bits: int) -> int:
+            if bits not in covered:
+                mask = 0
+                for i, value in enumerate(values):
+                    if value & ~bits == 0:
+                        mask |= 1 << i
+                covered[bits] = mask
+            return covered[bits]
+
+        successors = []
+        for row in primes:
+            targets = {}
+            for a in symbols:
+                ua_row = self._ot.prefix_to_row.get(row.prefix + a)
+                if ua_row is not None:
+                    targets[a] = covered_primes(ua_row.bits)
+            successors.append(targets)
+
+        start = covered_primes(self._ot.get_epsilon_row().bits)
+
+        order = [i for i in range(len(primes)) if start >> i & 1]
+        numbers = {i: n for n, i in enumerate(order)}
+        for i in order:
+            for a in symbols:
+                mask = successors[i].get(a, 0)
+                while mask:
+                    j = (mask & -mask).bit_length() - 1
+                    mask &= mask - 1
+                    if j not in numbers:
+                        numbers[j] = len(order)
+                        order.append(j)
+
+        states = [State(str(n)) for n in range(len(order))]
         nfa = NFA(self._alphabet)
-        epsilon_row = self._ot.get_epsilon_row()
 
-        for row in self._ot.upper_primes:
-            state = State(row.prefix)
+        for i in order:
+            state = states[numbers[i]]
             nfa.add_state(state)
 
-            if row.covered_by(epsilon_row):
+            if start >> i & 1:
                 nfa.add_start_state(state)
 
-            if row.columns['']:
+            if primes[i].get(''):
                 nfa.add_accepting_state(state)
 
-        for u in self._ot.rows:
-            state = State(u.prefix)
-            if state not in nfa.get_states():
-                continue
-
-            for a in self._alphabet:
-                ua_row = self._ot.get_row_by_prefix(u.prefix + a)
-
-                if ua_row is None:
-                    continue
-
-                for r in nfa.get_states():
-                    row = self._ot.get_row_by_prefix(r.name)
-                    if row.covered_by(ua_row):
-                        nfa.add_transition(state, r, a)
+            for a in symbols:
+                mask = successors[i].get(a, 0)
+                while mask:
+                    j = (mask & -mask).bit_length() - 1
+                    mask &= mask - 1
+                    nfa.add_transition(state, states[numbers[j]], a)
 
-        return nfa.rename_states()
+        return nfa
@@ -1,6 +1,6 @@
 from inferrer.oracle.oracle import Oracle
 from inferrer.algorithms.active.nlstar.row import Row
-from typing import Set, Tuple
+from typing import List, Set, Tuple
 
 
 class ObservationTable:
@@ -8,6 +8,13 @@ class ObservationTable:
     An implementation of the observation table for
     the NL* algorithm, which is a 2-dimensional table
     that gives information about some target language.
+
+    The rows store their entries as bitsets over a column
+    index that is shared by the table, and the table keeps
+    track of the distinct bitsets of its rows, along with
+    whether each of them is strictly covered by another one,
+    so that the prime rows can be updated in time linear in
+    the number of rows when rows are added to the table.
     """
 
     def __init__(self, alphabet: Set[str], oracle: Oracle):
@@ -32,6 +39,9 @@ class ObservationTable:
 
         self.__prefix_to_row = {}
 
+        self._index = {}
+        self._values = {}
+
     @property
     def rows(self):
         return self.__rows
@@ -98,13 +108,13 @@ class ObservationTable:
         The suffix-closed set is initialized
         with the empty string.
         """
-        row = Row('')
+        row = Row('', self._index)
         self.rows.add(row)
         self.upper_rows.add(row)
         self.prefix_to_row[row.prefix] = row
 
         for symbol in self._alphabet:
-            row = Row(symbol)
+            row = Row(symbol, self._index)
             self.rows.add(row)
             self.lower_rows.add(row)
             self.prefix_to_row[row.prefix] = row
@@ -122,9 +132,31 @@ class ObservationTable:
                     should be added for.
         :type row: Row
         """
-        for suffix in self.suffixes:
-            mq = self._oracle.membership_query(row.prefix + suffix)
-            row.columns[suffix] = mq
+        self.add_columns_to_rows([row])
+
+    def add_columns_to_rows(self, rows: List[Row]):
+        """
+        Adds all of the suffixes that are currently in
+        the observation table to the given rows. The
+        membership queries for all of the new entries
+        are submitted to the oracle as a single batch.
+
+        :param rows: Rows to whom the suffixes should
+                     be added for.
+        :type rows: List[Row]
+        """
+        for row in rows:
+            row.use_index(self._index)
+
+        entries = [(row, suffix) for row in rows for suffix in self.suffixes]
+        if len(entries) == 0:
+            return
+
+        queries = list(dict.fromkeys(row.prefix + suffix for row, suffix in entries))
+        answers = dict(zip(queries, self._oracle.membership_queries(queries)))
+
+        for row, suffix in entries:
+            row.set(suffix, answers[row.prefix + suffix])
 
     def add_suffix(self, suffix: str):
         """
@@ -134,11 +166,7 @@ class ObservationTable:
         :param suffix: suffix to add to suffix-set.
         :type suffix: str
         """
-        if suffix not in self.suffixes:
-            self.suffixes.add(suffix)
-            for row in self.rows:
-                mq = self._oracle.membership_query(row.prefix + suffix)
-                row.columns[suffix] = mq
+        self.add_new_suffixes({suffix})
 
     def is_closed_and_consistent(self) -> Tuple[Tuple[bool, Row], Tuple[bool, str, str]]:
         """
@@ -160,11 +188,18 @@ class ObservationTable:
                  the unclosed row if there is one.
         :rtype: Tuple[bool, Row]
         """
-        for row in self.lower_rows:
-            covered = [r_prime for r_prime in self.upper_primes if r_prime.covered_by(row)]
+        upper_primes = [r_prime.bits for r_prime in self.upper_primes]
 
-            if len(covered) == 0 or \
-                    not Row.join(covered).columns_are_equal(row):
+        for row in self.lower_rows:
+            bits = row.bits
+            covered = False
+            joined = 0
+            for r_prime in upper_primes:
+                if r_prime & ~bits == 0:
+                    covered = True
+                    joined |= r_prime
+
+            if not covered or joined != bits:
                 return False, row
 
         return True, None
@@ -178,50 +213,101 @@ class ObservationTable:
                  with information.
         :rtype: Tuple[bool, str, str]
         """
+        suffixes = None
+
         for u_prime in self.upper_rows:
             for u in u_prime.covered_rows(self.upper_rows):
                 for sym in self._alphabet:
                     u_prime_a = self.get_row_by_prefix(u_prime.prefix + sym)
                     u_a = self.get_row_by_prefix(u.prefix + sym)
-                    for suffix in self.suffixes:
-                        if u_prime_a.columns[suffix] and not u_a.columns[suffix]:
-                            return False, sym, suffix
+
+                    difference = u_prime_a.bits & ~u_a.bits
+                    if difference != 0:
+                        if suffixes is None:
+                            suffixes = {i: suffix for suffix, i in self._index.items()}
+                        return False, sym, suffixes[(difference & -difference).bit_length() - 1]
 
         return True, '', ''
 
     def add_new_suffixes(self, suffixes: Set[str]):
         """
-        Adds new suffixes to the observation table.
+        Adds new suffixes to the observation table. The
+        membership queries for all of the new entries are
+        submitted to the oracle as a single batch.
 
         :param suffixes: Suffixes to add.
         :type suffixes: Set[str]
         """
+        entries = []
         for suffix in suffixes:
             if suffix not in self.suffixes:
                 self.suffixes.add(suffix)
-                for row in self.rows:
-                    row.columns[suffix] = self._oracle.membership_query(row.prefix + suffix)
+                entries.extend((row, suffix) for row in self.rows)
+
+        if len(entries) == 0:
+            return
+
+        queries = list(dict.fromkeys(row.prefix + suffix for row, suffix in entries))
+        answers = dict(zip(queries, self._oracle.membership_queries(queries)))
+
+        for row, suffix in entries:
+            row.set(suffix, answers[row.prefix + suffix])
 
     def update_meta_data(self):
         """
         Recalculate for all the rows in the
         observation table whether the rows is a
         prime row or a composed row.
+
+        A row of the lower part is composed if it is the join
+        of the other rows that cover it, which is the case
+        unless another row strictly covers it. The distinct
+        bitsets of the rows are only compared with each other
+        when a new bitset appears, and all of them are compared
+        again only after the bitsets of the existing rows change
+        when suffixes are added.
         """
+        for row in self.rows:
+            row.use_index(self._index)
+
+        values = {row.bits for row in self.rows}
+        if any(value not in values for value in self._values):
+            self._values = {}
+
+        for value in values:
+            if value not in self._values:
+                self._add_value(value)
+
         self.primes.clear()
         self.upper_primes.clear()
 
+        upper_rows = set(self.upper_rows)
         for row in self.rows:
+            row.prime = row in upper_rows or self._values[row.bits]
 
-            covered_rows = list(filter(lambda r: r != row and row.covered_by(r), self.rows))
-
-            if row in self.upper_rows or not row.is_composed(covered_rows):
-
-                row.prime = True
+            if row.prime:
                 self.primes.add(row)
-                if row in self.upper_rows:
+                if row in upper_rows:
                     self.upper_primes.add(row)
 
+    def _add_value(self, value: int):
+        """
+        Adds a distinct bitset of the rows, and records
+        which of the bitsets are strictly covered by
+        another bitset.
+
+        :param value: The new bitset
+        :type value: int
+        """
+        strictly_covered = False
+        for other in self._values:
+            if other & ~value == 0:
+                self._values[other] = True
+            elif value & ~other == 0:
+                strictly_covered = True
+
+        self._values[value] = strictly_covered
+
     def get_epsilon_row(self) -> Row:
         """
         Gets the epsilon row in the table.
@@ -1,21 +1,35 @@
-import copy
-from typing import Generator
+from types import MappingProxyType
+from typing import Dict, Generator, Mapping
 
 
 class Row:
     """
     Represents a row in the observation table
     used by the NL* algorithm.
+
+    The entries of the row are stored in an integer bitset,
+    in which every suffix has the bit given by a column
+    index that is shared by all of the rows of a table, so
+    that a row covers another row if the bits of the other
+    row are a subset of its own bits, and the join of rows
+    is the union of their bits.
     """
 
-    def __init__(self, prefix: str):
+    def __init__(self, prefix: str, index: Dict[str, int]=None):
         """
         :param prefix: The prefix of the row in
                        the observation table.
         :type prefix: str
+        :param index: The bit of every suffix, which is
+                      shared with the other rows of the
+                      table. A new index is created for
+                      the row if none is given.
+        :type index: Dict[str, int]
         """
         self.__prefix = prefix
-        self.__columns = {}
+        self.__index = {} if index is None else index
+        self.__bits = 0
+        self.__known = 0
         self.__prime = None
 
     @property
@@ -27,12 +41,35 @@ class Row:
         self.__prefix = prefix
 
     @property
-    def columns(self):
-        return self.__columns
+    def index(self) -> Dict[str, int]:
+        return self.__index
+
+    @property
+    def bits(self) -> int:
+        """
+        The bitset of the suffixes for which
+        the entry of the row is 1.
+        """
+        return self.__bits
+
+    @property
+    def columns(self) -> Mapping[str, bool]:
+        """
+        The entries of the row by suffix, which are decoded
+        from the bitset every time. The mapping is read-only,
+        so an entry has to be changed with set, or all of
+        them by assigning a dictionary to columns.
+        """
+        return MappingProxyType({suffix: bool(self.__bits >> i & 1)
+                                 for suffix, i in self.__index.items()
+                                 if self.__known >> i & 1})
 
     @columns.setter
     def columns(self, columns):
-        self.__columns = columns
+        self.__bits = 0
+        self.__known = 0
+        for suffix, value in columns.items():
+            self.set(suffix, value)
 
     @property
     def prime(self):
@@ -42,6 +79,52 @@ class Row:
     def prime(self, prime):
         self.__prime = prime
 
+    def get(self, suffix: str) -> bool:
+        """
+        :param suffix: The suffix of the entry
+        :type suffix: str
+        :return: The entry of the row for the suffix
+        :rtype: bool
+        """
+        return bool(self.__bits >> self.__index[suffix] & 1)
+
+    def set(self, suffix: str, value: bool):
+        """
+        Sets the entry of the row for the suffix, and
+        adds the suffix to the column index if it is
+        not in the index yet.
+
+        :param suffix: The suffix of the entry
+        :type suffix: str
+        :param value: The entry
+        :type value: bool
+        """
+        i = self.__index.get(suffix)
+        if i is None:
+            i = self.__index[suffix] = len(self.__index)
+
+        self.__known |= 1 << i
+        if value:
+            self.__bits |= 1 << i
+        else:
+            self.__bits &= ~(1 << i)
+
+    def use_index(self, index: Dict[str, int]):
+        """
+        Moves the entries of the row to the bits given
+        by another column index, so that the row can be
+        compared with the other rows that use the index.
+
+        :param index: The column index of the table
+        :type index: Dict[str, int]
+        """
+        if index is self.__index:
+            return
+
+        columns = dict(self.columns)
+        self.__index = index
+        self.columns = columns
+
     def columns_are_equal(self, other) -> bool:
         """
         Determines whether two rows are equal by
@@ -52,6 +135,9 @@ class Row:
         :return: Whether the two rows are equal.
         :rtype: bool
         """
+        if self.__index is other.index:
+            return self.__known == other.__known and self.__bits == other.bits
+
         return self.columns == other.columns
 
     def covered_by(self, other_row) -> bool:
@@ -66,10 +152,13 @@ class Row:
                  by the other row.
         :rtype: bool
         """
-        for v in self.columns.keys():
-            if self.columns[v] and not other_row.columns[v]:
-                return False
-        return True
+        if self.__index is other_row.index:
+            return self.__bits & ~other_row.bits == 0
+
+        other_columns = other_row.columns
+
+        return all(other_columns.get(suffix, False)
+                   for suffix, value in self.columns.items() if value)
 
     def covered_rows(self, rows: set) -> Generator:
         """
@@ -103,30 +192,38 @@ class Row:
         if len(rows) == 0:
             return True
 
-        return self.join(rows).columns == self.columns
+        return self.join(rows).columns_are_equal(self)
 
     @staticmethod
     def join(rows: list):
         """
-        Joins the given rows.
+        Joins the given rows. If the rows do not share a
+        column index, the joined row gets an index of its
+        own, and the given rows are left as they are.
 
         :param rows: Rows to join.
         :type rows: List[Row]
         :return: The result of joining the rows.
         :rtype: Row
         """
-        new_prefix = [rows[0].prefix]
-        joined_row = Row(rows[0].prefix)
-        joined_row.columns = copy.deepcopy(rows[0].columns)
+        prefix = ''.join(row.prefix for row in rows)
+        index = rows[0].index
+
+        if any(row.index is not index for row in rows):
+            columns = {}
+            for row in rows:
+                for suffix, value in row.columns.items():
+                    columns[suffix] = columns.get(suffix, False) or value
 
-        for i in range(1, len(rows)):
-            row = rows[i]
-            new_prefix.append(row.prefix)
+            joined_row = Row(prefix)
+            joined_row.columns = columns
 
-            for suffix in joined_row.columns.keys():
-                joined_row.columns[suffix] = joined_row.columns[suffix] or row.columns[suffix]
+            return joined_row
 
-        joined_row.prefix = ''.join(new_prefix)
+        joined_row = Row(prefix, index)
+        for row in rows:
+            joined_row.__bits |= row.bits
+            joined_row.__known |= row.__known
 
         return joined_row
 
@@ -0,0 +1,188 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from inferrer import automaton
+from inferrer.algorithms.passive.rpni.rpni import RPNI, _initialise_worker
+from typing import Set, List, Tuple
+
+
+class EDSM(RPNI):
+    """
+    An implementation of the Evidence-Driven State Merging (EDSM)
+    algorithm with the blue-fringe (red-blue) framework. Instead of
+    merging the blue states in lexicographic order like RPNI, EDSM
+    scores every possible merge of a blue state into a red state by
+    the number of accepting and rejecting states of the prefix tree
+    acceptor that agree with each other in the merge, and performs
+    the merge with the highest score first.
+    """
+
+    def __init__(self, pos_examples: Set[str], neg_examples: Set[str], alphabet: Set[str],
+                 workers: int=1):
+        """
+        :param pos_examples: Set of positive example strings
+                             from the target language
+        :type pos_examples: Set[str]
+        :param neg_examples: Set of negative example strings,
+                             i.e strings that do not belong in
+                             the target language.
+        :type neg_examples: Set[str]
+        :param alphabet: The alphabet (Sigma) of the target
+                         regular language.
+        :type alphabet: Set[str]
+        :param workers: The number of processes that score the
+                        merges of a blue state with the red states
+                        at the same time. With 1 worker, the merges
+                        are scored one after the other in this process.
+        :type workers: int
+        """
+        super().__init__(pos_examples, neg_examples, alphabet, workers)
+
+    def learn(self) -> automaton.DFA:
+        """
+        Learns the grammar from the sets of positive and negative
+        example strings. As long as there are blue states, a blue
+        state that cannot be merged with any red state is promoted
+        to red, otherwise the merge with the highest score is
+        performed. This method returns a DFA that is consistent
+        with the sample.
+
+        :return: DFA
+        :rtype: Automaton
+        """
+        self._logger.info('Start learning with alphabet = {}\n'
+                          'positive samples = {}\n'
+                          'negative samples = {}'.format(self._alphabet,
+                                                         self._pos_examples,
+                                                         self._neg_examples))
+
+        self._logger.info('Building PTA')
+        quotient = automaton.Quotient(self._build_prefix_tree())
+
+        self._red = {quotient.start}
+        self._blue = set()
+        self._update_blue(quotient)
+
+        executor = None
+        if self._workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self._workers,
+                                           initializer=_initialise_worker)
+
+        try:
+            while len(self._blue) != 0:
+                best = None
+                promoted = False
+
+                for qb in sorted(self._blue):
+                    red = sorted(self._red)
+                    if executor is not None and len(red) > 1:
+                        scores = self._score_merges_parallel(executor, quotient, qb, red)
+                    else:
+                        scores = self._score_merges(quotient, qb, red)
+
+                    if len(scores) == 0:
+                        self._blue.remove(qb)
+                        self._promote(qb, quotient)
+                        promoted = True
+                        break
+
+                    for score, qr in scores:
+                        if best is None or score > best[0]:
+                            best = score, qr, qb
+
+                if promoted:
+                    continue
+
+                score, qr, qb = best
+                self._logger.info('Best merge is {} into {} with score {}'
+                                  .format(quotient.state(qb).name,
+                                          quotient.state(qr).name, score))
+
+                self._blue.remove(qb)
+                self._merge(quotient, qr, qb)
+                self._update_blue(quotient)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return quotient.to_dfa()
+
+    def _score_merges(self, quotient: automaton.Quotient,
+                      qb: int, red: List[int]) -> List[Tuple[int, int]]:
+        """
+        Tries to merge the blue state qb with every red state and
+        computes the score of every compatible merge, which is
+        the number of pairs of states that are joined with the
+        same label. Every merge is rolled back afterwards.
+
+        :param quotient: the quotient of the PTA
+        :type quotient: Quotient
+        :param qb: State with colour blue
+        :type qb: int
+        :param red: Red states in the order they should be tried
+        :type red: List[int]
+        :return: The score and red state of every compatible
+                 merge, in the order of the red states.
+        :rtype: List[Tuple[int, int]]
+        """
+        scores = []
+        for qr in red:
+            journal = []
+
+            if self._merge(quotient, qr, qb, journal):
+                scores.append((quotient.evidence, qr))
+
+            quotient.rollback(journal)
+
+        return scores
+
+    def _score_merges_parallel(self, executor: ProcessPoolExecutor,
+                               quotient: automaton.Quotient,
+                               qb: int, red: List[int]) -> List[Tuple[int, int]]:
+        """
+        Scores the merges of the blue state qb with the given
+        red states by splitting the red states into one
+        contiguous chunk per worker, like RPNI does. The
+        quotient itself is not modified.
+
+        :param executor: Pool of worker processes
+        :type executor: ProcessPoolExecutor
+        :param quotient: the quotient of the PTA
+        :type quotient: Quotient
+        :param qb: State with colour blue
+        :type qb: int
+        :param red: Red states in the order they should be tried
+        :type red: List[int]
+        :return: The score and red state of every compatible
+                 merge, in the order of the red states.
+        :rtype: List[Tuple[int, int]]
+        """
+        payload = pickle.dumps((quotient, self._alphabet),
+                               protocol=pickle.HIGHEST_PROTOCOL)
+
+        chunk_size = -(-len(red) // self._workers)
+        futures = [
+            executor.submit(_score_merges_in_worker, payload, qb, red[i:i + chunk_size])
+            for i in range(0, len(red), chunk_size)
+        ]
+
+        return [score for future in futures for score in future.result()]
+
+
+def _score_merges_in_worker(payload: bytes, qb: int, red: List[int]) -> List[Tuple[int, int]]:
+    """
+    Runs in a worker process and scores the merges of
+    the blue state qb with the given red states.
+
+    :param payload: The pickled quotient and alphabet
+                    of the learner.
+    :type payload: bytes
+    :param qb: State with colour blue
+    :type qb: int
+    :param red: Red states in the order they should be tried
+    :type red: List[int]
+    :return: The score and red state of every compatible merge
+    :rtype: List[Tuple[int, int]]
+    """
+    quotient, alphabet = pickle.loads(payload)
+
+    return EDSM(set(), set(), alphabet)._score_merges(quotient, qb, red)
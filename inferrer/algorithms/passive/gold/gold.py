@@ -74,7 +74,7 @@ class Gold(PassiveLearner):
 
         if failed:
             self._logger.info('Failed to make table complete.')
-            return automaton.build_pta(self._pos_examples, self._neg_examples)
+            return automaton.PrefixTree(self._pos_examples, self._neg_examples).to_dfa()
         else:
             self._logger.info('Successfully completed table.')
             a = self._build_automaton(ot)
@@ -84,7 +84,7 @@ class Gold(PassiveLearner):
                 return a.remove_dead_states()
             else:
                 self._logger.info('DFA and table is not consistent, building PTA from samples.')
-                return automaton.build_pta(self._pos_examples, self._neg_examples)
+                return automaton.PrefixTree(self._pos_examples, self._neg_examples).to_dfa()
 
     def _build_table(self) -> utils.ObservationTable:
         """
@@ -1,8 +1,9 @@
-import functools
-from inferrer import utils, automaton
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from inferrer import automaton
 from inferrer.algorithms.passive.passive_learner import PassiveLearner
 from inferrer.logger.logger import Logger
-from typing import Set
+from typing import Set, List, Tuple
 
 
 class RPNI(PassiveLearner):
@@ -12,7 +13,8 @@ class RPNI(PassiveLearner):
     takes place and, in the best case, returns the correct target automaton.
     """
 
-    def __init__(self, pos_examples: Set[str], neg_examples: Set[str], alphabet: Set[str]):
+    def __init__(self, pos_examples: Set[str], neg_examples: Set[str], alphabet: Set[str],
+                 workers: int=1):
         """
         :param pos_examples: Set of positive example strings
                              from the target language
@@ -24,16 +26,43 @@ class RPNI(PassiveLearner):
         :param alphabet: The alphabet (Sigma) of the target
                          regular language.
         :type alphabet: Set[str]
+        :param workers: The number of processes that try to merge
+                        a blue state with the red states at the
+                        same time. With 1 worker, the merges are
+                        tried one after the other in this process.
+        :type workers: int
         """
         super().__init__(alphabet, pos_examples, neg_examples)
 
+        if workers < 1:
+            raise ValueError('workers has to be at least 1')
+
         self._logger = Logger().get_logger()
-        self._samples = pos_examples.union(neg_examples)
+        self._workers = workers
+        self._prefix_tree = None
 
-        self._red = {automaton.State('')}
+        self._red = set()
         self._blue = set()
 
-        self._logger.info('Created Passive Learner [RPNI] instance')
+        self._logger.info('Created Passive Learner [{}] instance'.format(type(self).__name__))
+
+    @classmethod
+    def from_prefix_tree(cls, tree: automaton.PrefixTree, **kwargs):
+        """
+        Creates a learner for the sample stored in the given
+        prefix tree acceptor, so that the example strings do
+        not have to be kept in sets as well.
+
+        :param tree: Prefix tree acceptor of the sample
+        :type tree: PrefixTree
+        :param kwargs: Other arguments of the learner
+        :return: The learner
+        :rtype: RPNI
+        """
+        learner = cls(set(), set(), tree.alphabet, **kwargs)
+        learner._prefix_tree = tree
+
+        return learner
 
     def learn(self) -> automaton.DFA:
         """
@@ -51,180 +80,219 @@ class RPNI(PassiveLearner):
                                                          self._neg_examples))
 
         self._logger.info('Building PTA')
-        dfa = automaton.build_pta(self._pos_examples)
+        quotient = automaton.Quotient(self._build_prefix_tree())
 
-        pref_set = utils.prefix_set(self._pos_examples)
-        self._blue = {automaton.State(i) for i in self._alphabet.intersection(pref_set)}
+        self._red = {quotient.start}
+        self._blue = set()
+        self._update_blue(quotient)
+
+        executor = None
+        if self._workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self._workers,
+                                           initializer=_initialise_worker)
+
+        try:
+            while len(self._blue) != 0:
+                qb = min(self._blue)
+                self._blue.remove(qb)
+
+                red = sorted(self._red)
+                if executor is not None and len(red) > 1:
+                    qr = self._find_compatible_red_parallel(executor, quotient, qb, red)
+                    if qr is not None:
+                        self._merge(quotient, qr, qb)
+                else:
+                    qr = self._find_compatible_red(quotient, qb, red)
 
-        while len(self._blue) != 0:
-            qb = _choose(self._blue)
-            self._blue.remove(qb)
+                if qr is None:
+                    self._promote(qb, quotient)
+                else:
+                    self._update_blue(quotient)
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
-            found = False
-            for qr in sorted(self._red, key=functools.cmp_to_key(_cmp)):
-                if self._compatible(self._merge(dfa.copy(), qr, qb)):
-                    dfa = self._merge(dfa, qr, qb)
-                    new_blue_states = set()
-                    for q in self._red:
-                        for a in self._alphabet:
-                            if dfa.transition_exists(q, a) and \
-                                    dfa.transition(q, a) not in self._red:
-                                new_blue_states.add(dfa.transition(q, a))
+        return quotient.to_dfa()
 
-                    self._blue.update(new_blue_states)
-                    found = True
+    def _build_prefix_tree(self) -> automaton.PrefixTree:
+        """
+        Gets the prefix tree acceptor of the sample, which is
+        built from the sets of example strings if the learner
+        was not created from a prefix tree.
 
-            if not found:
-                dfa = self._promote(qb, dfa)
+        :return: Prefix tree acceptor of the sample
+        :rtype: PrefixTree
+        """
+        tree = self._prefix_tree
+        if tree is None:
+            tree = automaton.PrefixTree(self._pos_examples, self._neg_examples)
 
-        for s in self._neg_examples:
-            q, accepted = dfa.parse_string(s)
-            if not accepted:
-                dfa.reject_states.add(q)
+        self._logger.info('Built PTA with {} nodes'.format(len(tree)))
 
-        return dfa.remove_dead_states()
+        return tree
 
-    def _promote(self, qu: automaton.State, dfa: automaton.DFA) -> automaton.DFA:
+    def _find_compatible_red(self, quotient: automaton.Quotient,
+                             qb: int, red: List[int]) -> int:
         """
-        Given a state blue state qu, this method promotes this state
-        ro red and all the successors in the dfa. The method returns
-        the updated dfa.
-
-        :param qu: State with colour blue
-        :type qu: State
-        :param dfa: the dfa
-        :type dfa: Automaton
-        :return: Updated dfa
-        :rtype: Automaton
+        Tries to merge the blue state qb with the given red
+        states in order. The first compatible merge is kept
+        and the incompatible ones are rolled back.
+
+        :param quotient: the quotient of the PTA
+        :type quotient: Quotient
+        :param qb: State with colour blue
+        :type qb: int
+        :param red: Red states in the order they should be tried
+        :type red: List[int]
+        :return: The red state qb was merged with, or None
+                 if qb is not compatible with any red state.
+        :rtype: int
         """
-        self._logger.info('Promoting state {} from blue to red'.format(qu.name))
-        self._red.add(qu)
+        for qr in red:
+            journal = []
+            if self._merge(quotient, qr, qb, journal):
+                return qr
 
-        self._blue.update({
-            dfa.transition(qu, a) for a in self._alphabet if dfa.transition_exists(qu, a)
-        })
-        self._blue.discard(qu)
+            quotient.rollback(journal)
 
-        return dfa
+        return None
 
-    def _compatible(self, dfa: automaton.DFA) -> bool:
+    def _find_compatible_red_parallel(self, executor: ProcessPoolExecutor,
+                                      quotient: automaton.Quotient,
+                                      qb: int, red: List[int]) -> int:
         """
-        Determines whether the current automaton can parse any
-        string in the set of negative example strings.
-        Returns True if the current automaton cannot parse
-        any string from the negative examples, returns False
-        if some counter-example is accepted by the current
-        automaton.
-
-        :param dfa: the dfa
-        :type dfa: Automaton
-        :return: Boolean indicating whether the dfa is compatible.
-        :rtype: bool
+        Finds the first of the given red states that the blue
+        state qb can be merged with, by splitting the red states
+        into one contiguous chunk per worker. The quotient is
+        pickled once and every worker receives it once per round.
+        The quotient itself is not modified.
+
+        :param executor: Pool of worker processes
+        :type executor: ProcessPoolExecutor
+        :param quotient: the quotient of the PTA
+        :type quotient: Quotient
+        :param qb: State with colour blue
+        :type qb: int
+        :param red: Red states in the order they should be tried
+        :type red: List[int]
+        :return: The first compatible red state, or None if qb
+                 is not compatible with any red state.
+        :rtype: int
         """
-        return not any(dfa.parse_string(w)[1] for w in self._neg_examples)
+        payload = pickle.dumps((quotient, self._alphabet, self._red),
+                               protocol=pickle.HIGHEST_PROTOCOL)
 
-    def _merge(self, dfa: automaton.DFA,
-               q: automaton.State,
-               q_prime: automaton.State) -> automaton.DFA:
-        """
-        Takes as arguments a red state q and a blue state q'.
-        The method first finds the unique pair (qf, a) such
-        that q' = delta(qf, a).
-        The method then redirects delta(qf, a) to q. After that
-        the tree rooted in q' is folded into the rest of the DFA.
-        The possible intermediate situations of non-determinism
-        are dealt with during the recursive calls to fold.
+        chunk_size = -(-len(red) // self._workers)
+        futures = [
+            executor.submit(_find_compatible_red_in_worker, payload, qb, red[i:i + chunk_size])
+            for i in range(0, len(red), chunk_size)
+        ]
 
-        :param dfa: the automaton to update with a merge
-        :type dfa: Automaton
-        :param q: State from the red set
-        :type q: State
-        :param q_prime: State from the blue
-        :type q_prime: State
-        :return: updated Automaton
-        :rtype: Automaton
-        """
-        self._logger.info('Merging the two states {} and {}'.format(q.name,
-                                                                    q_prime.name))
-        qf, a = dfa.find_transition_to_q(q_prime)
+        qr = None
+        for future in futures:
+            if qr is not None:
+                future.cancel()
+            else:
+                qr = future.result()
 
-        if qf is None or a is None:
-            return dfa
+        return qr
 
-        dfa.add_transition(qf, q, a)
+    def _update_blue(self, quotient: automaton.Quotient):
+        """
+        Adds all of the successors of the red states that
+        are not red themselves to the set of blue states.
 
-        return self._fold(dfa, q, q_prime)
+        :param quotient: the quotient of the PTA
+        :type quotient: Quotient
+        """
+        for q in self._red:
+            for a in self._alphabet:
+                q2 = quotient.transition(q, a)
+                if q2 is not None and q2 not in self._red:
+                    self._blue.add(q2)
 
-    def _fold(self, dfa: automaton.DFA,
-              q: automaton.State,
-              q_prime: automaton.State) -> automaton.DFA:
+    def _promote(self, qu: int, quotient: automaton.Quotient):
         """
-        Folds the tree rooted in q' into the rest of the DFA. The
-        possible intermediate situations of non-determinism
-        are dealt with during the recursive calls.
+        Given a state blue state qu, this method promotes this state
+        ro red and all the successors in the quotient.
 
-        :param dfa: the automaton to update with a folding of states
-        :type dfa: Automaton
-        :param q: State
-        :type q: State
-        :param q_prime: State to fold
-        :type q_prime: State
-        :return: updated Automaton
-        :rtype: Automaton
+        :param qu: State with colour blue
+        :type qu: int
+        :param quotient: the quotient of the PTA
+        :type quotient: Quotient
         """
-        self._logger.info('Folding the tree rooted in the state {}'.format(q_prime.name))
-        if q_prime in dfa.accept_states:
-            dfa.accept_states.add(q)
+        self._logger.info('Promoting state {} from blue to red'
+                          .format(quotient.state(qu).name))
+        self._red.add(qu)
 
         for a in self._alphabet:
-            if dfa.transition_exists(q_prime, a):
-                if dfa.transition_exists(q, a):
-                    dfa = self._fold(dfa, dfa.transition(q, a),
-                                     dfa.transition(q_prime, a))
-                else:
-                    dfa.add_transition(q, dfa.transition(q_prime, a), a)
+            q2 = quotient.transition(qu, a)
+            if q2 is not None:
+                self._blue.add(q2)
+        self._blue.discard(qu)
 
-        return dfa
+    def _merge(self, quotient: automaton.Quotient,
+               q: int, q_prime: int,
+               journal: List[Tuple]=None) -> bool:
+        """
+        Takes as arguments a red state q and a blue state q'
+        and merges the block of q' into the block of q. This
+        redirects the transition into q' to q, after which the
+        tree rooted in q' is folded into the rest of the
+        quotient.
+
+        The merge fails as soon as the fold joins an accepting
+        and a rejecting state, since the merged automaton would
+        then accept a negative example string. If a journal is
+        given, every change made to the quotient is recorded in
+        it, so that the merge can be undone with rollback.
+
+        :param quotient: the quotient of the PTA
+        :type quotient: Quotient
+        :param q: State from the red set
+        :type q: int
+        :param q_prime: State from the blue set
+        :type q_prime: int
+        :param journal: Log of the changes made to the quotient
+        :type journal: List[Tuple]
+        :return: Whether the merge is compatible with the
+                 negative example strings.
+        :rtype: bool
+        """
+        self._logger.info('Merging the two states {} and {}'
+                          .format(quotient.state(q).name, quotient.state(q_prime).name))
 
+        return quotient.merge(q, q_prime, journal)
 
-def _choose(blue: Set[automaton.State]) -> automaton.State:
+
+def _initialise_worker():
     """
-    A deterministic function that chooses one of the
-    elements in the given blue set. It does so by
-    choosing the minimal <u, a> in lexicographic order.
-
-    :param blue: Set of blue states
-    :type blue: Set[State]
-    :return: One of the elements in the given blue set
-    :rtype: State
+    Disables logging in the worker processes of RPNI, since
+    they only try out merges that are redone and logged by
+    the learner if they are chosen.
     """
-    return min(blue, key=functools.cmp_to_key(_cmp))
+    Logger().get_logger().disabled = True
 
 
-def _cmp(q1: automaton.State, q2: automaton.State) -> int:
+def _find_compatible_red_in_worker(payload: bytes, qb: int, red: List[int]) -> int:
     """
-    Compares two states by comparing the
-    name (string value of the state). If the
-    two strings have the same length, then the
-    two strings are compared lexicographically.
-
-    :param q1: state 1
-    :type q1: State
-    :param q2: state 2
-    :type q2: State
-    :return: 1 of a is greater than b, 0 if a
-             is equal to b and -1 if a is less
-             than b.
+    Runs in a worker process and tries to merge the blue
+    state qb with the given red states in order.
+
+    :param payload: The pickled quotient, alphabet and set
+                    of red states of the learner.
+    :type payload: bytes
+    :param qb: State with colour blue
+    :type qb: int
+    :param red: Red states in the order they should be tried
+    :type red: List[int]
+    :return: The first compatible red state, or None
     :rtype: int
     """
-    if len(q1.name) == len(q2.name):
-        if q1.name > q2.name:
-            return 1
-        elif q1.name < q2.name:
-            return -1
-        else:
-            return 0
-    elif len(q1.name) > len(q2.name):
-        return 1
-    else:
-        return -1
+    quotient, alphabet, red_states = pickle.loads(payload)
+
+    learner = RPNI(set(), set(), alphabet)
+    learner._red = red_states
+
+    return learner._find_compatible_red(quotient, qb, red)
+
@@ -1,5 +1,8 @@
 from inferrer.automaton.state import State
 from inferrer.automaton.dfa import DFA
 from inferrer.automaton.nfa import NFA
+from inferrer.automaton.compact_dfa import CompactDFA
 from inferrer.automaton.dfa import build_pta
+from inferrer.automaton.prefix_tree import PrefixTree
+from inferrer.automaton.quotient import Quotient
 from inferrer.automaton.fsa import FSA
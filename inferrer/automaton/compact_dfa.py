@@ -0,0 +1,402 @@
+from array import array
+from inferrer.automaton.state import State
+from inferrer.automaton.fsa import FSA
+from inferrer.automaton.dfa import DFA
+from typing import Set, Tuple, List, Iterable
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class CompactDFA(FSA):
+    """
+    Implements a deterministic finite automaton with a
+    compact, array-backed representation. States are
+    dense integer ids, the symbols of the alphabet are
+    interned to integer indices and the transition function
+    is stored in a flat array, where delta(q, a) is found at
+    index q * |alphabet| + index(a). Undefined transitions
+    point to the SINK sentinel.
+    """
+
+    SINK = -1
+
+    def __init__(self, alphabet: Set[str], num_states: int=1, start_state: int=0):
+        """
+        :param alphabet: The alphabet of the regular language
+        :type alphabet: set
+        :param num_states: The number of states in the dfa
+        :type num_states: int
+        :param start_state: The id of the initial state
+        :type start_state: int
+        """
+        super().__init__(alphabet)
+
+        if not 0 <= start_state < num_states:
+            raise ValueError('The start state has to be one of the {} states!'
+                             .format(num_states))
+
+        self._symbols = sorted(alphabet)
+        self._symbol_index = {a: i for i, a in enumerate(self._symbols)}
+
+        self._num_states = num_states
+        self._start_state = start_state
+
+        self._names = [str(i) for i in range(num_states)]
+        self._accepting = bytearray(num_states)
+        self._rejecting = bytearray(num_states)
+
+        self._table = array('i', [CompactDFA.SINK]) * (num_states * len(self._symbols))
+        self._gather_table = None
+
+    @property
+    def num_states(self) -> int:
+        return self._num_states
+
+    @property
+    def start_state(self) -> int:
+        return self._start_state
+
+    @property
+    def symbols(self) -> List[str]:
+        return self._symbols
+
+    @property
+    def symbol_index(self) -> dict:
+        return self._symbol_index
+
+    @property
+    def table(self) -> array:
+        return self._table
+
+    @property
+    def accepting(self) -> bytearray:
+        return self._accepting
+
+    def add_transition(self, q1: int, q2: int, a: str):
+        """
+        Adds the transition, delta(q1, a) = q2 to the
+        transition table.
+
+        :param q1: id of the from state
+        :type q1: int
+        :param q2: id of the to state
+        :type q2: int
+        :param a: letter in alphabet
+        :type a: str
+        """
+        if a not in self._symbol_index:
+            raise ValueError('\'{}\' is not in the alphabet of the dfa!'.format(a))
+
+        self._table[q1 * len(self._symbols) + self._symbol_index[a]] = q2
+        self._gather_table = None
+
+    def transition(self, q1: int, a: str) -> int:
+        """
+        Performs the transition delta(q1, a) and
+        then returns the id of the state reached
+        after the transition, or SINK if the
+        transition is not defined.
+
+        :param q1: id of the from state
+        :type q1: int
+        :param a: letter in alphabet
+        :type a: str
+        :return: id of the to state
+        :rtype: int
+        """
+        i = self._symbol_index.get(a)
+        if i is None:
+            return CompactDFA.SINK
+        return self._table[q1 * len(self._symbols) + i]
+
+    def set_accepting(self, q: int, accepting: bool=True):
+        """
+        Marks the state q as an accepting state.
+
+        :param q: id of the state
+        :type q: int
+        :param accepting: Whether q accepts
+        :type accepting: bool
+        """
+        self._accepting[q] = accepting
+
+    def set_rejecting(self, q: int, rejecting: bool=True):
+        """
+        Marks the state q as a rejecting state.
+
+        :param q: id of the state
+        :type q: int
+        :param rejecting: Whether q rejects
+        :type rejecting: bool
+        """
+        self._rejecting[q] = rejecting
+
+    def run(self, s: str) -> Tuple[int, bool]:
+        """
+        Runs the string s through the dfa.
+
+        :param s: The string to parse (s element of alphabet*)
+        :type s: str
+        :return: The id of the last state reached and whether
+                 the whole string could be read.
+        :rtype: tuple(int, bool)
+        """
+        table = self._table
+        index = self._symbol_index
+        k = len(self._symbols)
+        sink = CompactDFA.SINK
+
+        q = self._start_state
+        for letter in s:
+            i = index.get(letter)
+            if i is None:
+                return q, False
+            to_state = table[q * k + i]
+            if to_state == sink:
+                return q, False
+            q = to_state
+
+        return q, True
+
+    def accepts(self, s: str) -> bool:
+        """
+        Determines whether the dfa accepts the string s.
+
+        :param s: The string to parse (s element of alphabet*)
+        :type s: str
+        :return: Whether s is accepted.
+        :rtype: bool
+        """
+        q, complete = self.run(s)
+        return complete and self._accepting[q] == 1
+
+    def accepts_many(self, strings: Iterable[str]) -> List[bool]:
+        """
+        Determines for each of the given strings whether
+        the dfa accepts it. If NumPy is installed, all of
+        the strings are encoded into one padded matrix and
+        advanced through the dfa together, one symbol per
+        step, see accepts_encoded.
+
+        :param strings: The strings to parse
+        :type strings: Iterable[str]
+        :return: For each string whether it is accepted.
+        :rtype: List[bool]
+        """
+        strings = list(strings)
+        if numpy is None:
+            return [self.accepts(s) for s in strings]
+
+        words, lengths = self.encode_many(strings)
+        return self.accepts_encoded(words, lengths).tolist()
+
+    def encode_many(self, strings: List[str]):
+        """
+        Encodes the strings as a padded matrix of symbol
+        indices, with one row per string. Symbols that
+        are not in the alphabet and the padding after the
+        end of a string are encoded as -1.
+
+        :param strings: The strings to encode
+        :type strings: List[str]
+        :return: The matrix and the length of every string
+        :rtype: tuple(numpy.ndarray, numpy.ndarray)
+        """
+        _require_numpy()
+
+        lengths = numpy.fromiter(map(len, strings), dtype=numpy.int64, count=len(strings))
+        width = int(lengths.max()) if len(strings) > 0 else 0
+        words = numpy.full((len(strings), width), -1, dtype=numpy.int64)
+
+        if len(self._symbols) == 0:
+            return words, lengths
+
+        if all(len(a) == 1 for a in self._symbols):
+            # self._symbols is sorted, so the index of a symbol
+            # is its position among the sorted code points.
+            codes = numpy.frombuffer(''.join(strings).encode('utf-32-le'), dtype='<u4')
+            alphabet = numpy.array([ord(a) for a in self._symbols], dtype='<u4')
+            position = numpy.minimum(numpy.searchsorted(alphabet, codes), len(alphabet) - 1)
+            symbols = numpy.where(alphabet[position] == codes, position, -1)
+        else:
+            index = self._symbol_index
+            symbols = numpy.array([index.get(letter, -1) for s in strings for letter in s],
+                                  dtype=numpy.int64)
+
+        words[numpy.arange(width) < lengths[:, None]] = symbols
+
+        return words, lengths
+
+    def accepts_encoded(self, words, lengths):
+        """
+        Determines for each row of the padded matrix of
+        symbol indices whether the dfa accepts the string
+        made up of the first lengths[i] symbols of row i.
+        All of the strings are advanced one symbol per step
+        with a single gather from the transition table.
+        Negative or out of range symbol indices lead to
+        a dead state.
+
+        :param words: Matrix of symbol indices, one row
+                      per string.
+        :type words: numpy.ndarray
+        :param lengths: The length of every string
+        :type lengths: numpy.ndarray
+        :return: Boolean array indicating for every row
+                 whether it is accepted.
+        :rtype: numpy.ndarray
+        """
+        _require_numpy()
+
+        words = numpy.asarray(words, dtype=numpy.int64)
+        lengths = numpy.asarray(lengths, dtype=numpy.int64)
+        if words.ndim != 2 or lengths.shape != (words.shape[0],):
+            raise ValueError('words has to be a matrix with one row per entry in lengths!')
+
+        k = len(self._symbols)
+        table = self._numpy_table()
+
+        accepting = numpy.zeros(self._num_states + 1, dtype=bool)
+        accepting[:-1] = numpy.frombuffer(self._accepting, dtype=numpy.uint8) == 1
+
+        words = numpy.where((words < 0) | (words >= k), k, words)
+
+        # Longest strings first, so that the strings still being
+        # read at step t are always the first rows.
+        order = numpy.argsort(-lengths, kind='stable')
+        words = words[order]
+        remaining = numpy.searchsorted(-lengths[order], -numpy.arange(words.shape[1]), side='left')
+
+        q = numpy.full(len(lengths), self._start_state, dtype=numpy.int64)
+        for t in range(words.shape[1]):
+            n = remaining[t]
+            if n == 0:
+                break
+            q[:n] = table[q[:n], words[:n, t]]
+
+        accepted = numpy.empty(len(lengths), dtype=bool)
+        accepted[order] = accepting[q]
+
+        return accepted
+
+    def parse_string(self, s: str) -> Tuple[State, bool]:
+        """
+        Parses each character of the input string through
+        the dfa.
+
+        :param s: The string to parse (s element of alphabet*)
+        :type s: str
+        :return: The state after reading the string s and whether
+                 the dfa accepted the input string.
+        :rtype: tuple(State, bool)
+        """
+        q, complete = self.run(s)
+        return State(self._names[q]), complete and self._accepting[q] == 1
+
+    def _numpy_table(self):
+        """
+        Gets the transition table as a NumPy matrix for
+        accepts_encoded. The matrix is built once and kept
+        until the next call to add_transition.
+
+        :return: The transition table with an extra row for
+                 a dead state, which is also the target of
+                 undefined transitions, and an extra column
+                 for symbols outside of the alphabet.
+        :rtype: numpy.ndarray
+        """
+        if self._gather_table is None:
+            k = len(self._symbols)
+            dead = self._num_states
+
+            table = numpy.full((self._num_states + 1, k + 1), dead, dtype=numpy.int64)
+            table[:-1, :-1] = numpy.frombuffer(self._table, dtype=numpy.intc).reshape(self._num_states, k)
+            table[table == CompactDFA.SINK] = dead
+
+            self._gather_table = table
+
+        return self._gather_table
+
+    @classmethod
+    def from_dfa(cls, dfa: DFA):
+        """
+        Builds the compact representation of the given dfa.
+        The initial state gets id 0, the other states are
+        numbered in order of their names.
+
+        :param dfa: The dfa to convert
+        :type dfa: DFA
+        :return: The equivalent compact dfa
+        :rtype: CompactDFA
+        """
+        start = dfa._start_state
+        states = [start] + sorted(dfa.states - {start})
+        state_to_id = {q: i for i, q in enumerate(states)}
+
+        compact = cls(dfa.alphabet, len(states))
+        compact._names = [q.name for q in states]
+
+        table = compact._table
+        index = compact._symbol_index
+        k = len(compact._symbols)
+
+        for q, i in state_to_id.items():
+            if q in dfa._transitions:
+                row = i * k
+                for a, to_state in dfa._transitions[q].items():
+                    j = state_to_id.get(to_state)
+                    if j is not None:
+                        table[row + index[a]] = j
+
+            if q in dfa.accept_states:
+                compact._accepting[i] = 1
+            if q in dfa.reject_states:
+                compact._rejecting[i] = 1
+
+        return compact
+
+    def to_dfa(self) -> DFA:
+        """
+        Converts the compact dfa back to a DFA
+        made up of State objects.
+
+        :return: The equivalent dfa
+        :rtype: DFA
+        """
+        states = [State(name) for name in self._names]
+        dfa = DFA(self.alphabet, states[self._start_state])
+
+        dfa.states.update(states)
+
+        k = len(self._symbols)
+        for i, q in enumerate(states):
+            for j, a in enumerate(self._symbols):
+                to_state = self._table[i * k + j]
+                if to_state != CompactDFA.SINK:
+                    dfa.add_transition(q, states[to_state], a)
+
+            if self._accepting[i]:
+                dfa.accept_states.add(q)
+            if self._rejecting[i]:
+                dfa.reject_states.add(q)
+
+        return dfa
+
+    def __str__(self):
+        """
+        ToString implementation for the class, only used
+        for debugging purposes.
+
+        :return: String representation of the dfa
+        :rtype: str
+        """
+        return str(self.to_dfa())
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError('NumPy is required for the encoded batch interface of CompactDFA, '
+                          'install it with: pip install numpy')
@@ -5,7 +5,7 @@ from inferrer import utils
 from inferrer.automaton.state import State
 from inferrer.automaton.fsa import FSA
 from collections import defaultdict, OrderedDict, deque
-from typing import Set, Tuple, List, Generator
+from typing import Set, Tuple, List, Generator, Iterable
 
 
 
@@ -33,6 +33,8 @@ class DFA(FSA):
 
         self._transitions = defaultdict(OrderedDict)
 
+        self._predecessors = defaultdict(set)
+
     def parse_string(self, s: str) -> Tuple[State, bool]:
         """
         Parses each character of the input string through
@@ -52,6 +54,20 @@ class DFA(FSA):
 
         return q, q in self.accept_states
 
+    def accepts_many(self, strings: Iterable[str]) -> List[bool]:
+        """
+        Determines for each of the given strings whether
+        the dfa accepts it. The dfa is converted to a
+        CompactDFA once, which then parses all of the strings.
+
+        :param strings: The strings to parse
+        :type strings: Iterable[str]
+        :return: For each string whether it is accepted.
+        :rtype: List[bool]
+        """
+        from inferrer.automaton.compact_dfa import CompactDFA
+        return CompactDFA.from_dfa(self).accepts_many(strings)
+
     def add_transition(self, q1: State, q2: State, a: str):
         """
         Adds the transition, delta(q1, a) = q2 to the
@@ -68,7 +84,50 @@ class DFA(FSA):
             raise ValueError('\'{}\' is not in the alphabet of the dfa!'.format(a))
 
         self.states.update({q1, q2})
+
+        previous = self._transitions[q1].get(a)
+        if previous is not None:
+            self._remove_predecessor(previous, a, q1)
+
         self._transitions[q1][a] = q2
+        self._predecessors[q2, a].add(q1)
+
+    def remove_transition(self, q1: State, a: str):
+        """
+        Removes the transition delta(q1, a) from the
+        transition table, if it is defined.
+
+        :param q1: from state
+        :type q1: automaton.State
+        :param a: letter in alphabet
+        :type a: str
+        """
+        if q1 not in self._transitions or a not in self._transitions[q1]:
+            return
+
+        to_state = self._transitions[q1].pop(a)
+        self._remove_predecessor(to_state, a, q1)
+
+        if len(self._transitions[q1]) == 0:
+            del self._transitions[q1]
+
+    def _remove_predecessor(self, q: State, a: str, qf: State):
+        """
+        Removes qf from the set of states that reach
+        q on the symbol a.
+
+        :param q: to state
+        :type q: automaton.State
+        :param a: letter in alphabet
+        :type a: str
+        :param qf: from state
+        :type qf: automaton.State
+        """
+        predecessors = self._predecessors.get((q, a))
+        if predecessors is not None:
+            predecessors.discard(qf)
+            if len(predecessors) == 0:
+                del self._predecessors[q, a]
 
     def transition_exists(self, q1: State, a: str) -> bool:
         """
@@ -134,10 +193,10 @@ class DFA(FSA):
         :return: The state and whether or not the transition exists
         :rtype: tuple(State, str)
         """
-        for qf in self._transitions.keys():
-            for letter, to_state in self._transitions[qf].items():
-                if to_state == q:
-                    return qf, letter
+        for letter in sorted(self.alphabet):
+            predecessors = self._predecessors.get((q, letter))
+            if predecessors:
+                return min(predecessors), letter
         return None, None
 
     def find_transitions_to_q_with_letter(self, q: State, a: str) -> Set[State]:
@@ -153,12 +212,263 @@ class DFA(FSA):
         :return: The set of states
         :rtype: Set[State]
         """
-        states = set()
-        for qf in self._transitions.keys():
-            for letter, to_state in self._transitions[qf].items():
-                if to_state == q and letter == a:
-                    states.add(qf)
-        return states
+        return set(self._predecessors.get((q, a), ()))
+
+    def find_distinguishing_word(self, other) -> str:
+        """
+        Finds a shortest word that is accepted by exactly one
+        of the two dfas, see _find_product_word. Of all the
+        shortest words, the smallest one in lexicographic
+        order is found.
+
+        :param other: dfa to compare to instance
+        :type other: DFA
+        :return: The distinguishing word, or None if the
+                 two dfas accept the same language.
+        :rtype: str
+        """
+        return self._find_product_word(other, lambda a, b: a != b)
+
+    def intersection(self, other):
+        """
+        Builds the product dfa that accepts the strings
+        accepted by both dfas.
+
+        :param other: The other dfa
+        :type other: DFA
+        :return: The intersection of the two dfas
+        :rtype: DFA
+        """
+        return self._product(other, lambda a, b: a and b)
+
+    def union(self, other):
+        """
+        Builds the product dfa that accepts the strings
+        accepted by at least one of the dfas.
+
+        :param other: The other dfa
+        :type other: DFA
+        :return: The union of the two dfas
+        :rtype: DFA
+        """
+        return self._product(other, lambda a, b: a or b)
+
+    def difference(self, other):
+        """
+        Builds the product dfa that accepts the strings
+        accepted by this dfa, but not by the other dfa.
+
+        :param other: The other dfa
+        :type other: DFA
+        :return: The difference of the two dfas
+        :rtype: DFA
+        """
+        return self._product(other, lambda a, b: a and not b)
+
+    def complement(self, alphabet: Set[str]=None):
+        """
+        Builds the dfa that accepts the strings over the
+        alphabet that this dfa rejects. Missing transitions
+        are completed with a sink state, which then accepts.
+
+        :param alphabet: The alphabet of the complement, by
+                         default the alphabet of the dfa.
+        :type alphabet: Set[str]
+        :return: The complement of the dfa
+        :rtype: DFA
+        """
+        alphabet = self.alphabet if alphabet is None else alphabet
+
+        return self._product(DFA(set(alphabet)), lambda a, b: not a, alphabet)
+
+    def is_empty(self) -> bool:
+        """
+        Determines whether the dfa accepts no string at
+        all, by searching for an accepting state that can
+        be reached from the initial state.
+
+        :return: Whether the language of the dfa is empty
+        :rtype: bool
+        """
+        return self._find_product_word(DFA(self.alphabet), lambda a, b: a) is None
+
+    def is_subset(self, other) -> bool:
+        """
+        Determines whether every string accepted by this dfa
+        is accepted by the other dfa as well, by searching
+        the product of the two dfas for a string accepted by
+        this dfa only. The search stops at the first such
+        string, so the product is only explored as far as
+        needed.
+
+        :param other: The other dfa
+        :type other: DFA
+        :return: Whether the language of this dfa is a
+                 subset of the language of the other dfa.
+        :rtype: bool
+        """
+        return self._find_product_word(other, lambda a, b: a and not b) is None
+
+    def _find_product_word(self, other, accept) -> str:
+        """
+        Finds a shortest word on which the two dfas reach a
+        pair of states that the product with the given accept
+        function accepts, by a breadth-first search over the
+        pairs of states that can be reached in the product.
+        The product is never built, and the search stops at
+        the first accepting pair.
+
+        A missing transition leads to a rejecting sink state,
+        represented by None. The pair in which both dfas are
+        in the sink is only explored if it is accepting.
+
+        :param other: The other dfa
+        :type other: DFA
+        :param accept: Whether a pair of states is accepting,
+                       given whether each of the two states is
+                       accepting.
+        :type accept: Callable[[bool, bool], bool]
+        :return: The word, or None if no accepting pair can
+                 be reached.
+        :rtype: str
+        """
+        alphabet = sorted(self.alphabet | other.alphabet)
+        sink = None, None
+        explore_sink = accept(False, False)
+
+        start = self._start_state, other._start_state
+        parents = {start: None}
+        queue = deque([start])
+
+        while len(queue) > 0:
+            pair = queue.popleft()
+            q1, q2 = pair
+
+            if accept(q1 in self.accept_states, q2 in other.accept_states):
+                word = []
+                while parents[pair] is not None:
+                    pair, a = parents[pair]
+                    word.append(a)
+
+                return ''.join(reversed(word))
+
+            transitions1 = self._transitions.get(q1, {})
+            transitions2 = other._transitions.get(q2, {})
+            for a in alphabet:
+                next_pair = transitions1.get(a), transitions2.get(a)
+                if next_pair not in parents and (explore_sink or next_pair != sink):
+                    parents[next_pair] = pair, a
+                    queue.append(next_pair)
+
+        return None
+
+    def _product(self, other, accept, alphabet: Set[str]=None):
+        """
+        Builds the product of the two dfas, with only the pairs
+        of states that can be reached from the pair of initial
+        states. The states of the product are numbered in the
+        order in which they are found. A missing transition
+        leads to a rejecting sink state, and the pair in which
+        both dfas are in the sink is left out of the product
+        if it is rejecting.
+
+        :param other: The other dfa
+        :type other: DFA
+        :param accept: Whether a pair of states is accepting,
+                       given whether each of the two states is
+                       accepting.
+        :type accept: Callable[[bool, bool], bool]
+        :param alphabet: The alphabet of the product, by default
+                         the union of the alphabets of the dfas.
+        :type alphabet: Set[str]
+        :return: The product dfa
+        :rtype: DFA
+        """
+        alphabet = self.alphabet | other.alphabet if alphabet is None else set(alphabet)
+        symbols = sorted(alphabet)
+        sink = None, None
+        keep_sink = accept(False, False)
+
+        start = self._start_state, other._start_state
+        states = {start: State('0')}
+        queue = deque([start])
+        product = DFA(alphabet, states[start])
+
+        while len(queue) > 0:
+            pair = queue.popleft()
+            q1, q2 = pair
+            state = states[pair]
+
+            if accept(q1 in self.accept_states, q2 in other.accept_states):
+                product.accept_states.add(state)
+
+            transitions1 = self._transitions.get(q1, {})
+            transitions2 = other._transitions.get(q2, {})
+            for a in symbols:
+                next_pair = transitions1.get(a), transitions2.get(a)
+                if next_pair == sink and not keep_sink:
+                    continue
+
+                if next_pair not in states:
+                    states[next_pair] = State(str(len(states)))
+                    queue.append(next_pair)
+                product.add_transition(state, states[next_pair], a)
+
+        return product
+
+    def is_equivalent(self, other) -> bool:
+        """
+        Determines whether the two dfas accept the same
+        language with the algorithm of Hopcroft and Karp.
+        The start states of the two dfas are assumed to be
+        equivalent, and every pair of states that is assumed
+        to be equivalent merges the blocks of the two states
+        in a union-find forest and assumes the pairs of their
+        successors to be equivalent, until the blocks are
+        stable or a block holds both an accepting and a
+        rejecting state. This takes near-linear time in the
+        total number of states.
+
+        :param other: dfa to compare to instance
+        :type other: DFA
+        :return: Whether the dfas accept the same language.
+        :rtype: bool
+        """
+        alphabet = self.alphabet | other.alphabet
+        dfas = self, other
+        parent = {}
+
+        def find(q: Tuple) -> Tuple:
+            root = q
+            while parent.get(root, root) != root:
+                root = parent[root]
+            while q != root:
+                parent[q], q = root, parent[q]
+            return root
+
+        def accepts(q: Tuple) -> bool:
+            return q[1] is not None and q[1] in dfas[q[0]].accept_states
+
+        def successor(q: Tuple, a: str) -> Tuple:
+            if q[1] is None:
+                return q
+            return q[0], dfas[q[0]]._transitions.get(q[1], {}).get(a)
+
+        stack = [((0, self._start_state), (1, other._start_state))]
+        while len(stack) > 0:
+            q1, q2 = stack.pop()
+            r1, r2 = find(q1), find(q2)
+            if r1 == r2:
+                continue
+
+            if accepts(q1) != accepts(q2):
+                return False
+
+            parent[r2] = r1
+            for a in alphabet:
+                stack.append((successor(q1, a), successor(q2, a)))
+
+        return True
 
     def minimize(self):
         """
@@ -172,64 +482,157 @@ class DFA(FSA):
         """
         p = self._hopcroft()
 
-        start = [state_set for state_set in p if self._start_state in state_set]
-        assert len(start) == 1
+        block_of = {}
+        for i, state_set in enumerate(p):
+            for state in state_set:
+                block_of[state] = i
+
+        minimized_dfa = DFA(self.alphabet, State(str(block_of[self._start_state])))
+        for i, state_set in enumerate(p):
+            block = State(str(i))
+            minimized_dfa.states.add(block)
 
-        minimized_dfa = DFA(self.alphabet, State(''.join(map(str, start[0]))))
-        for state_set in p:
             for a in self.alphabet:
                 for state in state_set:
                     if self.transition_exists(state, a):
                         to_state = self.transition(state, a)
-                        to = [s for s in p if to_state in s]
-                        assert len(to) == 1
-
-                        to_state_set = to[0]
-                        minimized_dfa.add_transition(State(''.join(map(str, state_set))),
-                                                     State(''.join(map(str, to_state_set))),
+                        minimized_dfa.add_transition(block,
+                                                     State(str(block_of[to_state])),
                                                      a)
                         break
 
             if any(s in self.accept_states for s in state_set):
-                minimized_dfa.accept_states.add(State(''.join(map(str, state_set))))
+                minimized_dfa.accept_states.add(block)
 
         return minimized_dfa.rename_states()
 
-    def _hopcroft(self):
-        qf = self.states - self.accept_states
-        if len(self.accept_states) < len(self.states - self.accept_states):
-            p = [qf, self.accept_states]
-            l = deque([self.accept_states])
-        else:
-            p = [self.accept_states, qf]
-            l = deque([qf])
-
-        while len(l) > 0:
-            s = l.popleft()
-            for a in self.alphabet:
-                for b in p.copy():
-                    b1, b2 = self._split(b, s, a)
-                    p.remove(b)
-                    if len(b1) > 0:
-                        p.append(b1)
-                    if len(b2) > 0:
-                        p.append(b2)
-
-                    if len(b1) < len(b2):
-                        if len(b1) > 0:
-                            l.append(b1)
+    def _hopcroft(self) -> List[Set[State]]:
+        """
+        Computes the coarsest partition of the states that
+        respects the accepting states and the transition
+        function, in O(|alphabet| n log n) time.
+
+        The states are kept in a single list in which every
+        block of the partition is a contiguous segment, so that
+        a block can be split in time proportional to the number
+        of its states that are marked. Undefined transitions
+        go to a virtual sink state, which stays in a block of
+        its own that is left out of the returned partition.
+
+        :return: The blocks of the partition
+        :rtype: List[Set[State]]
+        """
+        states = sorted(self.states)
+        n = len(states)
+        sink = n
+        state_to_id = {q: i for i, q in enumerate(states)}
+
+        # Inverse transition function: the predecessors of q on
+        # symbol a are sources[a][offsets[a][q]:offsets[a][q + 1]].
+        sources = []
+        offsets = []
+        for a in self.alphabet:
+            targets = [sink] * (n + 1)
+            for i, q in enumerate(states):
+                if q in self._transitions:
+                    to_state = self._transitions[q].get(a)
+                    if to_state is not None:
+                        targets[i] = state_to_id.get(to_state, sink)
+
+            offset = [0] * (n + 2)
+            for t in targets:
+                offset[t + 1] += 1
+            for t in range(n + 1):
+                offset[t + 1] += offset[t]
+
+            position = offset[:]
+            source = [0] * (n + 1)
+            for i, t in enumerate(targets):
+                source[position[t]] = i
+                position[t] += 1
+
+            sources.append(source)
+            offsets.append(offset)
+
+        accepting = [i for i, q in enumerate(states) if q in self.accept_states]
+        rejecting = [i for i, q in enumerate(states) if q not in self.accept_states]
+
+        # The sink starts in a block of its own, so that a block
+        # never mixes states without a transition on some symbol
+        # with states whose transition on it is defined.
+        elements = accepting + rejecting + [sink]
+        location = [0] * (n + 1)
+        for i, q in enumerate(elements):
+            location[q] = i
+
+        block_of = [0] * (n + 1)
+        first = []
+        end = []
+        for part in (accepting, rejecting, [sink]):
+            if len(part) > 0:
+                for q in part:
+                    block_of[q] = len(first)
+                start = end[-1] if len(end) > 0 else 0
+                first.append(start)
+                end.append(start + len(part))
+        marked = [0] * len(first)
+
+        largest = max(range(len(first)), key=lambda b: end[b] - first[b])
+        worklist = [b for b in range(len(first)) if b != largest]
+
+        while len(worklist) > 0:
+            splitter = worklist.pop()
+            splitter_states = elements[first[splitter]:end[splitter]]
+
+            for source, offset in zip(sources, offsets):
+                touched = []
+                for q in splitter_states:
+                    for j in range(offset[q], offset[q + 1]):
+                        r = source[j]
+                        b = block_of[r]
+
+                        # Move r to the marked front of its block.
+                        i = location[r]
+                        m = first[b] + marked[b]
+                        other = elements[m]
+                        elements[i], elements[m] = other, r
+                        location[other], location[r] = i, m
+
+                        if marked[b] == 0:
+                            touched.append(b)
+                        marked[b] += 1
+
+                for b in touched:
+                    m = first[b] + marked[b]
+                    marked[b] = 0
+                    if m == end[b]:
+                        continue
+
+                    # The smaller half becomes the new block. Whether or
+                    # not b is still waiting in the worklist, adding only
+                    # the new block is enough to refine by both halves.
+                    nb = len(first)
+                    if m - first[b] <= end[b] - m:
+                        first.append(first[b])
+                        end.append(m)
+                        first[b] = m
                     else:
-                        if len(b2) > 0:
-                            l.append(b2)
-        return p
+                        first.append(m)
+                        end.append(end[b])
+                        end[b] = m
+                    marked.append(0)
 
-    def _split(self, b_prime, b, a):
-        ba = set()
-        for state in b:
-            ba.update(self.find_transitions_to_q_with_letter(state, a))
+                    for i in range(first[nb], end[nb]):
+                        block_of[elements[i]] = nb
 
-        ba_comp = ba.symmetric_difference(self.states)
-        return b_prime.intersection(ba), b_prime.intersection(ba_comp)
+                    worklist.append(nb)
+
+        p = []
+        for b in range(len(first)):
+            if b != block_of[sink]:
+                p.append({states[q] for q in elements[first[b]:end[b]]})
+
+        return p
 
     def remove_dead_states(self):
         """
@@ -319,6 +722,9 @@ class DFA(FSA):
         cp.accept_states = self.accept_states.copy()
         cp.reject_states = self.reject_states.copy()
         cp._transitions = copy.deepcopy(self._transitions)
+        cp._predecessors = defaultdict(set, {
+            k: v.copy() for k, v in self._predecessors.items()
+        })
 
         return cp
 
@@ -1,9 +1,8 @@
-from itertools import chain, combinations
 from inferrer.automaton.fsa import FSA
 from inferrer.automaton.state import State
 from inferrer.automaton.dfa import DFA
 from collections import defaultdict, OrderedDict, deque
-from typing import Set, List, Tuple
+from typing import Set, List, Tuple, Iterable
 import copy
 import graphviz
 import tempfile
@@ -26,6 +25,8 @@ class NFA(FSA):
 
         self._transitions = defaultdict(OrderedDict)
 
+        self._simulation = None
+
     def add_transition(self, q1: State, q2: State, a: str):
         """
         Adds the transition, delta(q1, a) = q2 to the
@@ -41,6 +42,8 @@ class NFA(FSA):
         if a not in self.alphabet and a != '':
             raise ValueError('\'{}\' is not in the alphabet of the nfa!'.format(a))
 
+        self._simulation = None
+
         from_map = self._transitions[q1]
 
         if a not in from_map:
@@ -66,7 +69,8 @@ class NFA(FSA):
     def parse_string(self, s: str) -> Tuple[State, bool]:
         """
         Parses each character of the input string through
-        the nfa.
+        the nfa. The set of current states is simulated as
+        a bitmask, see _BitsetSimulation.
 
         :param s: The string to parse (s element of alphabet*)
         :type s: str
@@ -74,27 +78,41 @@ class NFA(FSA):
                  the nfa accepted the input string.
         :rtype: tuple(State, bool)
         """
-        for start_state in self._start_states:
-            stack = [(start_state, 0)]
+        simulation = self._get_simulation()
+        accepted = simulation.run(s) & simulation.accept_mask
 
-            while len(stack) > 0:
-                state, index = stack.pop()
+        if accepted:
+            return simulation.states[(accepted & -accepted).bit_length() - 1], True
 
-                if index == len(s):
-                    if state in self._accept_states:
-                        return state, True
-                    else:
-                        continue
+        return next(iter(self._start_states)), False
 
-                symbols = self._transitions[state]
-                for symbol, to_states in symbols.items():
-                    for to_state in to_states:
-                        if symbol == '':
-                            stack.append((to_state, index))
-                        elif symbol == s[index]:
-                            stack.append((to_state, index + 1))
+    def accepts_many(self, strings: Iterable[str]) -> List[bool]:
+        """
+        Determines for each of the given strings whether
+        the nfa accepts it. All of the strings share the
+        precomputed successor masks of the simulation.
+
+        :param strings: The strings to parse
+        :type strings: Iterable[str]
+        :return: For each string whether it is accepted.
+        :rtype: List[bool]
+        """
+        simulation = self._get_simulation()
+        accept_mask = simulation.accept_mask
 
-        return next(iter(self._start_states)), False
+        return [simulation.run(s) & accept_mask != 0 for s in strings]
+
+    def _get_simulation(self):
+        """
+        Returns the bitset simulation of the nfa, which is
+        built on first use and discarded whenever the nfa
+        is modified.
+
+        :rtype: _BitsetSimulation
+        """
+        if self._simulation is None:
+            self._simulation = _BitsetSimulation(self)
+        return self._simulation
 
     def add_state(self, state: State):
         """
@@ -102,6 +120,7 @@ class NFA(FSA):
         :param state: state to add to NFA.
         :type state: State
         """
+        self._simulation = None
         self._states.add(state)
 
     def add_accepting_state(self, state: State):
@@ -111,6 +130,7 @@ class NFA(FSA):
         :param state: state to make accepting state.
         :type state: State
         """
+        self._simulation = None
         self._accept_states.add(state)
 
     def add_start_state(self, state: State):
@@ -119,6 +139,7 @@ class NFA(FSA):
         :param state: start state to add.
         :type state: State
         """
+        self._simulation = None
         if state not in self._states:
             self._states.add(state)
         self._start_states.add(state)
@@ -259,55 +280,53 @@ class NFA(FSA):
         Please consult Sipser for an explanation of this algorithm:
         https://www.amazon.com/Introduction-Theory-Computation-Michael-Sipser/dp/113318779X
 
+        Only the subsets of states that are reachable from
+        the start states are constructed, by exploring them
+        with a worklist. The subsets are hashed as frozensets
+        and the epsilon closure of every state is only
+        computed once.
+
         :return: the equivalent dfa
         :rtype: DFA
         """
+        closures = {}
+
+        def closure(q: State) -> Set[State]:
+            if q not in closures:
+                closures[q] = self._epsilon_closure(self, q)
+            return closures[q]
+
+        start_subset = set()
+        for q in self._start_states:
+            start_subset.update(closure(q))
+        start_subset = frozenset(start_subset)
+
+        subset_to_state = {start_subset: State('0')}
+        dfa = DFA(self.alphabet, subset_to_state[start_subset])
+
+        alphabet = sorted(self.alphabet)
+        queue = deque([start_subset])
+
+        while len(queue) > 0:
+            subset = queue.popleft()
+            state = subset_to_state[subset]
+
+            if any(q in self._accept_states for q in subset):
+                dfa.accept_states.add(state)
+
+            for a in alphabet:
+                to_subset = set()
+                for q in subset:
+                    if self.transition_exists(q, a):
+                        for to_state in self.transition(q, a):
+                            to_subset.update(closure(to_state))
+                to_subset = frozenset(to_subset)
+
+                if to_subset not in subset_to_state:
+                    subset_to_state[to_subset] = State(str(len(subset_to_state)))
+                    queue.append(to_subset)
 
-        if len(self._start_states) > 1:
-            cpy = self.copy()
-            new_q = State('__q0__')
-            cpy._states.add(new_q)
-            for q in cpy._start_states:
-                cpy.add_transition(new_q, q, '')
-            cpy._start_states = {new_q}
-        else:
-            cpy = self.copy()
-
-        q_prime = set()
-        power_set_to_states = {}
-        for q in cpy._power_set(cpy._states):
-            new_state = State(''.join(sorted(map(str, q))))
-            q_prime.add(new_state)
-            power_set_to_states[new_state] = set(q)
-
-        accept_prime = set()
-        transitions = defaultdict(OrderedDict)
-        q0_prime = self._epsilon_closure(cpy,
-                                         next(iter(cpy._start_states)))
-
-        for r in q_prime:
-            for a in cpy.alphabet:
-                transitions[r][a] = set()
-                for state in power_set_to_states[r]:
-
-                    if cpy.transition_exists(state, a):
-                        for ts in cpy.transition(state, a):
-                            for to_state in self._epsilon_closure(cpy, ts):
-                                transitions[r][a].add(to_state)
-
-            if any([s in cpy._accept_states for s in power_set_to_states[r]]):
-                accept_prime.add(r)
-
-        start_state = State(''.join(sorted(map(str, q0_prime))))
-        dfa = DFA(self.alphabet, start_state)
-
-        dfa.states = q_prime.copy()
-        dfa.accept_states = accept_prime.copy()
-
-        for from_state in transitions.keys():
-            for symbol, to_states in transitions[from_state].items():
-                to_state = State(''.join(sorted(map(str, to_states))))
-                dfa.add_transition(from_state, to_state, symbol)
+                dfa.add_transition(state, subset_to_state[to_subset], a)
 
         return dfa.minimize()
 
@@ -327,10 +346,6 @@ class NFA(FSA):
 
         return closure_set
 
-    @staticmethod
-    def _power_set(q):
-        return chain.from_iterable(combinations(q, r) for r in range(len(q) + 1))
-
     def __str__(self):
         """
         ToString implementation for the class, only used
@@ -354,3 +369,118 @@ class NFA(FSA):
             rep.append('')
 
         return '\n'.join(rep)
+
+
+class _BitsetSimulation:
+    """
+    Simulates an nfa on the set of all the states it can
+    be in at the same time, with the set represented as an
+    integer bitmask. Reading a symbol takes the union of the
+    (epsilon-closed) successor masks of the current states,
+    which is looked up a byte of the current mask at a time,
+    so one step costs O(|Q| / 8) big integer operations.
+    """
+
+    def __init__(self, nfa: NFA):
+        """
+        :param nfa: The nfa to simulate
+        :type nfa: NFA
+        """
+        states = set(nfa._states) | nfa._start_states | nfa._accept_states
+        for q, from_map in nfa._transitions.items():
+            states.add(q)
+            for to_states in from_map.values():
+                states.update(to_states)
+
+        self.states = sorted(states)
+        bit = {q: 1 << i for i, q in enumerate(self.states)}
+
+        closures = {}
+        for q in self.states:
+            mask = 0
+            for r in NFA._epsilon_closure(nfa, q):
+                mask |= bit[r]
+            closures[q] = mask
+
+        self._successors = {}
+        for q, from_map in nfa._transitions.items():
+            for a, to_states in from_map.items():
+                if a == '':
+                    continue
+                successors = self._successors.setdefault(a, [0] * len(self.states))
+                i = bit[q].bit_length() - 1
+                for r in to_states:
+                    successors[i] |= closures[r]
+
+        self.start_mask = 0
+        for q in nfa._start_states:
+            self.start_mask |= closures[q]
+
+        self.accept_mask = 0
+        for q in nfa._accept_states:
+            self.accept_mask |= bit[q]
+
+        self._num_bytes = (len(self.states) + 7) // 8
+        self._byte_tables = {}
+
+    def _byte_table(self, a: str, j: int) -> List[int]:
+        """
+        Computes, for every value of the j-th byte of a mask,
+        the union of the successor masks on symbol a of the
+        states in that byte.
+
+        :param a: Symbol
+        :type a: str
+        :param j: Index of the byte
+        :type j: int
+        :return: The 256 successor masks
+        :rtype: List[int]
+        """
+        key = a, j
+        if key not in self._byte_tables:
+            successors = self._successors[a]
+            table = [0] * 256
+            for b in range(1, 256):
+                low = b & -b
+                i = 8 * j + low.bit_length() - 1
+                table[b] = table[b ^ low] | (successors[i] if i < len(successors) else 0)
+            self._byte_tables[key] = table
+        return self._byte_tables[key]
+
+    def step(self, mask: int, a: str) -> int:
+        """
+        Computes the set of states reached from the states
+        in mask after reading the symbol a.
+
+        :param mask: The current set of states
+        :type mask: int
+        :param a: Symbol
+        :type a: str
+        :return: The next set of states
+        :rtype: int
+        """
+        if a not in self._successors:
+            return 0
+
+        next_mask = 0
+        for j, b in enumerate(mask.to_bytes(self._num_bytes, 'little')):
+            if b:
+                next_mask |= self._byte_table(a, j)[b]
+        return next_mask
+
+    def run(self, s: str) -> int:
+        """
+        Computes the set of states the nfa can be in
+        after reading the string s.
+
+        :param s: The string to parse
+        :type s: str
+        :return: The final set of states
+        :rtype: int
+        """
+        mask = self.start_mask
+        for a in s:
+            mask = self.step(mask, a)
+            if mask == 0:
+                break
+        return mask
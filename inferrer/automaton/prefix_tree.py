@@ -0,0 +1,198 @@
+from collections import deque
+from inferrer.automaton.state import State
+from inferrer.automaton.dfa import DFA
+from typing import Dict, Generator, Iterable, List, Set
+
+
+class PrefixTree:
+    """
+    A prefix tree acceptor stored as a trie with integer
+    nodes. Every node only keeps a pointer to its parent,
+    the symbol on the edge from its parent, the edges to
+    its children, its label and the number of times it
+    occurred as an example string, so the prefixes of the
+    example strings are never materialised as strings and
+    the memory used is linear in the total length of the
+    example strings.
+    """
+
+    ROOT = 0
+
+    def __init__(self, s_plus: Iterable[str]=(), s_minus: Iterable[str]=()):
+        """
+        :param s_plus: Positive example strings
+        :type s_plus: Iterable[str]
+        :param s_minus: Negative example strings
+        :type s_minus: Iterable[str]
+        """
+        self._alphabet = set()
+
+        self._parents = [-1]
+        self._symbols = ['']
+        self._children = [{}]
+        self._labels = [None]
+        self._counts = [0]
+
+        for s in s_plus:
+            self.add(s, True)
+        for s in s_minus:
+            self.add(s, False)
+
+    @property
+    def alphabet(self) -> Set[str]:
+        return self._alphabet
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def add(self, s: str, accepted: bool) -> int:
+        """
+        Inserts the example string s into the tree.
+
+        :param s: The example string
+        :type s: str
+        :param accepted: Whether s is a positive example
+        :type accepted: bool
+        :return: The node of s
+        :rtype: int
+        """
+        q = self.ROOT
+        for a in s:
+            children = self._children[q]
+            if a in children:
+                q = children[a]
+                continue
+
+            self._alphabet.add(a)
+
+            q2 = len(self._parents)
+            self._parents.append(q)
+            self._symbols.append(a)
+            self._children.append({})
+            self._labels.append(None)
+            self._counts.append(0)
+
+            children[a] = q2
+            q = q2
+
+        if self._labels[q] is not None and self._labels[q] != accepted:
+            raise ValueError('\'{}\' is both a positive and a negative example'.format(s))
+
+        self._labels[q] = accepted
+        self._counts[q] += 1
+
+        return q
+
+    def find(self, s: str) -> int:
+        """
+        Finds the node of the string s.
+
+        :param s: The string
+        :type s: str
+        :return: The node of s, or None if s is not
+                 a prefix of any example string.
+        :rtype: int
+        """
+        q = self.ROOT
+        for a in s:
+            q = self._children[q].get(a)
+            if q is None:
+                return None
+
+        return q
+
+    def word(self, q: int) -> str:
+        """
+        Gets the string of the node q by following
+        the parent pointers to the root.
+
+        :param q: The node
+        :type q: int
+        :return: The prefix that leads to q
+        :rtype: str
+        """
+        symbols = []
+        while q != self.ROOT:
+            symbols.append(self._symbols[q])
+            q = self._parents[q]
+
+        return ''.join(reversed(symbols))
+
+    def parent(self, q: int) -> int:
+        return self._parents[q]
+
+    def symbol(self, q: int) -> str:
+        return self._symbols[q]
+
+    def children(self, q: int) -> Dict[str, int]:
+        return self._children[q]
+
+    def label(self, q: int) -> bool:
+        """
+        :param q: The node
+        :type q: int
+        :return: True if q is a positive example, False
+                 if q is a negative example and None if
+                 q is only a prefix of an example.
+        :rtype: bool
+        """
+        return self._labels[q]
+
+    def count(self, q: int) -> int:
+        return self._counts[q]
+
+    def examples(self, accepted: bool) -> Generator:
+        """
+        Lists the example strings with the given label.
+
+        :param accepted: Whether to list the positive or
+                         the negative example strings.
+        :type accepted: bool
+        :return: Generator with the example strings
+        :rtype: Generator[str]
+        """
+        for q, label in enumerate(self._labels):
+            if label is accepted:
+                yield self.word(q)
+
+    def canonical_order(self) -> List[int]:
+        """
+        Lists the nodes in length-lexicographic order of their
+        strings, by a breadth-first search that visits the
+        children of every node in order of their symbols.
+
+        :return: The nodes in length-lexicographic order
+        :rtype: List[int]
+        """
+        order = [self.ROOT]
+        queue = deque(order)
+        while queue:
+            children = self._children[queue.popleft()]
+            for a in sorted(children):
+                order.append(children[a])
+                queue.append(children[a])
+
+        return order
+
+    def to_dfa(self) -> DFA:
+        """
+        Builds the prefix tree acceptor as a dfa, with
+        a state named after every prefix.
+
+        :return: The prefix tree acceptor
+        :rtype: DFA
+        """
+        dfa = DFA(self._alphabet.copy())
+        names = [State('')]
+
+        for q in range(1, len(self._parents)):
+            names.append(State(names[self._parents[q]].name + self._symbols[q]))
+            dfa.add_transition(names[self._parents[q]], names[q], self._symbols[q])
+
+        for q, label in enumerate(self._labels):
+            if label is True:
+                dfa.accept_states.add(names[q])
+            elif label is False:
+                dfa.reject_states.add(names[q])
+
+        return dfa
@@ -0,0 +1,303 @@
+from array import array
+from inferrer.automaton.state import State
+from inferrer.automaton.dfa import DFA
+from inferrer.automaton.prefix_tree import PrefixTree
+from typing import List, Tuple
+
+
+class Quotient:
+    """
+    Represents the quotient of a prefix tree acceptor under
+    a partition of its nodes into blocks, which is refined
+    by merging blocks. The partition is kept in a union-find
+    forest over integer node ids, which are numbered in
+    length-lexicographic order of their prefixes.
+
+    The prefix tree itself is not kept. Every node only keeps
+    its union-find parent and the edge from its parent in the
+    tree, in flat integer arrays, and only the representative
+    of a block holds the transitions and the label of the
+    block. These are dropped when the block is merged into
+    another one, so apart from the arrays, the memory used is
+    proportional to the live blocks.
+    """
+
+    def __init__(self, tree: PrefixTree):
+        """
+        :param tree: The prefix tree acceptor in which
+                     every node is in a block of its own.
+        :type tree: PrefixTree
+        """
+        self._alphabet = set(tree.alphabet)
+        self._letters = sorted(self._alphabet)
+
+        nodes = tree.canonical_order()
+        ids = array('l', [0]) * len(nodes)
+        for i, q in enumerate(nodes):
+            ids[q] = i
+
+        letters = {a: i for i, a in enumerate(self._letters)}
+
+        self._parent = array('l', range(len(nodes)))
+        self._origin = array('l', [-1]) * len(nodes)
+        self._symbol = array('l', [-1]) * len(nodes)
+        self._transitions = {}
+        self._labels = {}
+
+        for i, q in enumerate(nodes):
+            if i != 0:
+                self._origin[i] = ids[tree.parent(q)]
+                self._symbol[i] = letters[tree.symbol(q)]
+
+            children = tree.children(q)
+            if children:
+                self._transitions[i] = {a: ids[q2] for a, q2 in children.items()}
+
+            label = tree.label(q)
+            if label is not None:
+                self._labels[i] = label
+
+        self._evidence = 0
+
+    @property
+    def start(self) -> int:
+        return self.find(0)
+
+    @property
+    def evidence(self) -> int:
+        """
+        The number of pairs of blocks with the same label
+        that were joined by the last merge.
+        """
+        return self._evidence
+
+    def node(self, q: State) -> int:
+        """
+        Gets the id of the node of the given state, which
+        is named after its prefix, with a binary search
+        over the length-lexicographic order of the nodes.
+
+        :param q: State of the prefix tree acceptor
+        :type q: State
+        :return: id of the node
+        :rtype: int
+        """
+        key = (len(q.name), q.name)
+
+        low, high = 0, len(self._parent)
+        while low < high:
+            middle = (low + high) // 2
+            word = self._word(middle)
+            if (len(word), word) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == len(self._parent) or self._word(low) != q.name:
+            raise ValueError('\'{}\' is not in the prefix tree'.format(q.name))
+
+        return low
+
+    def state(self, q: int) -> State:
+        """
+        Gets the state of the prefix tree acceptor
+        with the given node id.
+
+        :param q: id of the node
+        :type q: int
+        :return: State named after the prefix of the node
+        :rtype: State
+        """
+        return State(self._word(q))
+
+    def _word(self, q: int) -> str:
+        """
+        Gets the prefix of the node q by following
+        the edges of the prefix tree to the root.
+
+        :param q: id of the node
+        :type q: int
+        :return: The prefix that leads to q
+        :rtype: str
+        """
+        symbols = []
+        while q != 0:
+            symbols.append(self._letters[self._symbol[q]])
+            q = self._origin[q]
+
+        return ''.join(reversed(symbols))
+
+    def find(self, q: int, journal: List[Tuple]=None) -> int:
+        """
+        Finds the representative of the block of the
+        node q, and points every node on the way there
+        directly to the representative.
+
+        :param q: id of the node
+        :type q: int
+        :param journal: Log of the changes made to the quotient
+        :type journal: List[Tuple]
+        :return: id of the representative
+        :rtype: int
+        """
+        parent = self._parent
+
+        root = q
+        while parent[root] != root:
+            root = parent[root]
+
+        while parent[q] != root:
+            if journal is not None:
+                journal.append(('parent', q, parent[q]))
+            parent[q], q = root, parent[q]
+
+        return root
+
+    def transition(self, q: int, a: str) -> int:
+        """
+        Gets the block that the block of q
+        transitions to on the letter a.
+
+        :param q: id of a node
+        :type q: int
+        :param a: letter in alphabet
+        :type a: str
+        :return: representative of the block, or None
+                 if the transition does not exist.
+        :rtype: int
+        """
+        transitions = self._transitions.get(self.find(q))
+        if transitions is None or a not in transitions:
+            return None
+
+        return self.find(transitions[a])
+
+    def is_accepting(self, q: int) -> bool:
+        return self._labels.get(self.find(q)) is True
+
+    def is_rejecting(self, q: int) -> bool:
+        return self._labels.get(self.find(q)) is False
+
+    def merge(self, q: int, q_prime: int, journal: List[Tuple]=None) -> bool:
+        """
+        Merges the block of q' into the block of q, and then
+        merges the blocks that the two blocks transition to
+        on the same letter, until the quotient is deterministic
+        again. The representative of the block of q stays the
+        representative of the merged block.
+
+        The merge fails as soon as it joins an accepting and a
+        rejecting block, and the quotient is then left
+        half-merged. If a journal is given, every change made
+        to the quotient is recorded in it, so that the merge
+        can be undone with rollback.
+
+        :param q: id of a node
+        :type q: int
+        :param q_prime: id of the node to merge into q
+        :type q_prime: int
+        :param journal: Log of the changes made to the quotient
+        :type journal: List[Tuple]
+        :return: Whether the merge is free of label conflicts.
+        :rtype: bool
+        """
+        self._evidence = 0
+
+        pairs = [(q, q_prime)]
+        while pairs:
+            q, q_prime = pairs.pop()
+            q = self.find(q, journal)
+            q_prime = self.find(q_prime, journal)
+
+            if q == q_prime:
+                continue
+
+            label, label_prime = self._labels.get(q), self._labels.get(q_prime)
+            if label is not None and label_prime is not None:
+                if label != label_prime:
+                    return False
+                self._evidence += 1
+            elif label_prime is not None:
+                self._labels[q] = label_prime
+                if journal is not None:
+                    journal.append(('label', q))
+
+            self._parent[q_prime] = q
+            transitions_prime = self._transitions.pop(q_prime, None)
+            self._labels.pop(q_prime, None)
+            if journal is not None:
+                journal.append(('union', q_prime, transitions_prime, label_prime))
+
+            if transitions_prime is None:
+                continue
+
+            transitions = self._transitions.setdefault(q, {})
+            for a, q2 in transitions_prime.items():
+                if a in transitions:
+                    pairs.append((transitions[a], q2))
+                else:
+                    transitions[a] = q2
+                    if journal is not None:
+                        journal.append(('transition', q, a))
+
+        return True
+
+    def rollback(self, journal: List[Tuple]):
+        """
+        Undoes the changes recorded in the journal, in reverse
+        order, which takes time proportional to the number of
+        changes rather than to the size of the quotient.
+
+        :param journal: Log of the changes made to the quotient
+        :type journal: List[Tuple]
+        """
+        for entry in reversed(journal):
+            if entry[0] == 'parent':
+                self._parent[entry[1]] = entry[2]
+            elif entry[0] == 'union':
+                self._parent[entry[1]] = entry[1]
+                if entry[2] is not None:
+                    self._transitions[entry[1]] = entry[2]
+                if entry[3] is not None:
+                    self._labels[entry[1]] = entry[3]
+            elif entry[0] == 'label':
+                del self._labels[entry[1]]
+            else:
+                del self._transitions[entry[1]][entry[2]]
+
+        journal.clear()
+
+    def to_dfa(self) -> DFA:
+        """
+        Builds the dfa of the quotient, with one state
+        for every block that can be reached from the
+        initial state. Every block is named after the
+        state of its representative.
+
+        :return: The quotient dfa
+        :rtype: DFA
+        """
+        start = self.start
+        names = {start: self.state(start)}
+        dfa = DFA(self._alphabet, names[start])
+
+        stack = [start]
+        while stack:
+            q = stack.pop()
+            state = names[q]
+            dfa.states.add(state)
+
+            for a, q2 in self._transitions.get(q, {}).items():
+                q2 = self.find(q2)
+                if q2 not in names:
+                    names[q2] = self.state(q2)
+                    stack.append(q2)
+                dfa.add_transition(state, names[q2], a)
+
+            label = self._labels.get(q)
+            if label is True:
+                dfa.accept_states.add(state)
+            elif label is False:
+                dfa.reject_states.add(state)
+
+        return dfa
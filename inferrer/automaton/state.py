@@ -18,6 +18,8 @@ class State:
         return hash(self.__name)
 
     def __eq__(self, other):
+        if not isinstance(other, State):
+            return NotImplemented
         return self.__name == other.name
 
     def __lt__(self, other):
@@ -33,6 +35,8 @@ class State:
         return self.name >= other.name
 
     def __ne__(self, other):
+        if not isinstance(other, State):
+            return NotImplemented
         return self.name != other.name
 
     def __str__(self):
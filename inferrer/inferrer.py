@@ -1,6 +1,6 @@
-from inferrer import utils, automaton, algorithms
+from inferrer import automaton, algorithms
 from inferrer.oracle.oracle import Oracle
-from typing import Set
+from typing import Set, Iterable
 
 
 class Learner:
@@ -22,29 +22,42 @@ class Learner:
           tries to make sure that some generalisation takes place and,
           in the best case, returns the correct target automaton.
 
+    EDSM: The Evidence-Driven State Merging (EDSM) algorithm, which
+          scores the possible merges by the evidence in the sample
+          and performs the best merge first.
+
     L*  : An implementation of Dana Angluin's L* algorithm, which
           learns regular languages from queries and counterexamples.
 
     NL* : An implementation of the NL* algorithm, which extends
           Angluin-Style learning to the learning of an NFA.
+
+    KV  : An implementation of the Kearns-Vazirani algorithm, which
+          learns regular languages from queries and counterexamples
+          with a discrimination tree instead of an observation table.
     """
 
-    def __init__(self, alphabet: Set[str],
-                 pos_examples: Set[str]=None,
-                 neg_examples: Set[str]=None,
+    def __init__(self, alphabet: Set[str]=None,
+                 pos_examples: Iterable[str]=None,
+                 neg_examples: Iterable[str]=None,
                  oracle: Oracle=None,
                  algorithm: str='rpni'):
         """
         :param alphabet: Alphabet of the target language we are
-                         trying to learn.
+                         trying to learn. The passive algorithms
+                         determine the alphabet from the example
+                         strings, so it can be left out for them.
         :type alphabet: Set[str]
-        :param pos_examples: Set of positive example strings
-                             from the target language.
-        :type pos_examples: Set[str]
-        :param neg_examples: Set of negative example strings,
-                             i.e. strings that do not belong in
-                             the target language.
-        :type neg_examples: Set[str]
+        :param pos_examples: Positive example strings from the
+                             target language. Any iterable of
+                             strings can be given, for example the
+                             generator returned by utils.read_examples.
+        :type pos_examples: Iterable[str]
+        :param neg_examples: Negative example strings, i.e. strings
+                             that do not belong in the target
+                             language, given in the same way as the
+                             positive example strings.
+        :type neg_examples: Iterable[str]
         :param oracle: Minimally adequate teacher (MAT)
         :type oracle: Oracle
         :param algorithm: The algorithm to use when attempting to
@@ -52,20 +65,24 @@ class Learner:
                           The options are:
                           gold
                           rpni
+                          edsm
                           lstar
                           nlstar
+                          kv
         :type algorithm: str
         """
-        if not isinstance(alphabet, set) or len(alphabet) == 0:
-            raise ValueError('The alphabet has to be a set with at least one element')
-
         self._alphabet = alphabet
+        self._prefix_tree = None
 
         self._learners = {
-            'gold'  : lambda: algorithms.Gold(pos_examples, neg_examples, self._alphabet).learn(),
-            'rpni'  : lambda: algorithms.RPNI(pos_examples, neg_examples, self._alphabet).learn(),
+            'gold'  : lambda: algorithms.Gold(set(self._prefix_tree.examples(True)),
+                                              set(self._prefix_tree.examples(False)),
+                                              self._alphabet).learn(),
+            'rpni'  : lambda: algorithms.RPNI.from_prefix_tree(self._prefix_tree).learn(),
+            'edsm'  : lambda: algorithms.EDSM.from_prefix_tree(self._prefix_tree).learn(),
             'lstar' : lambda: algorithms.LSTAR(self._alphabet, oracle).learn(),
-            'nlstar': lambda: algorithms.NLSTAR(self._alphabet, oracle).learn()
+            'nlstar': lambda: algorithms.NLSTAR(self._alphabet, oracle).learn(),
+            'kv'    : lambda: algorithms.KV(self._alphabet, oracle).learn()
         }
 
         if algorithm not in self._learners:
@@ -73,23 +90,22 @@ class Learner:
                              'algorithms are available:\n{}'
                              .format(algorithms, '\n'.join(self._learners.keys())))
 
-        if algorithm in ['rpni', 'gold']:
-            if not isinstance(pos_examples, set):
-                raise ValueError('pos_examples should be a set')
-            if not isinstance(neg_examples, set):
-                raise ValueError('neg_examples should be a set')
-
-            if len(pos_examples.intersection(neg_examples)) != 0:
-                raise ValueError('The sets of positive and negative example '
-                                 'strings should not contain the same string(s)')
-
+        if algorithm in ['rpni', 'edsm', 'gold']:
             if pos_examples is None or neg_examples is None:
                 raise ValueError('pos_examples and neg_examples can not be None '
                                  'for algorithm \'{}\''.format(algorithm))
 
-            self._alphabet = utils.determine_alphabet(pos_examples.union(neg_examples))
+            try:
+                self._prefix_tree = automaton.PrefixTree(pos_examples, neg_examples)
+            except ValueError:
+                raise ValueError('The sets of positive and negative example '
+                                 'strings should not contain the same string(s)')
+
+            self._alphabet = self._prefix_tree.alphabet
 
-        elif algorithm in ['lstar', 'nlstar']:
+        elif algorithm in ['lstar', 'nlstar', 'kv']:
+            if not isinstance(alphabet, set) or len(alphabet) == 0:
+                raise ValueError('The alphabet has to be a set with at least one element')
             if oracle is None:
                 raise ValueError('oracle can not be None for algorithm \'{}\''.format(algorithm))
 
@@ -1,2 +1,5 @@
 from inferrer.oracle.active_oracle import ActiveOracle
 from inferrer.oracle.passive_oracle import PassiveOracle
+from inferrer.oracle.caching_oracle import CachingOracle
+from inferrer.oracle.async_oracle import AsyncOracle
+from inferrer.oracle.conformance_oracle import ConformanceOracle
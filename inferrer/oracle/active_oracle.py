@@ -1,14 +1,10 @@
-from collections import deque
 from inferrer import automaton
-from typing import Tuple
+from typing import List, Tuple
 from inferrer.oracle.oracle import Oracle
 
 
 class ActiveOracle(Oracle):
 
-    MAX_SELF_LOOP_DEPTH = 10
-    MAX_VISIT_DEPTH = 50
-
     def __init__(self, fsa: automaton.FSA):
         """
         An implementation of a active oracle. The oracle only
@@ -19,7 +15,6 @@ class ActiveOracle(Oracle):
         :type fsa: FSA
         """
         super().__init__()
-        self._counterexamples = set()
 
         if type(fsa) is automaton.NFA:
             self._fsa = fsa.to_dfa().minimize()
@@ -28,6 +23,8 @@ class ActiveOracle(Oracle):
         else:
             raise ValueError('fsa has to be a DFA or NFA!')
 
+        self._compact = None
+
     def membership_query(self, s: str) -> bool:
         """
         Answers a Membership Query (MQ) made by the learner.
@@ -44,17 +41,35 @@ class ActiveOracle(Oracle):
         """
         return self._fsa.parse_string(s)[1]
 
+    def membership_queries(self, strings: List[str]) -> List[bool]:
+        """
+        Answers a batch of Membership Queries (MQ) made by the
+        learner by parsing all of the strings at once with a
+        CompactDFA of the target dfa.
+
+        :param strings: The membership query strings
+        :type strings: List[str]
+        :return: For every string whether it is in the
+                 target language.
+        :rtype: List[bool]
+        """
+        if self._compact is None:
+            self._compact = automaton.CompactDFA.from_dfa(self._fsa)
+
+        return self._compact.accepts_many(strings)
+
     def equivalence_query(self, fsa: automaton.FSA) -> Tuple[str, bool]:
         """
         Answers a Equivalence Query (EQ) made by the learner.
         The learner provides the Oracle with some hypothesis.
         The hypothesis is a grammar representing the unknown
-        language. The Oracle has to provide the learner with
-        a counter-example, i.e. a string that does not belong
-        in the target language, but is accepted by the
-        proposed grammar. If the Oracle is happy with the
-        hypothesis, then it tells the learner that it is satisfied
-        and the algorithm will converge.
+        language. If the hypothesis does not accept the target
+        language, the Oracle provides the learner with a shortest
+        counter-example, i.e. a shortest string that is in exactly
+        one of the target language and the language of the
+        hypothesis. If the Oracle is happy with the hypothesis,
+        then it tells the learner that it is satisfied and the
+        algorithm will converge.
 
         :param fsa: The 'hypothesis', a finite state acceptor
                     representing the unknown language.
@@ -65,46 +80,13 @@ class ActiveOracle(Oracle):
                  first index will just be the empty string.
         :rtype: Tuple[str, bool]
         """
-        if type(fsa) is not automaton.NFA and type(fsa) is not automaton.DFA:
+        if type(fsa) is automaton.NFA:
+            fsa = fsa.to_dfa()
+        elif type(fsa) is not automaton.DFA:
             raise ValueError('fsa has to be a DFA or NFA!')
 
-        if type(fsa) is automaton.DFA and self._fsa == fsa:
+        word = self._fsa.find_distinguishing_word(fsa)
+        if word is None:
             return '', True
-        # elif type(fsa) is automaton.NFA and \
-        #         self._fsa == fsa.to_dfa():
-        #     return '', True
-
-        queue = deque([(self._fsa._start_state, 0, '')])
-        visited = {self._fsa._start_state : 0}
-
-        while len(queue) > 0:
-            state, loop_depth, word = queue.popleft()
-
-            if word not in self._counterexamples:
-                expected = self._fsa.parse_string(word)[1]
-                actual = fsa.parse_string(word)[1]
-
-                if expected != actual:
-                    self._counterexamples.add(word)
-                    return word, False
-
-            trans = self._fsa._transitions[state]
-
-            for sym, to_state in trans.items():
-                if to_state == state and loop_depth < ActiveOracle.MAX_SELF_LOOP_DEPTH and \
-                        visited[to_state] < ActiveOracle.MAX_VISIT_DEPTH:
-                    queue.append((state,
-                                  loop_depth + 1,
-                                  '{}{}'.format(word, sym)))
-
-                if to_state not in visited or visited[to_state] < ActiveOracle.MAX_VISIT_DEPTH:
-                    if to_state not in visited:
-                        visited[to_state] = 0
-                    else:
-                        visited[to_state] += 1
-
-                    queue.append((to_state,
-                                 loop_depth + 1,
-                                 '{}{}'.format(word, sym)))
 
-        return '', True
+        return word, False
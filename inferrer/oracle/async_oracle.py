@@ -0,0 +1,129 @@
+import abc
+import asyncio
+from inferrer import automaton
+from typing import List, Tuple
+from inferrer.oracle.oracle import Oracle
+
+
+class AsyncOracle(abc.ABC):
+
+    def __init__(self):
+        """
+        An abstract representation of a minimally adequate
+        teacher (MAT) whose queries are answered asynchronously,
+        for instance by a system that is reached over the
+        network. Active learners use such an oracle through
+        their learn_async method, which sends the membership
+        queries that fill in the observation table concurrently
+        instead of one round-trip after the other.
+        """
+        pass
+
+    @abc.abstractmethod
+    async def membership_query(self, s: str) -> bool:
+        """
+        Answers a Membership Query (MQ) made by the learner.
+        If the given string s is in the target language
+        then the Oracle will answer with True, if s is not in
+        the target language then the oracle will answer False.
+
+        :param s: The membership query string
+        :type s: str
+        :return: True if s is in the target language, else False
+        :rtype: bool
+        """
+        pass
+
+    async def membership_queries(self, strings: List[str],
+                                 max_concurrency: int=None) -> List[bool]:
+        """
+        Answers a batch of Membership Queries (MQ) made by the
+        learner by running at most max_concurrency of the
+        queries at the same time. The answers are in the same
+        order as the strings, regardless of the order in which
+        the queries finish.
+
+        :param strings: The membership query strings
+        :type strings: List[str]
+        :param max_concurrency: The maximum number of queries
+                                that run at the same time, or
+                                None to run all of them at once.
+        :type max_concurrency: int
+        :return: For every string whether it is in the
+                 target language.
+        :rtype: List[bool]
+        """
+        if max_concurrency is None:
+            return list(await asyncio.gather(*(self.membership_query(s) for s in strings)))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def query(s: str) -> bool:
+            async with semaphore:
+                return await self.membership_query(s)
+
+        return list(await asyncio.gather(*(query(s) for s in strings)))
+
+    @abc.abstractmethod
+    async def equivalence_query(self, fsa: automaton.FSA) -> Tuple[str, bool]:
+        """
+        Answers a Equivalence Query (EQ) made by the learner.
+        The learner provides the Oracle with some hypothesis.
+        The hypothesis is a finite state acceptor (FSA) that
+        represents the unknown language. If the FSA does not
+        represent the target language, then the Oracle returns a
+        counterexample in the symmetric difference of the target
+        language and the hypothesis.
+
+        :param fsa: The 'hypothesis', a finite state acceptor
+                    representing the unknown language.
+        :type fsa: FSA
+        :return: Tuple where the first index is a counter-example
+                 and the second index is whether the Oracle is
+                 satisfied.
+        :rtype: Tuple[str, bool]
+        """
+        pass
+
+
+class BlockingOracle(Oracle):
+
+    def __init__(self, oracle: AsyncOracle, loop: asyncio.AbstractEventLoop,
+                 max_concurrency: int=None):
+        """
+        Makes an asynchronous oracle usable by a learner that
+        runs in another thread than the event loop of the
+        oracle. Every query is submitted to the event loop and
+        the learner's thread waits for its answer, while a
+        batch of membership queries runs concurrently on the
+        event loop.
+
+        :param oracle: The asynchronous oracle
+        :type oracle: AsyncOracle
+        :param loop: The event loop that runs the queries
+        :type loop: asyncio.AbstractEventLoop
+        :param max_concurrency: The maximum number of membership
+                                queries that run at the same time.
+        :type max_concurrency: int
+        """
+        super().__init__()
+
+        self._oracle = oracle
+        self._loop = loop
+        self._max_concurrency = max_concurrency
+
+    def membership_query(self, s: str) -> bool:
+        return self._run(self._oracle.membership_query(s))
+
+    def membership_queries(self, strings: List[str]) -> List[bool]:
+        return self._run(self._oracle.membership_queries(strings, self._max_concurrency))
+
+    def equivalence_query(self, fsa: automaton.FSA) -> Tuple[str, bool]:
+        return self._run(self._oracle.equivalence_query(fsa))
+
+    def _run(self, coroutine):
+        """
+        Runs the coroutine on the event loop of the oracle
+        and waits for its result.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
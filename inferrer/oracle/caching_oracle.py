@@ -0,0 +1,207 @@
+import sqlite3
+from collections import OrderedDict
+from inferrer import automaton
+from typing import List, Tuple
+from inferrer.oracle.oracle import Oracle
+
+
+class CachingOracle(Oracle):
+
+    def __init__(self, oracle: Oracle, max_size: int=100000, path: str=None):
+        """
+        An oracle that remembers the answers to the membership
+        queries of another oracle, so that the other oracle is
+        asked every membership query at most once. The most
+        recently used answers are kept in memory, and if a path
+        is given, all of the answers are also stored in an sqlite
+        database that persists across runs.
+
+        :param oracle: The oracle whose answers are cached
+        :type oracle: Oracle
+        :param max_size: The maximum number of answers kept
+                         in memory
+        :type max_size: int
+        :param path: Path to the sqlite database, or None to
+                     only cache the answers in memory.
+        :type path: str
+        """
+        super().__init__()
+
+        if max_size < 1:
+            raise ValueError('max_size has to be at least 1')
+
+        self._oracle = oracle
+        self._max_size = max_size
+        self._cache = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path)
+            with self._db:
+                self._db.execute('CREATE TABLE IF NOT EXISTS membership_queries '
+                                 '(query TEXT PRIMARY KEY, answer INTEGER NOT NULL)')
+
+    @property
+    def hits(self) -> int:
+        """
+        The number of membership queries that were
+        answered from the cache.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        The number of membership queries that were
+        passed on to the wrapped oracle.
+        """
+        return self._misses
+
+    def membership_query(self, s: str) -> bool:
+        """
+        Answers a Membership Query (MQ) made by the learner
+        from the cache, and only asks the wrapped oracle if
+        s has not been queried before.
+
+        :param s: The membership query string
+        :type s: str
+        :return: True if s is in the target language, else False
+        :rtype: bool
+        """
+        if s in self._cache:
+            self._hits += 1
+            self._cache.move_to_end(s)
+            return self._cache[s]
+
+        answer = self._load(s)
+        if answer is None:
+            self._misses += 1
+            answer = bool(self._oracle.membership_query(s))
+            self._store([(s, answer)])
+        else:
+            self._hits += 1
+
+        self._remember(s, answer)
+
+        return answer
+
+    def membership_queries(self, strings: List[str]) -> List[bool]:
+        """
+        Answers a batch of Membership Queries (MQ) made by the
+        learner. The strings that are not in the cache are
+        passed on to the wrapped oracle in a single batch.
+
+        :param strings: The membership query strings
+        :type strings: List[str]
+        :return: For every string whether it is in the
+                 target language.
+        :rtype: List[bool]
+        """
+        answers = {}
+        for s in strings:
+            if s in answers:
+                continue
+
+            if s in self._cache:
+                self._hits += 1
+                self._cache.move_to_end(s)
+                answers[s] = self._cache[s]
+            else:
+                answers[s] = self._load(s)
+                if answers[s] is not None:
+                    self._hits += 1
+
+        unknown = [s for s, answer in answers.items() if answer is None]
+        if len(unknown) > 0:
+            self._misses += len(unknown)
+            new_answers = [(s, bool(answer)) for s, answer
+                           in zip(unknown, self._oracle.membership_queries(unknown))]
+            answers.update(new_answers)
+            self._store(new_answers)
+
+        for s, answer in answers.items():
+            self._remember(s, answer)
+
+        return [answers[s] for s in strings]
+
+    def equivalence_query(self, fsa: automaton.FSA) -> Tuple[str, bool]:
+        """
+        Passes the Equivalence Query (EQ) on to the
+        wrapped oracle.
+
+        :param fsa: The 'hypothesis', a finite state acceptor
+                    representing the unknown language.
+        :type fsa: FSA
+        :return: Tuple where the first index is a counter-example
+                 and the second index is whether the Oracle is
+                 satisfied.
+        :rtype: Tuple[str, bool]
+        """
+        return self._oracle.equivalence_query(fsa)
+
+    def close(self):
+        """
+        Closes the database, if there is one.
+        """
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _load(self, s: str) -> bool:
+        """
+        Looks up the answer to the membership query s
+        in the database.
+
+        :param s: The membership query string
+        :type s: str
+        :return: The stored answer, or None
+        :rtype: bool
+        """
+        if self._db is None:
+            return None
+
+        row = self._db.execute('SELECT answer FROM membership_queries WHERE query = ?',
+                               (s,)).fetchone()
+
+        return None if row is None else bool(row[0])
+
+    def _remember(self, s: str, answer: bool):
+        """
+        Puts the answer to the membership query s in the
+        in-memory cache, and evicts the least recently
+        used answer if the cache is full.
+
+        :param s: The membership query string
+        :type s: str
+        :param answer: The answer to the query
+        :type answer: bool
+        """
+        self._cache[s] = answer
+        self._cache.move_to_end(s)
+        if len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+    def _store(self, answers: List[Tuple[str, bool]]):
+        """
+        Stores the answers to membership queries in the
+        database, in a single transaction.
+
+        :param answers: The queries along with the
+                        answers of the wrapped oracle
+        :type answers: List[Tuple[str, bool]]
+        """
+        if self._db is None:
+            return
+
+        with self._db:
+            self._db.executemany('INSERT OR REPLACE INTO membership_queries VALUES (?, ?)',
+                                 [(s, int(answer)) for s, answer in answers])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,308 @@
+import itertools
+from inferrer import automaton
+from typing import Callable, Generator, List, Set, Tuple
+from inferrer.oracle.oracle import Oracle
+
+
+class ConformanceOracle(Oracle):
+
+    def __init__(self, membership: Callable[[str], bool], alphabet: Set[str],
+                 extra_states: int=1, method: str='wp'):
+        """
+        An oracle for a black-box system, of which only a
+        membership function is known. Membership queries are
+        passed on to the function, and equivalence queries are
+        answered by conformance testing: a test suite is generated
+        from the hypothesis with the W-method or the Wp-method,
+        and the first test word on which the system and the
+        hypothesis disagree is returned as counterexample.
+
+        If the system is a dfa with at most extra_states more
+        states than the minimal dfa of the hypothesis, the test
+        suite finds a counterexample whenever there is one.
+
+        :param membership: Function that determines whether a
+                           string is accepted by the system.
+        :type membership: Callable[[str], bool]
+        :param alphabet: The alphabet of the system
+        :type alphabet: Set[str]
+        :param extra_states: The number of states that the system
+                             is assumed to have at most in addition
+                             to the states of the hypothesis.
+        :type extra_states: int
+        :param method: The method used to generate the test
+                       suite, either 'w' or 'wp'.
+        :type method: str
+        """
+        super().__init__()
+
+        if extra_states < 0:
+            raise ValueError('extra_states can not be negative')
+        if method not in ['w', 'wp']:
+            raise ValueError('method has to be \'w\' or \'wp\'')
+
+        self._membership = membership
+        self._alphabet = sorted(alphabet)
+        self._extra_states = extra_states
+        self._method = method
+
+    def membership_query(self, s: str) -> bool:
+        """
+        Answers a Membership Query (MQ) made by the learner
+        by passing it on to the membership function.
+
+        :param s: The membership query string
+        :type s: str
+        :return: True if s is in the target language, else False
+        :rtype: bool
+        """
+        return bool(self._membership(s))
+
+    def equivalence_query(self, fsa: automaton.FSA) -> Tuple[str, bool]:
+        """
+        Answers a Equivalence Query (EQ) made by the learner.
+        The words of the test suite are generated one at a time,
+        with shorter middle parts first. Every word is tested at
+        most once, which is checked with a prefix tree of the
+        tested words, and the test stops at the first word on
+        which the system and the hypothesis disagree.
+
+        :param fsa: The 'hypothesis', a finite state acceptor
+                    representing the unknown language.
+        :type fsa: FSA
+        :return: Tuple where the first index is a counter-example
+                 and the second index is whether the Oracle is
+                 satisfied. If the Oracle is satisfied, then the
+                 first index will just be the empty string.
+        :rtype: Tuple[str, bool]
+        """
+        if type(fsa) is automaton.NFA:
+            fsa = fsa.to_dfa()
+        elif type(fsa) is not automaton.DFA:
+            raise ValueError('fsa has to be a DFA or NFA!')
+
+        hypothesis = _Hypothesis(fsa, self._alphabet)
+        tested = automaton.PrefixTree()
+
+        for word in self._test_suite(hypothesis):
+            node = tested.find(word)
+            if node is not None and tested.label(node) is not None:
+                continue
+            tested.add(word, True)
+
+            if self.membership_query(word) != hypothesis.accepts(word):
+                return word, False
+
+        return '', True
+
+    def _test_suite(self, hypothesis) -> Generator:
+        """
+        Generates the test suite of the hypothesis, in rounds of
+        increasing length of the middle part. With the W-method,
+        every round consists of the words P.v.W, where P is the
+        transition cover, v a word of the length of the round and
+        W the characterisation set of the hypothesis. With the
+        Wp-method, W is only appended to the words Q.v of the state
+        cover Q, and the other words of P.v are only followed by
+        the identification set of the state that they reach.
+
+        :param hypothesis: The hypothesis
+        :type hypothesis: _Hypothesis
+        :return: Generator with the test words
+        :rtype: Generator[str]
+        """
+        state_cover = hypothesis.state_cover()
+        access = set(state_cover)
+        transition_cover = state_cover + [u + a for u in state_cover for a in self._alphabet
+                                          if u + a not in access]
+
+        characterisation = hypothesis.characterisation_set() or ['']
+
+        for length in range(self._extra_states + 1):
+            middles = [''.join(v) for v in itertools.product(self._alphabet, repeat=length)]
+
+            if self._method == 'w':
+                for u in transition_cover:
+                    for v in middles:
+                        for w in characterisation:
+                            yield u + v + w
+                continue
+
+            for u in state_cover:
+                for v in middles:
+                    for w in characterisation:
+                        yield u + v + w
+
+            for u in transition_cover[len(state_cover):]:
+                for v in middles:
+                    x = u + v
+                    for w in hypothesis.identification_set(hypothesis.run(x)) or ['']:
+                        yield x + w
+
+
+class _Hypothesis:
+    """
+    The hypothesis of a conformance test as a complete dfa
+    with integer states, which are numbered in the order in
+    which a breadth-first search finds them, so the access
+    string of every state is a shortest string that reaches
+    it. A missing transition leads to a rejecting sink state.
+    """
+
+    def __init__(self, dfa: automaton.DFA, alphabet: List[str]):
+        """
+        :param dfa: The hypothesis dfa
+        :type dfa: DFA
+        :param alphabet: The symbols in order
+        :type alphabet: List[str]
+        """
+        self._symbols = {a: i for i, a in enumerate(alphabet)}
+
+        ids = {dfa._start_state: 0}
+        states = [dfa._start_state]
+        self._access = ['']
+        self._delta = []
+
+        i = 0
+        while i < len(states):
+            transitions = dfa._transitions.get(states[i], {}) if states[i] is not None else {}
+            row = []
+            for a in alphabet:
+                q = transitions.get(a)
+                if q not in ids:
+                    ids[q] = len(states)
+                    states.append(q)
+                    self._access.append(self._access[i] + a)
+                row.append(ids[q])
+            self._delta.append(row)
+            i += 1
+
+        self._accepting = [q is not None and q in dfa.accept_states for q in states]
+        self._levels = self._refine()
+
+        final = self._levels[-1]
+        self._representatives = {}
+        for q in range(len(states)):
+            self._representatives.setdefault(final[q], q)
+
+        self._identification = {}
+
+    def accepts(self, s: str) -> bool:
+        q = self.run(s)
+
+        return q is not None and self._accepting[q]
+
+    def run(self, s: str) -> int:
+        """
+        :param s: The string to parse
+        :type s: str
+        :return: The state reached on s, or None if
+                 s contains a symbol that is not in
+                 the alphabet.
+        :rtype: int
+        """
+        q = 0
+        for a in s:
+            i = self._symbols.get(a)
+            if i is None:
+                return None
+            q = self._delta[q][i]
+
+        return q
+
+    def state_cover(self) -> List[str]:
+        """
+        :return: The access string of one state of every
+                 class of equivalent states, in order of
+                 their access strings.
+        :rtype: List[str]
+        """
+        return [self._access[q] for q in sorted(self._representatives.values())]
+
+    def characterisation_set(self) -> List[str]:
+        """
+        :return: A set of suffixes that distinguishes every
+                 pair of states that are not equivalent.
+        :rtype: List[str]
+        """
+        representatives = sorted(self._representatives.values())
+        suffixes = {self._separate(p, q)
+                    for i, p in enumerate(representatives)
+                    for q in representatives[i + 1:]}
+
+        return sorted(suffixes, key=lambda w: (len(w), w))
+
+    def identification_set(self, q: int) -> List[str]:
+        """
+        :param q: A state
+        :type q: int
+        :return: A set of suffixes that distinguishes the
+                 state q from every state that is not
+                 equivalent to q.
+        :rtype: List[str]
+        """
+        if q is None:
+            return ['']
+
+        block = self._levels[-1][q]
+        if block not in self._identification:
+            p = self._representatives[block]
+            suffixes = {self._separate(p, r)
+                        for r in self._representatives.values() if r != p}
+            self._identification[block] = sorted(suffixes, key=lambda w: (len(w), w))
+
+        return self._identification[block]
+
+    def _refine(self) -> List[List[int]]:
+        """
+        Refines the partition of the states by acceptance
+        until it is stable, with Moore's algorithm.
+
+        :return: The block of every state after every round
+        :rtype: List[List[int]]
+        """
+        levels = [[int(accepting) for accepting in self._accepting]]
+        while True:
+            blocks = levels[-1]
+            signatures = {}
+            level = [signatures.setdefault((blocks[q], tuple(blocks[r] for r in row)),
+                                           len(signatures))
+                     for q, row in enumerate(self._delta)]
+
+            if len(signatures) == len(set(blocks)):
+                return levels
+            levels.append(level)
+
+    def _separate(self, p: int, q: int) -> str:
+        """
+        Finds a shortest suffix on which exactly one of the two
+        states accepts, by following the round of the refinement
+        in which the states were separated.
+
+        :param p: A state
+        :type p: int
+        :param q: A state that is not equivalent to p
+        :type q: int
+        :return: The suffix
+        :rtype: str
+        """
+        symbols = list(self._symbols)
+        word = []
+
+        k = 0
+        while self._levels[k][p] == self._levels[k][q]:
+            k += 1
+
+        while k > 0:
+            before = self._levels[k - 1]
+            for i, a in enumerate(symbols):
+                p2, q2 = self._delta[p][i], self._delta[q][i]
+                if before[p2] != before[q2]:
+                    break
+            word.append(a)
+            p, q, k = p2, q2, k - 1
+
+            while k > 0 and self._levels[k - 1][p] != self._levels[k - 1][q]:
+                k -= 1
+
+        return ''.join(word)
@@ -1,6 +1,6 @@
 import abc
 from inferrer import automaton
-from typing import Tuple
+from typing import List, Tuple
 
 
 class Oracle(abc.ABC):
@@ -37,6 +37,22 @@ class Oracle(abc.ABC):
         """
         pass
 
+    def membership_queries(self, strings: List[str]) -> List[bool]:
+        """
+        Answers a batch of Membership Queries (MQ) made by the
+        learner at once. By default, the queries are answered
+        one after the other, but oracles for which a batch of
+        queries is cheaper than the separate queries should
+        override this method.
+
+        :param strings: The membership query strings
+        :type strings: List[str]
+        :return: For every string whether it is in the
+                 target language.
+        :rtype: List[bool]
+        """
+        return [self.membership_query(s) for s in strings]
+
     @abc.abstractmethod
     def equivalence_query(self, fsa: automaton.FSA) -> Tuple[str, bool]:
         """
@@ -1,29 +1,37 @@
 from inferrer import automaton
-from typing import Set, Tuple
+from typing import Iterable, List, Set, Tuple
 from inferrer.oracle.oracle import Oracle
 
 
 class PassiveOracle(Oracle):
 
-    def __init__(self, s_plus: Set[str], s_minus: Set[str]):
+    def __init__(self, s_plus: Iterable[str], s_minus: Iterable[str]):
         """
         An implementation of a passive oracle. The oracle only
         has access to two sets. A set of positive example strings
         and a set of negative strings. It answers membership
         queries and equivalence queries based of these two sets.
+        The example strings are read once into a prefix tree,
+        so they can also be given as any iterable of strings.
 
         :param s_plus: Set of positive example strings, i.e.
                        strings that belong in the
                        target language.
-        :type s_plus: Set[str]
+        :type s_plus: Iterable[str]
         :param s_minus: Set of negative example strings, i.e.
                         strings that do not belong in the
                         target language.
-        :type s_minus: Set[str]
+        :type s_minus: Iterable[str]
         """
         super().__init__()
-        self._s_plus = s_plus
-        self._s_minus = s_minus
+        self._tree = automaton.PrefixTree(s_plus, s_minus)
+
+    @property
+    def alphabet(self) -> Set[str]:
+        """
+        The alphabet of the example strings.
+        """
+        return self._tree.alphabet
 
     def membership_query(self, s: str) -> bool:
         """
@@ -39,7 +47,30 @@ class PassiveOracle(Oracle):
                  example strings, else False
         :rtype: bool
         """
-        return s in self._s_plus
+        q = self._tree.find(s)
+
+        return q is not None and self._tree.label(q) is True
+
+    def membership_queries(self, strings: List[str]) -> List[bool]:
+        """
+        Answers a batch of Membership Queries (MQ) made by the
+        learner by looking up all of the strings in the prefix
+        tree of the example strings.
+
+        :param strings: The membership query strings
+        :type strings: List[str]
+        :return: For every string whether it is a positive
+                 example string.
+        :rtype: List[bool]
+        """
+        find, label = self._tree.find, self._tree.label
+
+        answers = []
+        for s in strings:
+            q = find(s)
+            answers.append(q is not None and label(q) is True)
+
+        return answers
 
     def equivalence_query(self, fsa: automaton.FSA) -> Tuple[str, bool]:
         """
@@ -62,19 +93,51 @@ class PassiveOracle(Oracle):
                  first index will just be the empty string.
         :rtype: Tuple[str, bool]
         """
-        for positive_string in sorted(self._s_plus.difference(self._marked)):
-            accepted = fsa.parse_string(positive_string)[1]
+        for accepted in [True, False]:
+            q = self._find_misclassified(fsa, accepted)
+            if q is not None:
+                self._marked.add(q)
+                return self._tree.word(q), False
 
-            if not accepted:
-                self._marked.add(positive_string)
-                return positive_string, False
+        return '', True
 
-        for negative_string in sorted(self._s_minus.difference(self._marked)):
-            accepted = fsa.parse_string(negative_string)[1]
+    def _find_misclassified(self, fsa: automaton.FSA, accepted: bool) -> int:
+        """
+        Finds the first example string in lexicographic order,
+        with the given label, that has not been returned as a
+        counter-example yet and that the fsa classifies wrongly.
+        The prefix tree is walked depth-first, so a dfa parses
+        the common prefixes of the example strings only once.
 
-            if accepted:
-                self._marked.add(negative_string)
-                return negative_string, False
+        :param fsa: The hypothesis of the learner
+        :type fsa: FSA
+        :param accepted: Whether to check the positive or
+                         the negative example strings.
+        :type accepted: bool
+        :return: Node of the example string in the prefix
+                 tree, or None if there is no such string.
+        :rtype: int
+        """
+        is_dfa = isinstance(fsa, automaton.DFA)
 
-        return '', True
+        stack = [(automaton.PrefixTree.ROOT, fsa._start_state if is_dfa else None)]
+        while stack:
+            q, state = stack.pop()
+
+            if self._tree.label(q) is accepted and q not in self._marked:
+                if is_dfa:
+                    fsa_accepted = state is not None and state in fsa.accept_states
+                else:
+                    fsa_accepted = fsa.parse_string(self._tree.word(q))[1]
+
+                if fsa_accepted != accepted:
+                    return q
+
+            children = self._tree.children(q)
+            for a in sorted(children, reverse=True):
+                if is_dfa and state is not None and fsa.transition_exists(state, a):
+                    stack.append((children[a], fsa.transition(state, a)))
+                else:
+                    stack.append((children[a], None))
 
+        return None
@@ -2,4 +2,5 @@ from inferrer.utils.utils import prefix_set
 from inferrer.utils.utils import suffix_set
 from inferrer.utils.utils import determine_alphabet
 from inferrer.utils.utils import break_strings_in_two
+from inferrer.utils.utils import read_examples
 from inferrer.utils.observation_table import ObservationTable
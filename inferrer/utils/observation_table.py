@@ -7,6 +7,18 @@ class ObservationTable:
     """
     Represents an ObservationTable, which is a 2-dimensional table
     that gives information about some target language.
+
+    Besides the rows as dictionaries, the table keeps a packed
+    signature of every row, which is a pair of integers where
+    bit i of the first integer is set if the entry in the column
+    with index i is known (not None), and bit i of the second
+    integer is set if that entry is 1 (or True). Rows are
+    compared by their signatures.
+
+    The red and blue rows are indexed by their signatures, and
+    the rows that changed since the last check are marked as
+    dirty, so that closedness and consistency are kept up to
+    date by only re-examining the rows that changed.
     """
 
     def __init__(self, blue: Set[str], red: Set[str], alphabet: Set[str]):
@@ -26,6 +38,12 @@ class ObservationTable:
         self.__exp = set()
         self.__sta = set()
 
+        self._columns = {}
+        self._column_names = []
+        self._signatures = {}
+
+        self._reset_tracking()
+
     @property
     def ot(self):
         return self.__ot
@@ -34,6 +52,13 @@ class ObservationTable:
     def ot(self, ot):
         self.__ot = ot
 
+        self._signatures = {}
+        for r, row in ot.items():
+            for c, val in row.items():
+                self._set_bit(r, c, val)
+
+        self._reset_tracking()
+
     @property
     def exp(self):
         return self.__exp
@@ -62,6 +87,186 @@ class ObservationTable:
         :type val: 1, 0 or None
         """
         self.ot[r][c] = val
+        self._set_bit(r, c, val)
+
+    def row_signature(self, r: str) -> Tuple[int, int]:
+        """
+        Gets the packed signature of a row, which is
+        (0, 0) for a row that does not exist.
+
+        :param r: row in the table
+        :type r: str
+        :return: The known-mask and the value-mask of the row
+        :rtype: tuple(int, int)
+        """
+        return self._signatures.get(r, (0, 0))
+
+    def _column_index(self, c: str) -> int:
+        """
+        Gets the index of the bit of the column c in the
+        row signatures, which is assigned the first time
+        the column is used.
+
+        :param c: column in the table
+        :type c: str
+        :rtype: int
+        """
+        i = self._columns.get(c)
+        if i is None:
+            i = self._columns[c] = len(self._column_names)
+            self._column_names.append(c)
+
+        return i
+
+    def _set_bit(self, r: str, c: str, val):
+        """
+        Updates the signature of the row r for the
+        entry in column c.
+
+        :param r: row in the table
+        :type r: str
+        :param c: column in the table
+        :type c: str
+        :param val: the entry
+        :type val: 1, 0 or None
+        """
+        bit = 1 << self._column_index(c)
+        known, value = self._signatures.get(r, (0, 0))
+
+        known &= ~bit
+        value &= ~bit
+        if val is not None:
+            known |= bit
+            if val:
+                value |= bit
+
+        if self._signatures.get(r) != (known, value):
+            self._signatures[r] = known, value
+            self._dirty.add(r)
+
+    def _reset_tracking(self):
+        """
+        Forgets everything that is known about the closedness
+        and consistency of the table, so that every row is
+        examined again by the next check.
+        """
+        self._dirty = set(self.__ot.keys())
+
+        self._tracked_red = set()
+        self._tracked_blue = set()
+        self._red_index = collections.defaultdict(set)
+        self._red_indexed = {}
+        self._blue_index = collections.defaultdict(set)
+        self._blue_indexed = {}
+
+        self._unclosed = set()
+        self._inconsistent = set()
+
+    def _update_tracking(self):
+        """
+        Brings the closedness and consistency witnesses up to
+        date with the rows that changed, and the rows that were
+        added to or removed from the red and blue sets, since
+        the last check.
+        """
+        dirty = self._dirty
+        self._dirty = set()
+
+        touched = self._reindex(self._red, self._tracked_red, self._red_index,
+                                self._red_indexed, dirty)[1]
+        changed_blue = self._reindex(self._blue, self._tracked_blue, self._blue_index,
+                                     self._blue_indexed, dirty)[0]
+
+        recheck = set(changed_blue)
+        for sig in touched:
+            recheck.update(self._blue_index.get(sig, ()))
+
+        for r in recheck:
+            if r in self._blue_indexed and self._blue_indexed[r] not in self._red_index:
+                self._unclosed.add(r)
+            else:
+                self._unclosed.discard(r)
+
+        affected = set(touched)
+        for r in dirty:
+            for a in self._alphabet:
+                if r.endswith(a) and r[:len(r) - len(a)] in self._red_indexed:
+                    affected.add(self._red_indexed[r[:len(r) - len(a)]])
+
+        for sig in affected:
+            group = self._red_index.get(sig)
+            if group and self._group_inconsistency(group) is not None:
+                self._inconsistent.add(sig)
+            else:
+                self._inconsistent.discard(sig)
+
+    def _reindex(self, rows: Set[str], tracked: Set[str], index: dict, indexed: dict,
+                 dirty: Set[str]) -> Tuple[Set[str], Set[Tuple[int, int]]]:
+        """
+        Updates the index from signatures to rows for the given
+        set of (red or blue) rows.
+
+        :param rows: The current set of rows
+        :type rows: Set[str]
+        :param tracked: The set of rows at the last check
+        :type tracked: Set[str]
+        :param index: Maps signatures to sets of rows
+        :type index: dict
+        :param indexed: Maps the indexed rows to their signature
+        :type indexed: dict
+        :param dirty: The rows that changed since the last check
+        :type dirty: Set[str]
+        :return: The rows that were re-indexed and the signatures
+                 whose set of rows changed.
+        :rtype: tuple(Set[str], Set[tuple(int, int)])
+        """
+        changed = (rows ^ tracked) | (dirty & rows) | (dirty & tracked)
+        touched = set()
+
+        for r in changed:
+            sig = indexed.pop(r, None)
+            if sig is not None:
+                index[sig].discard(r)
+                if len(index[sig]) == 0:
+                    del index[sig]
+                touched.add(sig)
+
+            if r in rows:
+                sig = self.row_signature(r)
+                index[sig].add(r)
+                indexed[r] = sig
+                touched.add(sig)
+
+        tracked.difference_update(changed - rows)
+        tracked.update(changed & rows)
+
+        return changed, touched
+
+    def _experiments_mask(self) -> int:
+        """
+        :return: mask of the columns in exp
+        :rtype: int
+        """
+        exp = 0
+        for e in self.exp:
+            exp |= 1 << self._column_index(e)
+
+        return exp
+
+    @staticmethod
+    def _conflicts(sig1: Tuple[int, int], sig2: Tuple[int, int]) -> int:
+        """
+        Finds the columns in which both rows are known
+        and have different values.
+
+        :param sig1: signature of the first row
+        :type sig1: tuple(int, int)
+        :param sig2: signature of the second row
+        :type sig2: tuple(int, int)
+        :return: mask of the conflicting columns
+        :rtype: int
+        """
+        return (sig1[1] ^ sig2[1]) & sig1[0] & sig2[0]
 
     def get(self, r: str, c: str):
         """
@@ -119,18 +324,13 @@ class ObservationTable:
                  the row.
         :rtype: tuple(bool, str)
         """
+        exp = self._experiments_mask()
         for u in self._blue:
+            sig_u = self.row_signature(u)
             for v in self.ot.keys():
-                if u == v:
-                    continue
-                for e in self.exp:
-                    if self.entry_exists(u, e) and self.entry_exists(v, e):
-                        ue = self.get(u, e)
-                        ve = self.get(v, e)
-
-                        if ue is not None and ve is not None \
-                                and ue != ve:
-                            return True, u
+                if u != v and self._conflicts(sig_u, self.row_signature(v)) & exp:
+                    return True, u
+
         return False, None
 
     def is_closed_and_consistent(self) -> Tuple[bool, bool]:
@@ -153,9 +353,10 @@ class ObservationTable:
                  closed.
         :rtype: tuple(bool, str)
         """
-        for u in self._blue:
-            if not any([self.ot[u] == self.ot[s] for s in self._red]):
-                return False, u
+        self._update_tracking()
+
+        if len(self._unclosed) != 0:
+            return False, min(self._unclosed)
 
         return True, ''
 
@@ -166,19 +367,56 @@ class ObservationTable:
         :return: Boolean indicating whether the table is consistent.
         :rtype: bool
         """
-        for s1 in self._red:
-            for s2 in self._red:
-                if s1 == s2:
+        return self.find_inconsistency() is None
+
+    def find_inconsistency(self) -> Tuple[str, str, str, str]:
+        """
+        Finds two red rows s1 and s2 with equal rows in the table
+        and a letter a and column e such that the entries of the
+        rows s1.a and s2.a in column e are different. The red rows
+        are grouped by their signature, so that only rows that are
+        equal are compared with each other.
+
+        :return: s1, s2, a and e, or None if the table
+                 is consistent.
+        :rtype: tuple(str, str, str, str)
+        """
+        self._update_tracking()
+
+        for sig in self._inconsistent:
+            return self._group_inconsistency(self._red_index[sig])
+
+        return None
+
+    def _group_inconsistency(self, group: Set[str]) -> Tuple[str, str, str, str]:
+        """
+        Finds an inconsistency among red rows that are equal.
+
+        :param group: Red rows with the same signature
+        :type group: Set[str]
+        :return: s1, s2, a and e, or None if the rows
+                 are consistent with each other.
+        :rtype: tuple(str, str, str, str)
+        """
+        if len(group) < 2:
+            return None
+
+        for a in self._alphabet:
+            s1 = None
+            for s2 in group:
+                if not self.row_exists(s2 + a):
+                    continue
+                if s1 is None:
+                    s1 = s2
                     continue
 
-                for a in self._alphabet:
-                    for e in self.exp:
-                        if self.get_row(s1) == self.get_row(s2) and \
-                            self.entry_exists(s1 + a, e) and self.entry_exists(s2 + a, e) \
-                                and self.get(s1 + a, e) != self.get(s2 + a, e):
-                            return False
+                (k1, v1), (k2, v2) = self.row_signature(s1 + a), self.row_signature(s2 + a)
+                diff = (k1 ^ k2) | ((v1 ^ v2) & k1 & k2)
+                if diff != 0:
+                    e = self._column_names[(diff & -diff).bit_length() - 1]
+                    return s1, s2, a, e
 
-        return True
+        return None
 
     def find_compatible_row(self, p: str):
         """
@@ -190,16 +428,13 @@ class ObservationTable:
         :return: The row compatible with p, or None if no
                  row exists.
         """
-        for r in self._red:
-
-            if p not in self.ot or r not in self.ot:
-                continue
+        if p not in self.ot:
+            return None
 
-            p1 = self.ot[p]
-            r1 = self.ot[r]
-
-            if not any([(e in p1 and e in r1) and ((p1[e] == 0 and r1[e] == 1)
-                    or (p1[e] == 1 and r1[e] == 0)) for e in self.exp]):
+        exp = self._experiments_mask()
+        sig_p = self.row_signature(p)
+        for r in self._red:
+            if r in self.ot and self._conflicts(sig_p, self.row_signature(r)) & exp == 0:
                 return r
 
         return None
@@ -214,6 +449,8 @@ class ObservationTable:
         """
         if r not in self.ot.keys():
             self.ot[r] = {i: None for i in self.exp}
+            self._signatures[r] = 0, 0
+            self._dirty.add(r)
 
     def add_column_to_table(self, c: str):
         """
@@ -225,6 +462,7 @@ class ObservationTable:
         """
         for row in self.ot.keys():
             self.ot[row][c] = None
+            self._set_bit(row, c, None)
 
     def find_holes(self) -> Generator:
         """
@@ -253,6 +491,9 @@ class ObservationTable:
                               self._alphabet.copy())
 
         ot.ot = copy.deepcopy(self.ot)
+        ot._columns = self._columns.copy()
+        ot._column_names = self._column_names.copy()
+        ot._signatures = self._signatures.copy()
         ot.exp = self.exp.copy()
         ot.sta = self.sta.copy()
 
@@ -3,8 +3,12 @@ Module containing utility functions such as
 on sets.
 """
 
+import gzip
 import itertools
-from typing import Set, Generator, Tuple
+import sys
+from typing import Set, Generator, Tuple, Iterable, Union, IO
+
+_GZIP_MAGIC = b'\x1f\x8b'
 
 
 def prefix_set(s: Set[str]) -> Generator:
@@ -97,6 +101,76 @@ def break_strings_in_two(red: Set[str]) -> Set[Tuple[str, str]]:
     return we
 
 
+def read_examples(source: Union[str, IO, Iterable[str]], chunk_size: int=1 << 20) -> Generator:
+    """
+    Reads example strings, one per line, from the given source
+    without loading the whole source into memory. The source
+    can be a path to a plain or gzip compressed file, '-' for
+    the standard input, a file object or an iterable of strings.
+    Files are read in chunks of chunk_size bytes, and every line
+    is stripped of surrounding whitespace.
+
+    :param source: Where to read the example strings from
+    :type source: Union[str, IO, Iterable[str]]
+    :param chunk_size: Number of bytes (or characters) to
+                       read at a time
+    :type chunk_size: int
+    :return: Generator with the example strings
+    :rtype: Generator[str]
+    """
+    if isinstance(source, str):
+        if source == '-':
+            yield from _read_lines(sys.stdin.buffer, chunk_size)
+            return
+
+        with open(source, 'rb') as f:
+            if f.peek(len(_GZIP_MAGIC))[:len(_GZIP_MAGIC)] == _GZIP_MAGIC:
+                with gzip.GzipFile(fileobj=f) as gz:
+                    yield from _read_lines(gz, chunk_size)
+            else:
+                yield from _read_lines(f, chunk_size)
+    elif hasattr(source, 'read'):
+        yield from _read_lines(source, chunk_size)
+    else:
+        yield from source
+
+
+def _read_lines(stream: IO, chunk_size: int) -> Generator:
+    """
+    Splits the chunks read from a binary or text
+    stream into stripped lines.
+
+    :param stream: The stream to read
+    :type stream: IO
+    :param chunk_size: Number of bytes (or characters) to
+                       read at a time
+    :type chunk_size: int
+    :return: Generator with the lines of the stream
+    :rtype: Generator[str]
+    """
+    rest = None
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+
+        if rest:
+            chunk = rest + chunk
+
+        lines = chunk.split(b'\n' if isinstance(chunk, bytes) else '\n')
+        rest = lines.pop()
+
+        for line in lines:
+            yield _decode(line).strip()
+
+    if rest:
+        yield _decode(rest).strip()
+
+
+def _decode(line: Union[str, bytes]) -> str:
+    return line.decode('utf-8') if isinstance(line, bytes) else line
+
+
 def _get_all_combinations(s: Set[str], repeat: int) -> Generator:
     for rep in range(repeat + 1):
         for p in itertools.product(s, repeat=rep):
@@ -21,5 +21,6 @@ setup(
         'Programming Language :: Python :: 3.7',
     ],
     install_requires=["graphviz"],
+    extras_require={"numpy": ["numpy"]},
     python_requires='>=3.7',
 )
@@ -0,0 +1,115 @@
+import unittest
+import random
+import itertools
+from typing import Set, Generator
+from inferrer import algorithms, automaton, Learner
+
+
+class TestEDSM(unittest.TestCase):
+
+    def test_edsm_01(self):
+        s_plus = {'aaa', 'aaba', 'bba', 'bbaba'}
+        s_minus = {'a', 'bb', 'aab', 'aba'}
+        edsm = algorithms.EDSM(s_plus, s_minus, {'a', 'b'})
+        dfa = edsm.learn()
+
+        for s in s_plus:
+            self.assertTrue(dfa.parse_string(s)[1])
+        for s in s_minus:
+            self.assertFalse(dfa.parse_string(s)[1])
+
+    def test_edsm_02(self):
+        s_plus = {'a' * i for i in range(50)}
+
+        edsm = algorithms.EDSM(s_plus, set(), {'a'})
+        dfa = edsm.learn()
+
+        self.assertEqual(1, len(dfa.states))
+        self.assertEqual(1, len(dfa.accept_states))
+        self.assertTrue(dfa.parse_string('a' * 1000)[1])
+
+    def test_edsm_03(self):
+        """
+        try to let EDSM learn the regular language L.
+        L is a regular language over the alphabet {0, 1} where
+        each string contains an odd number of 1s.
+        """
+        random.seed(10012)
+        s_plus = set()
+        s_minus = set()
+
+        for i in range(1, 15, 2):
+            s_plus.add('1' * i + '0' * random.randint(0, 6))
+            s_minus.add('1' * (i - 1) + '0' * random.randint(0, 6))
+
+        edsm = algorithms.EDSM(s_plus, s_minus, {'0', '1'})
+        dfa = edsm.learn()
+
+        self.assertEqual(2, len(dfa.states))
+        for s in self._combinations({'0', '1'}, 8):
+            self.assertEqual(s.count('1') % 2 == 1, dfa.parse_string(s)[1])
+
+    def test_edsm_04(self):
+        """
+        try to let EDSM learn the regular language L.
+        L is a regular language over the alphabet {0, 1} where
+        each string contains 101 as a substring.
+        """
+        s_plus = set()
+        s_minus = set()
+        for s in self._combinations({'0', '1'}, 6):
+            if '101' in s:
+                s_plus.add(s)
+            else:
+                s_minus.add(s)
+
+        edsm = algorithms.EDSM(s_plus, s_minus, {'0', '1'})
+        dfa = edsm.learn()
+
+        self.assertEqual(4, len(dfa.minimize().states))
+        for s in self._combinations({'0', '1'}, 9):
+            self.assertEqual('101' in s, dfa.parse_string(s)[1])
+
+    def test_edsm_05(self):
+        s_plus = {'ab', 'abab', 'ababab', 'abababab'}
+        s_minus = {'', 'a', 'b', 'ba', 'aba', 'abb', 'abba', 'aab'}
+
+        learner = Learner(alphabet={'a', 'b'},
+                          pos_examples=s_plus,
+                          neg_examples=s_minus,
+                          algorithm='edsm')
+        dfa = learner.learn_grammar()
+
+        self.assertTrue(isinstance(dfa, automaton.DFA))
+        for s in s_plus:
+            self.assertTrue(dfa.parse_string(s)[1])
+        for s in s_minus:
+            self.assertFalse(dfa.parse_string(s)[1])
+
+    def test_edsm_workers_01(self):
+        s_plus = set()
+        s_minus = set()
+        for s in self._combinations({'0', '1'}, 6):
+            if '101' in s:
+                s_plus.add(s)
+            else:
+                s_minus.add(s)
+
+        sequential = algorithms.EDSM(s_plus, s_minus, {'0', '1'}).learn()
+        parallel = algorithms.EDSM(s_plus, s_minus, {'0', '1'}, workers=2).learn()
+
+        self.assertEqual(sequential, parallel)
+        self.assertSetEqual(sequential.states, parallel.states)
+        self.assertSetEqual(sequential.accept_states, parallel.accept_states)
+
+        self.assertRaises(ValueError, algorithms.EDSM, s_plus, s_minus, {'0', '1'}, 0)
+
+    @staticmethod
+    def _combinations(s: Set[str], repeat: int) -> Generator:
+        for rep in range(repeat + 1):
+            for p in itertools.product(s, repeat=rep):
+                yield ''.join(p)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+import itertools
+from inferrer import automaton, algorithms, oracle, Learner
+from typing import Generator, List, Set, Tuple
+
+
+class PaddingOracle(oracle.ActiveOracle):
+    """
+    Counts the membership queries, and returns the shortest
+    counterexample in which every symbol is followed by ten b's.
+    """
+
+    def __init__(self, fsa: automaton.FSA):
+        super().__init__(fsa)
+        self.queries = 0
+
+    def membership_query(self, s: str) -> bool:
+        self.queries += 1
+        return super().membership_query(s)
+
+    def membership_queries(self, strings: List[str]) -> List[bool]:
+        self.queries += len(strings)
+        return super().membership_queries(strings)
+
+    def equivalence_query(self, fsa: automaton.FSA) -> Tuple[str, bool]:
+        for rep in range(10):
+            for p in itertools.product(sorted(self._fsa.alphabet), repeat=rep):
+                s = ''.join(a + 'b' * 10 for a in p)
+                if fsa.parse_string(s)[1] != self._fsa.parse_string(s)[1]:
+                    return s, False
+
+        return '', True
+
+
+class TestActiveKV(unittest.TestCase):
+
+    def test_active_kv_01(self):
+        """
+        Try to let KV learn Kleene plus.
+        The alphabet is sigma = {a} and the
+        language accepts every string with 1
+        or more a's.
+        """
+        q0 = automaton.State('0')
+        q1 = automaton.State('1')
+
+        expected_dfa = automaton.DFA({'a'}, start_state=q0)
+
+        expected_dfa.add_transition(q0, q1, 'a')
+        expected_dfa.add_transition(q1, q1, 'a')
+
+        expected_dfa.accept_states.add(q1)
+
+        teacher = oracle.ActiveOracle(expected_dfa)
+        kv = algorithms.KV({'a'}, teacher)
+        dfa = kv.learn()
+
+        self.assertEqual(2, len(dfa.states))
+        self.assertEqual(1, len(dfa.accept_states))
+        self.assertFalse(dfa.parse_string('')[1])
+        self.assertTrue(dfa.parse_string('a' * 100)[1])
+
+    def test_active_kv_02(self):
+        """
+        Try to let KV learn the regular language A.
+        A is a language over the alphabet sigma = {0, 1},
+        where each string contains 101 as a substring.
+        """
+        q0 = automaton.State('0')
+        q1 = automaton.State('1')
+        q2 = automaton.State('2')
+        q3 = automaton.State('3')
+
+        expected_dfa = automaton.DFA({'0', '1'}, start_state=q0)
+
+        expected_dfa.add_transition(q0, q0, '0')
+        expected_dfa.add_transition(q0, q1, '1')
+        expected_dfa.add_transition(q1, q2, '0')
+        expected_dfa.add_transition(q1, q1, '1')
+        expected_dfa.add_transition(q2, q0, '0')
+        expected_dfa.add_transition(q2, q3, '1')
+        expected_dfa.add_transition(q3, q3, '0')
+        expected_dfa.add_transition(q3, q3, '1')
+
+        expected_dfa.accept_states.add(q3)
+
+        learner = Learner(alphabet={'0', '1'},
+                          oracle=oracle.ActiveOracle(expected_dfa),
+                          algorithm='kv')
+        dfa = learner.learn_grammar()
+
+        self.assertEqual(4, len(dfa.states))
+        self.assertTrue(dfa.is_equivalent(expected_dfa))
+        for s in self._combinations({'0', '1'}, 8):
+            self.assertEqual('101' in s, dfa.parse_string(s)[1])
+
+    def test_active_kv_03(self):
+        """
+        Learn the language of the strings over {a, b} in which
+        the number of a's is divisible by 5 from an oracle that
+        pads its counterexamples with b's.
+        """
+        states = [automaton.State(str(i)) for i in range(5)]
+        expected_dfa = automaton.DFA({'a', 'b'}, start_state=states[0])
+        for i, q in enumerate(states):
+            expected_dfa.add_transition(q, states[(i + 1) % 5], 'a')
+            expected_dfa.add_transition(q, q, 'b')
+        expected_dfa.accept_states.add(states[0])
+
+        kv_teacher = PaddingOracle(expected_dfa)
+        dfa = algorithms.KV({'a', 'b'}, kv_teacher).learn()
+
+        self.assertEqual(5, len(dfa.states))
+        self.assertTrue(dfa.is_equivalent(expected_dfa))
+        for s in self._combinations({'a', 'b'}, 8):
+            self.assertEqual(s.count('a') % 5 == 0, dfa.parse_string(s)[1])
+
+        lstar_teacher = PaddingOracle(expected_dfa)
+        algorithms.LSTAR({'a', 'b'}, lstar_teacher).learn()
+
+        self.assertLess(kv_teacher.queries, lstar_teacher.queries)
+
+    @staticmethod
+    def _combinations(s: Set[str], repeat: int) -> Generator:
+        for rep in range(repeat + 1):
+            for p in itertools.product(s, repeat=rep):
+                yield ''.join(p)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,35 @@
 import unittest
 import itertools
 from inferrer import automaton, algorithms, oracle
-from typing import Set, Generator
+from typing import Generator, List, Set, Tuple
+
+
+class PaddingOracle(oracle.ActiveOracle):
+    """
+    Counts the membership queries, and returns the shortest
+    counterexample in which every symbol is followed by ten b's.
+    """
+
+    def __init__(self, fsa: automaton.FSA):
+        super().__init__(fsa)
+        self.queries = 0
+
+    def membership_query(self, s: str) -> bool:
+        self.queries += 1
+        return super().membership_query(s)
+
+    def membership_queries(self, strings: List[str]) -> List[bool]:
+        self.queries += len(strings)
+        return super().membership_queries(strings)
+
+    def equivalence_query(self, fsa: automaton.FSA) -> Tuple[str, bool]:
+        for rep in range(10):
+            for p in itertools.product(sorted(self._fsa.alphabet), repeat=rep):
+                s = ''.join(a + 'b' * 10 for a in p)
+                if fsa.parse_string(s)[1] != self._fsa.parse_string(s)[1]:
+                    return s, False
+
+        return '', True
 
 
 class TestActiveLSTAR(unittest.TestCase):
@@ -446,6 +474,57 @@ class TestActiveLSTAR(unittest.TestCase):
 
         self.assertEqual(expected_dfa, dfa)
 
+    def test_active_lstar_13(self):
+        """
+        Learn the language of the strings over {a, b} in which
+        the number of a's is divisible by 5 from an oracle that
+        pads its counterexamples with b's, with every way of
+        processing counterexamples.
+        """
+        states = [automaton.State(str(i)) for i in range(5)]
+        expected_dfa = automaton.DFA({'a', 'b'}, start_state=states[0])
+        for i, q in enumerate(states):
+            expected_dfa.add_transition(q, states[(i + 1) % 5], 'a')
+            expected_dfa.add_transition(q, q, 'b')
+        expected_dfa.accept_states.add(states[0])
+
+        queries = {}
+        for processing in ['angluin', 'maler-pnueli', 'rivest-schapire']:
+            teacher = PaddingOracle(expected_dfa)
+            dfa = algorithms.LSTAR({'a', 'b'}, teacher, processing).learn()
+
+            for s in self._combinations({'a', 'b'}, 8):
+                self.assertEqual(s.count('a') % 5 == 0, dfa.parse_string(s)[1])
+            self.assertTrue(dfa.is_equivalent(expected_dfa))
+            queries[processing] = teacher.queries
+
+        self.assertLess(queries['rivest-schapire'], queries['angluin'])
+
+    def test_active_lstar_14(self):
+        """
+        The counterexamples of the oracle are exact, so L* learns
+        the language of the strings over {a, b} in which the number
+        of a's is divisible by k, for counters of any length.
+        """
+        for k in range(6, 10):
+            states = [automaton.State(str(i)) for i in range(k)]
+            expected_dfa = automaton.DFA({'a', 'b'}, start_state=states[0])
+            for i, q in enumerate(states):
+                expected_dfa.add_transition(q, states[(i + 1) % k], 'a')
+                expected_dfa.add_transition(q, q, 'b')
+            expected_dfa.accept_states.add(states[0])
+
+            for processing in ['angluin', 'maler-pnueli', 'rivest-schapire']:
+                teacher = oracle.ActiveOracle(expected_dfa)
+                dfa = algorithms.LSTAR({'a', 'b'}, teacher, processing).learn()
+
+                self.assertIsNone(expected_dfa.find_distinguishing_word(dfa))
+                self.assertEqual(k, len(dfa.minimize().states))
+
+    def test_active_lstar_15(self):
+        with self.assertRaises(ValueError):
+            algorithms.LSTAR({'a'}, oracle.ActiveOracle(automaton.DFA({'a'})), 'kearns')
+
     @staticmethod
     def _combinations(s: Set[str], repeat: int) -> Generator:
         for rep in range(repeat + 1):
@@ -1,4 +1,5 @@
 import unittest
+import random
 from inferrer import oracle
 from inferrer.algorithms.active.nlstar.observation_table import ObservationTable
 from inferrer.algorithms.active.nlstar.row import Row
@@ -91,6 +92,75 @@ class TestObservationTable(unittest.TestCase):
         for i in ['aa', 'aba']:
             self.assertTrue(i in map(lambda r: r.prefix, composed_rows))
 
+    def test_ot_03(self):
+        """
+        Add random rows and suffixes to the table and compare
+        the prime rows with the definition: a row is prime if it
+        is in the upper part, or if it is not the join of the
+        other rows that cover it.
+        """
+        random.seed(2021)
+        s_plus = {''.join(random.choice('ab') for _ in range(random.randint(0, 8)))
+                  for _ in range(200)}
+        teacher = oracle.PassiveOracle(s_plus, set())
+
+        ot = ObservationTable({'a', 'b'}, teacher)
+        ot.initialize()
+
+        for _ in range(30):
+            if random.random() < 0.3:
+                ot.add_new_suffixes({''.join(random.choice('ab') for _ in range(3))})
+            else:
+                row = Row(''.join(random.choice('ab') for _ in range(random.randint(1, 6))))
+                if row.prefix in ot.prefix_to_row:
+                    continue
+                ot.rows.add(row)
+                ot.lower_rows.add(row)
+                ot.prefix_to_row[row.prefix] = row
+                ot.add_columns_to_row(row)
+
+            ot.update_meta_data()
+
+            for row in ot.rows:
+                covering = [r for r in ot.rows if r != row and row.covered_by(r)]
+                prime = row in ot.upper_rows or not row.is_composed(covering)
+
+                self.assertEqual(prime, row in ot.primes)
+                self.assertDictEqual({suffix: teacher.membership_query(row.prefix + suffix)
+                                      for suffix in ot.suffixes}, dict(row.columns))
+
+    def test_row_01(self):
+        row1 = Row('a')
+        row2 = Row('b')
+        row1.columns = {'': 0, 'a': 1, 'aa': 0}
+        row2.columns = {'aa': 1, 'a': 1, '': 0}
+
+        index1, index2 = row1.index, row2.index
+
+        self.assertTrue(row1.covered_by(row2))
+        self.assertFalse(row2.covered_by(row1))
+
+        joined = Row.join([row1, row2])
+        self.assertTrue(joined.columns_are_equal(row2))
+        self.assertDictEqual({'': False, 'a': True, 'aa': True}, dict(joined.columns))
+
+        self.assertIs(index1, row1.index)
+        self.assertIs(index2, row2.index)
+        self.assertDictEqual({'': False, 'a': True, 'aa': True}, dict(row2.columns))
+
+        with self.assertRaises(TypeError):
+            row1.columns['a'] = False
+        row1.set('a', False)
+        self.assertFalse(row1.get('a'))
+        row1.set('a', True)
+
+        row3 = Row('c', index1)
+        row3.columns = {'': 1, 'a': 1, 'aa': 0}
+        self.assertFalse(row3.covered_by(row2))
+        self.assertTrue(row1.covered_by(row3))
+        self.assertIs(index1, Row.join([row1, row3]).index)
+        self.assertIs(index2, row2.index)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,7 +2,7 @@ import unittest
 import itertools
 import random
 from typing import Set, Generator
-from inferrer import algorithms, oracle
+from inferrer import algorithms, automaton, oracle
 from inferrer.algorithms.active.nlstar.observation_table import ObservationTable
 from inferrer.algorithms.active.nlstar.row import Row
 
@@ -224,6 +224,24 @@ class TestPassiveNLSTAR(unittest.TestCase):
 
         self.assertEqual(9, len(nlstar._ot.rows))
 
+    def test_build_hypothesis_02(self):
+        s_plus = {s for s in self._combinations({'a', 'b'}, 6) if s.endswith('ab')}
+        s_minus = set(self._combinations({'a', 'b'}, 6)) - s_plus
+
+        nlstar = algorithms.NLSTAR({'a', 'b'}, oracle.PassiveOracle(s_plus, s_minus))
+        nlstar.learn()
+
+        nfa = nlstar._build_hypothesis()
+        other = nlstar._build_hypothesis()
+
+        states = {state.name for state in nfa.get_states()}
+        self.assertSetEqual({str(i) for i in range(len(states))}, states)
+        self.assertTrue(automaton.State('0') in nfa._start_states)
+        self.assertEqual(str(nfa), str(other))
+
+        for s in self._combinations({'a', 'b'}, 6):
+            self.assertEqual(s.endswith('ab'), nfa.parse_string(s)[1])
+
     def test_passive_nlstar_01(self):
         s_plus = {'a' * i for i in range(25)}
 
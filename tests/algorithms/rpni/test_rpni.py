@@ -3,7 +3,7 @@ import random
 import itertools
 from collections import OrderedDict
 from typing import Set, Generator
-from inferrer import algorithms, automaton
+from inferrer import algorithms, automaton, Learner
 
 
 class TestRPNI(unittest.TestCase):
@@ -204,11 +204,9 @@ class TestRPNI(unittest.TestCase):
         rpni = algorithms.RPNI(s_plus, s_minus, {'0', '1'})
         dfa = rpni.learn()
 
-        self.assertEqual(10, len(dfa.states))
-        self.assertSetEqual({automaton.State(''), automaton.State('111111111')}, dfa.accept_states)
-        self.assertSetEqual({automaton.State('1'), automaton.State('11'),
-                             automaton.State('111111'),
-                             automaton.State('1111')}, dfa.reject_states)
+        self.assertEqual(2, len(dfa.states))
+        self.assertSetEqual({automaton.State('1')}, dfa.accept_states)
+        self.assertSetEqual({automaton.State('')}, dfa.reject_states)
 
         for s in s_plus:
             self.assertTrue(dfa.parse_string(s)[1])
@@ -740,6 +738,67 @@ class TestRPNI(unittest.TestCase):
         for s in s_minus:
             self.assertFalse(dfa.parse_string(s)[1])
 
+    def test_rpni_rollback_01(self):
+        s_plus = {'aaa', 'aaba', 'bba', 'bbaba'}
+        s_minus = {'a', 'bb', 'aab', 'aba'}
+        rpni = algorithms.RPNI(s_plus, s_minus, {'a', 'b'})
+
+        tree = automaton.PrefixTree(s_plus, s_minus)
+        pta = tree.to_dfa()
+        quotient = automaton.Quotient(tree)
+        q_lambda = quotient.node(automaton.State(''))
+        qa = quotient.node(automaton.State('a'))
+
+        journal = []
+        self.assertFalse(rpni._merge(quotient, q_lambda, qa, journal))
+        self.assertEqual(q_lambda, quotient.find(qa))
+        self.assertTrue(len(journal) > 0)
+
+        quotient.rollback(journal)
+        self.assertEqual(qa, quotient.find(qa))
+        self.assertEqual(0, len(journal))
+        self.assertEqual(pta, quotient.to_dfa())
+
+        dfa = quotient.to_dfa()
+        for s in rpni._pos_examples.union(rpni._neg_examples):
+            self.assertEqual(pta.parse_string(s), dfa.parse_string(s))
+
+    def test_rpni_workers_01(self):
+        s_plus = set()
+        s_minus = set()
+        for s in self._combinations({'0', '1'}, 6):
+            if '101' in s:
+                s_plus.add(s)
+            else:
+                s_minus.add(s)
+
+        sequential = algorithms.RPNI(s_plus, s_minus, {'0', '1'}).learn()
+        parallel = algorithms.RPNI(s_plus, s_minus, {'0', '1'}, workers=2).learn()
+
+        self.assertEqual(sequential, parallel)
+        self.assertSetEqual(sequential.states, parallel.states)
+        self.assertSetEqual(sequential.accept_states, parallel.accept_states)
+
+        self.assertRaises(ValueError, algorithms.RPNI, s_plus, s_minus, {'0', '1'}, 0)
+
+    def test_rpni_learner_iterables_01(self):
+        s_plus = ['a' * i for i in range(1, 21, 2)]
+        s_minus = ['a' * i for i in range(0, 21, 2)]
+
+        learner = Learner(pos_examples=iter(s_plus + s_plus),
+                          neg_examples=(s for s in s_minus),
+                          algorithm='rpni')
+        dfa = learner.learn_grammar()
+
+        self.assertEqual(2, len(dfa.states))
+        for s in s_plus:
+            self.assertTrue(dfa.parse_string(s)[1])
+        for s in s_minus:
+            self.assertFalse(dfa.parse_string(s)[1])
+
+        self.assertRaises(ValueError, Learner, pos_examples=iter(s_plus),
+                          neg_examples=iter(s_plus), algorithm='rpni')
+
     @staticmethod
     def _combinations(s: Set[str], repeat: int) -> Generator:
         for rep in range(repeat + 1):
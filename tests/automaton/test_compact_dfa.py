@@ -0,0 +1,138 @@
+import unittest
+import itertools
+from inferrer import automaton
+from inferrer.automaton import compact_dfa
+
+
+class TestCompactDFA(unittest.TestCase):
+
+    def test_compact_dfa_01(self):
+        dfa = automaton.CompactDFA({'a', 'b'}, 2)
+
+        dfa.add_transition(0, 1, 'a')
+        dfa.add_transition(1, 0, 'a')
+        dfa.add_transition(1, 1, 'b')
+        dfa.set_accepting(1)
+
+        self.assertEqual(1, dfa.transition(0, 'a'))
+        self.assertEqual(automaton.CompactDFA.SINK, dfa.transition(0, 'b'))
+        self.assertEqual(automaton.CompactDFA.SINK, dfa.transition(0, 'c'))
+
+        self.assertTrue(dfa.accepts('a'))
+        self.assertTrue(dfa.accepts('abbb'))
+        self.assertFalse(dfa.accepts('aa'))
+        self.assertFalse(dfa.accepts('b'))
+        self.assertFalse(dfa.accepts('ac'))
+
+        try:
+            dfa.add_transition(0, 1, 'c')
+            self.fail('CompactDFA should throw ValueError when trying to add'
+                      'transition with letter that is not in the alphabet!')
+        except ValueError:
+            self.assertTrue(True)
+
+    def test_compact_dfa_02(self):
+        alphabet = {'0', '1'}
+
+        q0 = automaton.State('0')
+        q1 = automaton.State('1')
+        q2 = automaton.State('2')
+
+        dfa = automaton.DFA(alphabet, q0)
+
+        dfa.add_transition(q0, q0, '0')
+        dfa.add_transition(q0, q1, '1')
+        dfa.add_transition(q1, q2, '1')
+        dfa.add_transition(q1, q1, '0')
+        dfa.add_transition(q2, q2, '0')
+
+        dfa.accept_states.add(q1)
+        dfa.reject_states.add(q2)
+
+        compact = automaton.CompactDFA.from_dfa(dfa)
+
+        self.assertEqual(3, compact.num_states)
+        self.assertEqual(0, compact.start_state)
+
+        for i in range(8):
+            for s in itertools.product(alphabet, repeat=i):
+                s = ''.join(s)
+                self.assertEqual(dfa.parse_string(s), compact.parse_string(s))
+
+        self.assertEqual(dfa, compact.to_dfa())
+        self.assertSetEqual({q2}, compact.to_dfa().reject_states)
+
+    def test_accepts_many_01(self):
+        dfa = self._even_zeros_dfa()
+
+        strings = ['', '0', '00', '1001', '10x01', '0001', '111', 'x']
+        expected = [dfa.parse_string(s)[1] for s in strings]
+
+        self.assertListEqual(expected, dfa.accepts_many(strings))
+        self.assertListEqual(expected, automaton.CompactDFA.from_dfa(dfa).accepts_many(strings))
+        self.assertListEqual([], dfa.accepts_many([]))
+
+    @unittest.skipIf(compact_dfa.numpy is None, 'NumPy is not installed')
+    def test_accepts_encoded_01(self):
+        import numpy
+        compact = automaton.CompactDFA.from_dfa(self._even_zeros_dfa())
+
+        words = numpy.array([[0, 0, -1, -1],
+                             [0, 1, 0, 1],
+                             [0, 5, 0, 1],
+                             [1, 0, 0, 0],
+                             [1, 1, 1, 1]])
+        lengths = numpy.array([2, 4, 4, 3, 0])
+
+        accepted = compact.accepts_encoded(words, lengths)
+
+        self.assertListEqual([True, True, False, True, True], accepted.tolist())
+
+        words, lengths = compact.encode_many(['00', '0101', '0x01', '100', ''])
+        self.assertListEqual([True, True, False, True, True],
+                             compact.accepts_encoded(words, lengths).tolist())
+
+    @unittest.skipIf(compact_dfa.numpy is None, 'NumPy is not installed')
+    def test_encode_many_01(self):
+        compact = automaton.CompactDFA(set(), 1)
+        compact.accepting[0] = 1
+
+        words, lengths = compact.encode_many(['', 'a', 'ab'])
+
+        self.assertListEqual([[-1, -1], [-1, -1], [-1, -1]], words.tolist())
+        self.assertListEqual([0, 1, 2], lengths.tolist())
+        self.assertListEqual([True, False, False],
+                             compact.accepts_encoded(words, lengths).tolist())
+        self.assertListEqual([True, False, False], compact.accepts_many(['', 'a', 'ab']))
+
+    @unittest.skipIf(compact_dfa.numpy is None, 'NumPy is not installed')
+    def test_accepts_encoded_02(self):
+        compact = automaton.CompactDFA({'a'}, 2)
+        compact.accepting[1] = 1
+        compact.add_transition(0, 1, 'a')
+
+        words, lengths = compact.encode_many(['', 'a', 'aa'])
+        self.assertListEqual([False, True, False],
+                             compact.accepts_encoded(words, lengths).tolist())
+
+        compact.add_transition(1, 1, 'a')
+        self.assertListEqual([False, True, True],
+                             compact.accepts_encoded(words, lengths).tolist())
+
+    @staticmethod
+    def _even_zeros_dfa() -> automaton.DFA:
+        q0 = automaton.State('0')
+        q1 = automaton.State('1')
+        dfa = automaton.DFA({'0', '1'}, q0)
+
+        dfa.add_transition(q0, q1, '0')
+        dfa.add_transition(q0, q0, '1')
+        dfa.add_transition(q1, q0, '0')
+        dfa.add_transition(q1, q1, '1')
+        dfa.accept_states.add(q0)
+
+        return dfa
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,9 @@
 import unittest
+import random
+import itertools
 from collections import OrderedDict
 from inferrer import automaton
+from typing import Generator, Set
 
 
 class TestAutomaton(unittest.TestCase):
@@ -48,6 +51,41 @@ class TestAutomaton(unittest.TestCase):
         self.assertEqual('a', a)
         self.assertEqual(q1, q)
 
+    def test_find_transitions_to_q_01(self):
+        q0 = automaton.State('0')
+        q1 = automaton.State('1')
+        q2 = automaton.State('2')
+        dfa = automaton.DFA({'a', 'b'}, q0)
+
+        dfa.add_transition(q0, q1, 'a')
+        dfa.add_transition(q2, q1, 'a')
+        dfa.add_transition(q1, q1, 'b')
+
+        self.assertSetEqual({q0, q2}, dfa.find_transitions_to_q_with_letter(q1, 'a'))
+        self.assertSetEqual({q1}, dfa.find_transitions_to_q_with_letter(q1, 'b'))
+        self.assertEqual((q0, 'a'), dfa.find_transition_to_q(q1))
+
+        dfa.add_transition(q0, q2, 'a')
+        dfa.add_transition(q2, q2, 'a')
+
+        self.assertSetEqual(set(), dfa.find_transitions_to_q_with_letter(q1, 'a'))
+        self.assertSetEqual({q0, q2}, dfa.find_transitions_to_q_with_letter(q2, 'a'))
+        self.assertEqual((q1, 'b'), dfa.find_transition_to_q(q1))
+
+        cp = dfa.copy()
+        cp.add_transition(q1, q0, 'b')
+
+        self.assertEqual((None, None), cp.find_transition_to_q(q1))
+        self.assertEqual((q1, 'b'), dfa.find_transition_to_q(q1))
+
+        dfa.remove_transition(q1, 'b')
+        dfa.remove_transition(q1, 'b')
+
+        self.assertEqual((None, None), dfa.find_transition_to_q(q1))
+        self.assertSetEqual(set(), dfa.find_transitions_to_q_with_letter(q1, 'b'))
+        self.assertSetEqual({q1}, cp.find_transitions_to_q_with_letter(q0, 'b'))
+        self.assertEqual({(q2, 'a'): {q0, q2}}, dict(dfa._predecessors))
+
     def test_build_pta_01(self):
         positive_examples = {'aa', 'aba', 'bba'}
         negative_examples = {'ab', 'abab'}
@@ -243,6 +281,92 @@ class TestAutomaton(unittest.TestCase):
         self.assertEqual(3, len(minimized_dfa.states))
         self.assertEqual(1, len(minimized_dfa.accept_states))
 
+    def test_minimize_03(self):
+        alphabet = {'a', 'b'}
+        rng = random.Random(7)
+
+        for n in range(1, 40):
+            states = [automaton.State(str(i)) for i in range(n)]
+            dfa = automaton.DFA(alphabet, states[0])
+            for q in states:
+                for a in sorted(alphabet):
+                    if rng.random() < 0.9:
+                        dfa.add_transition(q, rng.choice(states), a)
+                if rng.random() < 0.5:
+                    dfa.accept_states.add(q)
+
+            minimized_dfa = dfa.minimize()
+
+            self.assertEqual(self._count_nerode_classes(dfa), len(minimized_dfa.states))
+            for i in range(7):
+                for s in itertools.product(sorted(alphabet), repeat=i):
+                    s = ''.join(s)
+                    self.assertEqual(dfa.parse_string(s)[1], minimized_dfa.parse_string(s)[1])
+
+    def test_minimize_04(self):
+        rng = random.Random(3)
+
+        for _ in range(40):
+            alphabet = set('abc'[:rng.randint(1, 3)])
+            n = rng.randint(50, 300)
+            defined = rng.choice([0.4, 0.6, 0.8])
+
+            states = [automaton.State(str(i)) for i in range(n)]
+            dfa = automaton.DFA(alphabet, states[0])
+            for q in states:
+                for a in sorted(alphabet):
+                    if rng.random() < defined:
+                        dfa.add_transition(q, rng.choice(states), a)
+                if rng.random() < 0.5:
+                    dfa.accept_states.add(q)
+
+            minimized_dfa = dfa.minimize()
+
+            self.assertEqual(self._count_nerode_classes(dfa), len(minimized_dfa.states))
+            self.assertEqual(len(minimized_dfa.states), len(minimized_dfa.minimize().states))
+            for i in range(6):
+                for s in itertools.product(sorted(alphabet), repeat=i):
+                    s = ''.join(s)
+                    self.assertEqual(dfa.parse_string(s)[1], minimized_dfa.parse_string(s)[1])
+
+    @staticmethod
+    def _count_nerode_classes(dfa: automaton.DFA) -> int:
+        """
+        Counts the states of the minimal dfa with Moore's
+        algorithm, by refining the reachable states of the
+        dfa (completed with a sink) until the signatures
+        stop changing. The sink starts in a class of its own,
+        since a missing transition is not merged with a
+        transition to an explicit dead state.
+        """
+        sink = automaton.State('__sink__')
+        alphabet = sorted(dfa.alphabet)
+
+        reachable = {dfa._start_state}
+        stack = [dfa._start_state]
+        while stack:
+            q = stack.pop()
+            for a in alphabet:
+                r = dfa.transition(q, a) if dfa.transition_exists(q, a) else sink
+                if r not in reachable:
+                    reachable.add(r)
+                    stack.append(r)
+
+        def successor(q, a):
+            if q != sink and dfa.transition_exists(q, a):
+                return dfa.transition(q, a)
+            return sink
+
+        classes = {q: None if q == sink else q in dfa.accept_states for q in reachable}
+        while True:
+            signatures = {q: (classes[q],) + tuple(classes[successor(q, a)] for a in alphabet)
+                          for q in reachable}
+            if len(set(signatures.values())) == len(set(classes.values())):
+                break
+            classes = signatures
+
+        return len({classes[q] for q in reachable if q != sink})
+
     def test_renamed_and_eq_01(self):
         alphabet = {'0', '1'}
 
@@ -296,5 +420,134 @@ class TestAutomaton(unittest.TestCase):
 
         self.assertEqual(expected_dfa, dfa)
 
+    def test_find_distinguishing_word_01(self):
+        """
+        Compare the dfa of the strings over {a, b} in which the
+        number of a's is divisible by k with each other, named
+        in different ways and with or without a dead state.
+        """
+        def mod_dfa(k: int, prefix: str, dead: bool) -> automaton.DFA:
+            states = [automaton.State(prefix + str(i)) for i in range(k)]
+            dfa = automaton.DFA({'a', 'b', 'c'} if dead else {'a', 'b'}, states[0])
+            for i, q in enumerate(states):
+                dfa.add_transition(q, states[(i + 1) % k], 'a')
+                dfa.add_transition(q, q, 'b')
+                if dead:
+                    dfa.add_transition(q, automaton.State('dead'), 'c')
+            dfa.accept_states.add(states[0])
+
+            return dfa
+
+        dfa1 = mod_dfa(3, 'p', False)
+        dfa2 = mod_dfa(3, 'q', True)
+        dfa3 = mod_dfa(6, 'r', False)
+        dfa4 = mod_dfa(2, 's', False)
+
+        self.assertIsNone(dfa1.find_distinguishing_word(dfa2))
+        self.assertTrue(dfa1.is_equivalent(dfa2))
+        self.assertTrue(dfa2.is_equivalent(dfa1))
+        self.assertNotEqual(dfa1, dfa2)
+
+        self.assertEqual('aaa', dfa1.find_distinguishing_word(dfa3))
+        self.assertFalse(dfa3.is_equivalent(dfa1))
+
+        self.assertEqual('aa', dfa1.find_distinguishing_word(dfa4))
+        self.assertFalse(dfa1.is_equivalent(dfa4))
+
+        dfa2.accept_states.add(automaton.State('dead'))
+        self.assertEqual('c', dfa1.find_distinguishing_word(dfa2))
+        self.assertFalse(dfa1.is_equivalent(dfa2))
+
+    def test_find_distinguishing_word_02(self):
+        q0 = automaton.State('0')
+        q1 = automaton.State('1')
+
+        empty = automaton.DFA({'a', 'b'}, q0)
+        self.assertTrue(empty.is_equivalent(automaton.DFA({'a', 'b'}, q1)))
+
+        dfa = automaton.DFA({'a', 'b'}, q0)
+        dfa.add_transition(q0, q0, 'a')
+        dfa.add_transition(q0, q1, 'b')
+        dfa.accept_states.add(q1)
+
+        self.assertEqual('b', empty.find_distinguishing_word(dfa))
+        self.assertEqual('b', dfa.minimize().find_distinguishing_word(empty))
+        self.assertTrue(dfa.is_equivalent(dfa.minimize()))
+        self.assertTrue(dfa.is_equivalent(dfa.rename_states()))
+
+    def test_boolean_operations_01(self):
+        """
+        Combine the dfa of the strings over {a, b} in which the
+        number of a's is even with the dfa of the strings that
+        contain bb, and compare the products with the definitions.
+        """
+        q0, q1, q2 = automaton.State('0'), automaton.State('1'), automaton.State('2')
+
+        even = automaton.DFA({'a', 'b'}, q0)
+        even.add_transition(q0, q1, 'a')
+        even.add_transition(q0, q0, 'b')
+        even.add_transition(q1, q0, 'a')
+        even.add_transition(q1, q1, 'b')
+        even.accept_states.add(q0)
+
+        bb = automaton.DFA({'a', 'b'}, q0)
+        bb.add_transition(q0, q0, 'a')
+        bb.add_transition(q0, q1, 'b')
+        bb.add_transition(q1, q0, 'a')
+        bb.add_transition(q1, q2, 'b')
+        bb.add_transition(q2, q2, 'a')
+        bb.add_transition(q2, q2, 'b')
+        bb.accept_states.add(q2)
+
+        operations = [
+            (even.intersection(bb), lambda s: s.count('a') % 2 == 0 and 'bb' in s),
+            (even.union(bb), lambda s: s.count('a') % 2 == 0 or 'bb' in s),
+            (even.difference(bb), lambda s: s.count('a') % 2 == 0 and 'bb' not in s),
+            (bb.complement(), lambda s: 'bb' not in s)
+        ]
+
+        for dfa, expected in operations:
+            for s in self._combinations({'a', 'b'}, 8):
+                self.assertEqual(expected(s), dfa.parse_string(s)[1])
+
+        self.assertTrue(even.intersection(bb).is_subset(bb))
+        self.assertTrue(bb.is_subset(even.union(bb)))
+        self.assertFalse(bb.is_subset(even))
+        self.assertTrue(even.difference(even).is_empty())
+        self.assertFalse(even.difference(bb).is_empty())
+        self.assertTrue(bb.complement().complement().is_equivalent(bb))
+
+        self.assertEqual(3, len(bb.complement().minimize().states))
+        self.assertEqual(1, len(automaton.DFA({'a', 'b'}).complement().minimize().states))
+
+    def test_boolean_operations_02(self):
+        """
+        Only the reachable pairs of states are explored, so a
+        dfa with many unreachable states does not make the
+        product any larger.
+        """
+        q0, q1 = automaton.State('0'), automaton.State('1')
+
+        dfa = automaton.DFA({'a'}, q0)
+        dfa.add_transition(q0, q1, 'a')
+        dfa.accept_states.add(q1)
+        for i in range(2, 10000):
+            dfa.add_transition(automaton.State(str(i)), automaton.State(str(i - 1)), 'a')
+            dfa.accept_states.add(automaton.State(str(i)))
+
+        product = dfa.intersection(dfa)
+
+        self.assertEqual(2, len(product.states))
+        self.assertFalse(product.is_empty())
+        self.assertTrue(product.is_subset(dfa))
+        self.assertTrue(automaton.DFA({'a'}).is_empty())
+
+    @staticmethod
+    def _combinations(s: Set[str], repeat: int) -> Generator:
+        for rep in range(repeat + 1):
+            for p in itertools.product(s, repeat=rep):
+                yield ''.join(p)
+
+
 if __name__ == '__main__':
     unittest.main()
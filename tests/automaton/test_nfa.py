@@ -1,4 +1,5 @@
 import unittest
+import random
 import itertools
 from inferrer import automaton
 from typing import Set, Generator
@@ -258,6 +259,80 @@ class TestNFA(unittest.TestCase):
         self.assertEqual(4, len(dfa.states))
         self.assertEqual(3, len(dfa.accept_states))
 
+    def test_nfa_to_dfa_05(self):
+        pattern = '0110100110010110011010010110'
+        nfa = automaton.NFA({'0', '1'})
+
+        states = [automaton.State(str(i)) for i in range(len(pattern) + 1)]
+        for state in states:
+            nfa.add_state(state)
+
+        for i, symbol in enumerate(pattern):
+            nfa.add_transition(states[i], states[i + 1], symbol)
+
+        for symbol in ['0', '1']:
+            nfa.add_transition(states[0], states[0], symbol)
+            nfa.add_transition(states[-1], states[-1], symbol)
+
+        nfa.add_start_state(states[0])
+        nfa.add_accepting_state(states[-1])
+
+        dfa = nfa.to_dfa()
+
+        self.assertEqual(len(pattern) + 1, len(dfa.states))
+        self.assertEqual(1, len(dfa.accept_states))
+
+        for s in ['', pattern[:-1], '1' + pattern + '0', '0' + pattern[1:]]:
+            self.assertEqual(nfa.parse_string(s)[1], dfa.parse_string(s)[1])
+
+    def test_nfa_accepts_many_01(self):
+        rng = random.Random(3)
+        alphabet = {'a', 'b'}
+
+        for n in range(1, 12):
+            nfa = automaton.NFA(alphabet)
+            states = [automaton.State(str(i)) for i in range(n)]
+            for state in states:
+                nfa.add_state(state)
+                for symbol in ['a', 'b', '']:
+                    for to_state in states:
+                        if rng.random() < 0.15:
+                            nfa.add_transition(state, to_state, symbol)
+                if rng.random() < 0.3:
+                    nfa.add_accepting_state(state)
+            nfa.add_start_state(states[0])
+
+            dfa = nfa.to_dfa()
+            strings = list(self._combinations(alphabet, 6))
+
+            expected = [dfa.parse_string(s)[1] for s in strings]
+            self.assertListEqual(expected, [nfa.parse_string(s)[1] for s in strings])
+            self.assertListEqual(expected, nfa.accepts_many(strings))
+
+    def test_nfa_parse_string_01(self):
+        nfa = automaton.NFA({'a', 'b'})
+        q0 = automaton.State('q0')
+        q1 = automaton.State('q1')
+        q2 = automaton.State('q2')
+
+        nfa.add_transition(q0, q1, 'a')
+        nfa.add_transition(q0, q0, 'a')
+        nfa.add_transition(q1, q0, '')
+        nfa.add_transition(q1, q1, 'a')
+        nfa.add_transition(q1, q2, 'b')
+        nfa.add_start_state(q0)
+        nfa.add_accepting_state(q2)
+
+        state, accepted = nfa.parse_string('a' * 200)
+        self.assertFalse(accepted)
+        self.assertEqual(q0, state)
+
+        nfa.add_accepting_state(q1)
+
+        state, accepted = nfa.parse_string('a' * 200)
+        self.assertTrue(accepted)
+        self.assertEqual(q1, state)
+
     @staticmethod
     def _combinations(s: Set[str], repeat: int) -> Generator:
         for rep in range(repeat + 1):
@@ -0,0 +1,50 @@
+import unittest
+from inferrer import automaton
+
+
+class TestPrefixTree(unittest.TestCase):
+
+    def test_prefix_tree_01(self):
+        tree = automaton.PrefixTree({'ab', 'abb', 'b'}, {'', 'a'})
+
+        self.assertEqual(5, len(tree))
+        self.assertSetEqual({'a', 'b'}, tree.alphabet)
+
+        abb = tree.find('abb')
+        self.assertEqual('abb', tree.word(abb))
+        self.assertEqual('b', tree.symbol(abb))
+        self.assertEqual(tree.find('ab'), tree.parent(abb))
+        self.assertDictEqual({}, tree.children(abb))
+
+        self.assertTrue(tree.label(abb))
+        self.assertFalse(tree.label(tree.find('a')))
+        self.assertFalse(tree.label(automaton.PrefixTree.ROOT))
+        self.assertIsNone(tree.find('ba'))
+
+        self.assertListEqual(['', 'a', 'b', 'ab', 'abb'],
+                             [tree.word(q) for q in tree.canonical_order()])
+
+        pta = tree.to_dfa()
+        self.assertEqual(5, len(pta.states))
+        for s in ['', 'a', 'b', 'ab', 'abb', 'ba', 'abba']:
+            q = tree.find(s)
+            self.assertEqual(q is not None and tree.label(q) is True, pta.parse_string(s)[1])
+
+    def test_prefix_tree_02(self):
+        tree = automaton.PrefixTree()
+        trace = 'ab' * 2500
+
+        q = tree.add(trace, True)
+        tree.add(trace, True)
+        tree.add(trace[:-1] + 'c', False)
+
+        self.assertEqual(len(trace) + 2, len(tree))
+        self.assertEqual(2, tree.count(q))
+        self.assertEqual(trace, tree.word(q))
+        self.assertSetEqual({'a', 'b', 'c'}, tree.alphabet)
+
+        self.assertRaises(ValueError, tree.add, trace, False)
+
+
+if __name__ == '__main__':
+    unittest.main()
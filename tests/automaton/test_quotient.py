@@ -0,0 +1,68 @@
+import unittest
+from inferrer import automaton
+
+
+class TestQuotient(unittest.TestCase):
+
+    def test_quotient_01(self):
+        tree = automaton.PrefixTree({'a', 'aaa'}, {'', 'aa'})
+        pta = tree.to_dfa()
+        quotient = automaton.Quotient(tree)
+
+        self.assertEqual(pta, quotient.to_dfa())
+
+        q_lambda = quotient.node(automaton.State(''))
+        qa = quotient.node(automaton.State('a'))
+        qaa = quotient.node(automaton.State('aa'))
+
+        self.assertEqual(qa, quotient.transition(q_lambda, 'a'))
+        self.assertTrue(quotient.merge(q_lambda, qaa))
+        self.assertEqual(q_lambda, quotient.transition(qa, 'a'))
+        self.assertEqual(2, quotient.evidence)
+
+        dfa = quotient.to_dfa()
+        self.assertSetEqual({automaton.State(''), automaton.State('a')}, dfa.states)
+        self.assertSetEqual({automaton.State('a')}, dfa.accept_states)
+        self.assertSetEqual({automaton.State('')}, dfa.reject_states)
+        self.assertTrue(dfa.parse_string('a' * 11)[1])
+        self.assertFalse(dfa.parse_string('a' * 10)[1])
+
+    def test_quotient_rollback_01(self):
+        tree = automaton.PrefixTree({'ab', 'abab', 'b'}, {'a', 'aba', ''})
+        pta = tree.to_dfa()
+        quotient = automaton.Quotient(tree)
+        q_lambda = quotient.node(automaton.State(''))
+
+        conflicts = 0
+        for q in sorted(map(quotient.node, pta.states)):
+            journal = []
+            if not quotient.merge(q_lambda, q, journal):
+                conflicts += 1
+
+            quotient.rollback(journal)
+            self.assertEqual(q, quotient.find(q))
+            self.assertEqual(pta, quotient.to_dfa())
+            for s in ['', 'a', 'ab', 'aba', 'abab', 'b', 'bb']:
+                self.assertEqual(pta.parse_string(s), quotient.to_dfa().parse_string(s))
+
+        self.assertTrue(conflicts > 0)
+
+    def test_quotient_node_01(self):
+        tree = automaton.PrefixTree({'ab', 'ba', 'abb'}, {'b', 'aab'})
+        pta = tree.to_dfa()
+        quotient = automaton.Quotient(tree)
+        del tree
+
+        nodes = sorted(map(quotient.node, pta.states))
+        self.assertListEqual(list(range(len(pta.states))), nodes)
+        for q in pta.states:
+            self.assertEqual(q, quotient.state(quotient.node(q)))
+
+        with self.assertRaises(ValueError):
+            quotient.node(automaton.State('bb'))
+        with self.assertRaises(ValueError):
+            quotient.node(automaton.State('abba'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import asyncio
+import unittest
+from inferrer import automaton, algorithms, oracle
+from typing import Tuple
+
+
+class StandInServer:
+    """
+    A local stand-in for a system under learning that is
+    reached over the network. Every connection sends one
+    string per line and gets back 1 if the string is in
+    the language and 0 if it is not.
+    """
+
+    def __init__(self, dfa: automaton.DFA, delay: float=0.001):
+        self._dfa = dfa
+        self._delay = delay
+        self._server = None
+
+        self.port = None
+        self.active = 0
+        self.max_active = 0
+        self.queries = 0
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        s = (await reader.readline()).decode().rstrip('\n')
+
+        self.queries += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self._delay)
+        self.active -= 1
+
+        writer.write(b'1\n' if self._dfa.parse_string(s)[1] else b'0\n')
+        await writer.drain()
+        writer.close()
+
+
+class NetworkOracle(oracle.AsyncOracle):
+
+    def __init__(self, port: int, dfa: automaton.DFA):
+        super().__init__()
+        self._port = port
+        self._teacher = oracle.ActiveOracle(dfa)
+
+    async def membership_query(self, s: str) -> bool:
+        reader, writer = await asyncio.open_connection('127.0.0.1', self._port)
+        writer.write(s.encode() + b'\n')
+        await writer.drain()
+
+        answer = await reader.readline()
+        writer.close()
+
+        return answer == b'1\n'
+
+    async def equivalence_query(self, fsa: automaton.FSA) -> Tuple[str, bool]:
+        return self._teacher.equivalence_query(fsa)
+
+
+class TestAsyncOracle(unittest.TestCase):
+
+    def test_async_oracle_01(self):
+        dfa = self._odd_a_dfa()
+
+        async def learn() -> Tuple[automaton.DFA, StandInServer]:
+            server = StandInServer(dfa)
+            await server.start()
+            try:
+                lstar = algorithms.LSTAR({'a', 'b'}, NetworkOracle(server.port, dfa))
+                return await lstar.learn_async(max_concurrency=3), server
+            finally:
+                await server.stop()
+
+        hypothesis, server = asyncio.run(learn())
+
+        self.assertEqual(algorithms.LSTAR({'a', 'b'}, oracle.ActiveOracle(dfa)).learn(),
+                         hypothesis)
+        self.assertTrue(1 < server.max_active <= 3)
+
+    def test_async_oracle_02(self):
+        dfa = self._odd_a_dfa()
+
+        async def learn() -> automaton.NFA:
+            server = StandInServer(dfa)
+            await server.start()
+            try:
+                nlstar = algorithms.NLSTAR({'a', 'b'}, NetworkOracle(server.port, dfa))
+                return await nlstar.learn_async(max_concurrency=4)
+            finally:
+                await server.stop()
+
+        nfa = asyncio.run(learn())
+
+        for s in ['', 'a', 'ab', 'aab', 'bababa', 'abaab']:
+            self.assertEqual(s.count('a') % 2 == 1, nfa.parse_string(s)[1])
+
+    def test_async_oracle_03(self):
+        lstar = algorithms.LSTAR({'a', 'b'}, oracle.ActiveOracle(self._odd_a_dfa()))
+
+        with self.assertRaises(TypeError):
+            asyncio.run(lstar.learn_async())
+
+    @staticmethod
+    def _odd_a_dfa() -> automaton.DFA:
+        q0, q1 = automaton.State('0'), automaton.State('1')
+        dfa = automaton.DFA({'a', 'b'}, q0)
+        dfa.states = {q0, q1}
+        dfa.accept_states.add(q1)
+        dfa.add_transition(q0, q1, 'a')
+        dfa.add_transition(q0, q0, 'b')
+        dfa.add_transition(q1, q0, 'a')
+        dfa.add_transition(q1, q1, 'b')
+
+        return dfa
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+from inferrer import automaton, algorithms, oracle
+from typing import List
+
+
+class CountingOracle(oracle.ActiveOracle):
+
+    def __init__(self, fsa: automaton.FSA):
+        super().__init__(fsa)
+        self.queries = []
+        self.batches = 0
+
+    def membership_query(self, s: str) -> bool:
+        self.queries.append(s)
+        return super().membership_query(s)
+
+    def membership_queries(self, strings: List[str]) -> List[bool]:
+        self.queries.extend(strings)
+        self.batches += 1
+        return super().membership_queries(strings)
+
+
+class TestCachingOracle(unittest.TestCase):
+
+    def test_caching_oracle_01(self):
+        teacher = CountingOracle(self._odd_a_dfa())
+        cache = oracle.CachingOracle(teacher)
+
+        dfa = algorithms.LSTAR({'a', 'b'}, cache).learn()
+
+        self.assertEqual(len(teacher.queries), len(set(teacher.queries)))
+        self.assertEqual(len(teacher.queries), cache.misses)
+        for s in ['', 'a', 'ab', 'aab', 'bababa']:
+            self.assertEqual(s.count('a') % 2 == 1, dfa.parse_string(s)[1])
+
+    def test_caching_oracle_02(self):
+        teacher = CountingOracle(self._odd_a_dfa())
+        cache = oracle.CachingOracle(teacher, max_size=2)
+
+        for s in ['a', 'b', 'a', 'ab', 'b']:
+            cache.membership_query(s)
+
+        self.assertListEqual(['a', 'b', 'ab', 'b'], teacher.queries)
+        self.assertEqual(1, cache.hits)
+        self.assertRaises(ValueError, oracle.CachingOracle, teacher, 0)
+
+    def test_caching_oracle_03(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'queries.sqlite')
+
+            teacher = CountingOracle(self._odd_a_dfa())
+            with oracle.CachingOracle(teacher, path=path) as cache:
+                self.assertTrue(cache.membership_query('ab'))
+                self.assertFalse(cache.membership_query('aa'))
+
+            teacher = CountingOracle(self._odd_a_dfa())
+            with oracle.CachingOracle(teacher, path=path) as cache:
+                self.assertTrue(cache.membership_query('ab'))
+                self.assertFalse(cache.membership_query('aa'))
+                self.assertFalse(cache.membership_query('b'))
+
+            self.assertListEqual(['b'], teacher.queries)
+            self.assertEqual(2, cache.hits)
+
+    def test_membership_queries_01(self):
+        dfa = self._odd_a_dfa()
+        strings = ['', 'a', 'ab', 'aab', 'bababa', 'c', 'ab']
+        expected = [dfa.parse_string(s)[1] for s in strings]
+
+        teacher = CountingOracle(dfa)
+        self.assertListEqual(expected, teacher.membership_queries(strings))
+
+        passive = oracle.PassiveOracle({'a', 'ab', 'bababa'}, {'', 'aab'})
+        self.assertListEqual([False, True, True, False, True, False, True],
+                             passive.membership_queries(strings))
+
+        cache = oracle.CachingOracle(teacher)
+        self.assertListEqual(expected, cache.membership_queries(strings))
+        self.assertListEqual(expected[1:3], cache.membership_queries(strings[1:3]))
+        self.assertEqual(6, cache.misses)
+        self.assertEqual(2, teacher.batches)
+
+    def test_membership_queries_02(self):
+        teacher = CountingOracle(self._odd_a_dfa())
+        dfa = algorithms.NLSTAR({'a', 'b'}, teacher).learn()
+
+        self.assertTrue(teacher.batches > 0)
+        for s in ['', 'a', 'ab', 'aab', 'bababa']:
+            self.assertEqual(s.count('a') % 2 == 1, dfa.parse_string(s)[1])
+
+    @staticmethod
+    def _odd_a_dfa() -> automaton.DFA:
+        q0 = automaton.State('0')
+        q1 = automaton.State('1')
+        dfa = automaton.DFA({'a', 'b'}, start_state=q0)
+
+        dfa.add_transition(q0, q1, 'a')
+        dfa.add_transition(q0, q0, 'b')
+        dfa.add_transition(q1, q0, 'a')
+        dfa.add_transition(q1, q1, 'b')
+        dfa.accept_states.add(q1)
+
+        return dfa
+
+
+if __name__ == '__main__':
+    unittest.main()
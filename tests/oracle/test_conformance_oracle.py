@@ -0,0 +1,77 @@
+import unittest
+from inferrer import automaton, algorithms, oracle
+
+
+class TestConformanceOracle(unittest.TestCase):
+
+    def test_conformance_oracle_01(self):
+        expected_dfa = self._substring_dfa()
+
+        for method in ['w', 'wp']:
+            teacher = oracle.ConformanceOracle(lambda s: expected_dfa.parse_string(s)[1],
+                                               {'0', '1'}, extra_states=3, method=method)
+            dfa = algorithms.LSTAR({'0', '1'}, teacher).learn()
+
+            self.assertTrue(dfa.is_equivalent(expected_dfa))
+
+    def test_conformance_oracle_02(self):
+        expected_dfa = self._substring_dfa()
+        queries = []
+
+        def membership(s: str) -> bool:
+            queries.append(s)
+            return expected_dfa.parse_string(s)[1]
+
+        teacher = oracle.ConformanceOracle(membership, {'0', '1'}, extra_states=2)
+
+        self.assertEqual(('', True), teacher.equivalence_query(expected_dfa))
+        self.assertEqual(len(queries), len(set(queries)))
+
+        q0 = automaton.State('0')
+        hypothesis = automaton.DFA({'0', '1'}, q0)
+        hypothesis.add_transition(q0, q0, '0')
+        hypothesis.add_transition(q0, q0, '1')
+
+        queries.clear()
+        word, satisfied = teacher.equivalence_query(hypothesis)
+
+        self.assertFalse(satisfied)
+        self.assertTrue(expected_dfa.parse_string(word)[1])
+        self.assertEqual(word, queries[-1])
+        self.assertEqual(len(queries), len(set(queries)))
+
+    def test_conformance_oracle_03(self):
+        with self.assertRaises(ValueError):
+            oracle.ConformanceOracle(lambda s: True, {'a'}, extra_states=-1)
+        with self.assertRaises(ValueError):
+            oracle.ConformanceOracle(lambda s: True, {'a'}, method='h')
+
+    @staticmethod
+    def _substring_dfa() -> automaton.DFA:
+        """
+        The dfa of the strings over {0, 1} that
+        contain 101 as a substring.
+        """
+        q0 = automaton.State('0')
+        q1 = automaton.State('1')
+        q2 = automaton.State('2')
+        q3 = automaton.State('3')
+
+        dfa = automaton.DFA({'0', '1'}, start_state=q0)
+
+        dfa.add_transition(q0, q0, '0')
+        dfa.add_transition(q0, q1, '1')
+        dfa.add_transition(q1, q2, '0')
+        dfa.add_transition(q1, q1, '1')
+        dfa.add_transition(q2, q0, '0')
+        dfa.add_transition(q2, q3, '1')
+        dfa.add_transition(q3, q3, '0')
+        dfa.add_transition(q3, q3, '1')
+
+        dfa.accept_states.add(q3)
+
+        return dfa
+
+
+if __name__ == '__main__':
+    unittest.main()
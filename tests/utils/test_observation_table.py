@@ -1,3 +1,4 @@
+import random
 import unittest
 from inferrer.utils import ObservationTable
 
@@ -33,6 +34,76 @@ class TestObservationTable(unittest.TestCase):
         except KeyError:
             self.assertTrue(True)
 
+    def test_ot_signatures_01(self):
+        ot = ObservationTable({'b'}, {'', 'a'}, {'a', 'b'})
+        ot.exp = {'', 'a'}
+        for r in ['', 'a', 'b', 'aa', 'ab']:
+            ot.add_row(r)
+
+        ot.put('', '', True)
+        ot.put('', 'a', False)
+        ot.put('a', '', True)
+        ot.put('a', 'a', False)
+        ot.put('b', '', 0)
+        ot.put('aa', '', 1)
+        ot.put('aa', 'a', 1)
+        ot.put('ab', '', 1)
+        ot.put('ab', 'a', 0)
+
+        self.assertEqual(ot.row_signature(''), ot.row_signature('a'))
+        self.assertNotEqual(ot.row_signature('a'), ot.row_signature('aa'))
+        self.assertEqual((0, 0), ot.row_signature('ba'))
+
+        self.assertEqual((False, 'b'), ot.is_closed())
+        self.assertIsNone(ot.find_compatible_row('b'))
+        self.assertEqual('', ot.find_compatible_row('ab') or '')
+
+        s1, s2, a, e = ot.find_inconsistency()
+        self.assertSetEqual({'', 'a'}, {s1, s2})
+        self.assertNotEqual(ot.get(s1 + a, e), ot.get(s2 + a, e))
+        self.assertFalse(ot.is_consistent())
+
+        ot.put('aa', 'a', 0)
+        copy = ot.copy()
+        copy.put('b', '', 1)
+        copy.put('b', 'a', 0)
+
+        self.assertEqual((True, True), copy.is_closed_and_consistent())
+        self.assertEqual((False, False), ot.is_closed_and_consistent())
+
+    def test_ot_incremental_01(self):
+        random.seed(1234)
+        alphabet = {'a', 'b'}
+        red, blue = {''}, set(alphabet)
+        ot = ObservationTable(blue, red, alphabet)
+        ot.exp = {''}
+
+        for _ in range(300):
+            op = random.random()
+            if op < 0.5:
+                r = random.choice(sorted(red | blue))
+                ot.put(r, random.choice(sorted(ot.exp)), random.choice([True, False, None]))
+            elif op < 0.7 and len(blue) > 0:
+                u = random.choice(sorted(blue))
+                blue.remove(u)
+                red.add(u)
+                for a in alphabet:
+                    if u + a not in red:
+                        blue.add(u + a)
+                        ot.add_row(u + a)
+            elif op < 0.8:
+                e = random.choice(sorted(red | blue))
+                ot.exp.add(e)
+                ot.add_column_to_table(e)
+
+            fresh = ot.copy()
+            self.assertEqual(fresh.is_closed()[0], ot.is_closed()[0])
+            self.assertEqual(fresh.is_consistent(), ot.is_consistent())
+
+            closed, u = ot.is_closed()
+            if not closed:
+                self.assertNotIn(ot.row_signature(u), {ot.row_signature(r) for r in red})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,7 @@
+import io
+import os
+import gzip
+import tempfile
 import unittest
 from inferrer import utils
 
@@ -85,6 +89,28 @@ class TestUtils(unittest.TestCase):
         }
         self.assertSetEqual(combinations, utils.break_strings_in_two(s))
 
+    def test_read_examples_01(self):
+        lines = ['ab', '', 'b' * 100, 'aab ', 'ab']
+
+        self.assertListEqual(['ab', '', 'b' * 100, 'aab', 'ab'],
+                             list(utils.read_examples(io.StringIO('\n'.join(lines)), 7)))
+        self.assertListEqual(['ab', 'ba'],
+                             list(utils.read_examples(io.BytesIO(b'ab\nba\n'), 1)))
+        self.assertListEqual(lines, list(utils.read_examples(iter(lines))))
+
+        with tempfile.TemporaryDirectory() as directory:
+            plain = os.path.join(directory, 'examples.txt')
+            with open(plain, 'w') as f:
+                f.write('\n'.join(lines) + '\n')
+
+            compressed = os.path.join(directory, 'examples.txt.gz')
+            with gzip.open(compressed, 'wt') as f:
+                f.write('\n'.join(lines) + '\n')
+
+            expected = ['ab', '', 'b' * 100, 'aab', 'ab']
+            self.assertListEqual(expected, list(utils.read_examples(plain, 3)))
+            self.assertListEqual(expected, list(utils.read_examples(compressed, 3)))
+
 
 if __name__ == '__main__':
     unittest.main()